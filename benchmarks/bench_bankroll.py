@@ -0,0 +1,31 @@
+"""Measures the throughput of batched bankroll sessions.
+
+Run from the project root:
+
+    python -m benchmarks.bench_bankroll
+"""
+
+from src.domain.GameRules import GameRules
+from src.application.compile_basic_strategy import CompileBasicStrategy
+from src.infrastructure.simulation.bankroll import BankrollSimulator, FlatBetting
+
+
+def main():
+    rules = GameRules()
+    chart = CompileBasicStrategy().execute(rules)
+    sessions, session_rounds = 100_000, 200
+    simulator = BankrollSimulator(
+        rules, chart, FlatBetting(rules.min_bet), starting_bankroll=20 * rules.min_bet,
+        session_rounds=session_rounds, lanes=sessions, seed=0,
+    )
+    results = simulator.run(sessions)
+    rounds = int(results.rounds_played.sum())
+    print(f"Sessions:          {results.sessions:>12,} x {session_rounds} rounds")
+    print(f"Risk of ruin:      {results.risk_of_ruin:>12.2%}")
+    print(f"Median bankroll:   {results.median_final_bankroll:>12,.0f}")
+    print(f"Drawdown p50/p99:  {' / '.join(f'{value:,.0f}' for value in results.drawdown_quantiles((0.5, 0.99))):>12}")
+    print(f"Throughput:        {rounds / results.elapsed_seconds:>12,.0f} rounds/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measures the throughput cost of periodic checkpoints.
+
+Run from the project root:
+
+    python -m benchmarks.bench_checkpoint
+"""
+
+import os
+import tempfile
+import time
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.checkpoint import DEFAULT_CHECKPOINT_EVERY, CheckpointedRun
+from src.infrastructure.simulation.parallel import run_parallel
+
+ROUNDS = 300_000
+
+
+def main():
+    rules = GameRules()
+    # Compile the chart before timing.
+    run_parallel(rules, 100, master_seed=0)
+
+    start = time.perf_counter()
+    plain = run_parallel(rules, ROUNDS, master_seed=1)
+    plain_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "run.ckpt")
+        run = CheckpointedRun(rules, ROUNDS, 1, path)
+        start = time.perf_counter()
+        checkpointed = run.run()
+        checkpointed_seconds = time.perf_counter() - start
+
+        # A checkpoint taken in the middle of a block also holds the generator and the shoe.
+        partial = CheckpointedRun(rules, ROUNDS, 1, path)
+        partial.run(max_rounds=1_234)
+        started = time.perf_counter()
+        for _ in range(100):
+            partial.save()
+        save_seconds = (time.perf_counter() - started) / 100
+        size = os.path.getsize(path)
+
+    assert (checkpointed.net, checkpointed.net_squared) == (plain.net, plain.net_squared)
+    per_round = plain_seconds / ROUNDS
+    print(f"Plain run:          {plain_seconds:8.2f} s")
+    print(f"Checkpointed run:   {checkpointed_seconds:8.2f} s (every {DEFAULT_CHECKPOINT_EVERY:,} rounds)")
+    print(f"One checkpoint:     {save_seconds * 1000:8.2f} ms, {size:,} bytes")
+    print(f"Checkpoint cost:    {save_seconds / (per_round * DEFAULT_CHECKPOINT_EVERY):8.3%} of throughput")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Measures the throughput of the card-counting simulator.
+
+Run from the project root:
+
+    python -m benchmarks.bench_counting
+"""
+
+import random
+from src.domain.GameRules import GameRules
+from src.application.compile_basic_strategy import CompileBasicStrategy
+from src.infrastructure.simulation.counting import BetSpread, CountingSimulator
+
+
+def main():
+    rules = GameRules()
+    chart = CompileBasicStrategy().execute(rules)
+    result = CountingSimulator(rules, chart, BetSpread(rules.min_bet), rng=random.Random(0)).run(500_000)
+    print(f"Hands:             {result.hands:>14,}")
+    print(f"Win rate:          {result.win_rate_per_100_hands:>14.3f} units per 100 hands")
+    print(f"Average bet:       {result.average_bet:>14.2f} units")
+    print(f"Throughput:        {result.hands_per_minute:>14,.0f} hands/min")
+    for true_count, stats in sorted(result.by_true_count.items()):
+        print(f"  TC {true_count:+3d}: {stats.mean:+.4f} ± {stats.half_width():.4f} ({stats.count:,} rounds)")
+
+
+if __name__ == "__main__":
+    main()
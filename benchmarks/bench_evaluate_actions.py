@@ -0,0 +1,46 @@
+"""Measures the latency of the action advisor with a cold and a warm cache.
+
+A cold call builds the dealer distributions and the player's EV table for the
+situation; a warm call for the same unseen cards only looks them up.
+
+Run from the project root:
+
+    python -m benchmarks.bench_evaluate_actions
+"""
+
+import random
+import timeit
+from src.application.evaluate_actions import EvaluateActions
+from src.domain.Card import Card
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+
+
+def deal_table() -> tuple:
+    """Builds a player-turn game with a pair of sevens against a dealer two."""
+    player = Player(balance=1000)
+    player.place_bet(10)
+    game = Game(players=[player], rules=GameRules(), rng=random.Random(0))
+    for card in (Card("Hearts", "7", 7), Card("Diamonds", "7", 7)):
+        player.hands[0].add_card(card)
+        game.deck.composition.remove(card.value)
+    for card in (Card("Clubs", "2", 2), Card("Spades", "4", 4)):
+        game.dealer.hands[0].add_card(card)
+        game.deck.composition.remove(card.value)
+    game.game_state = 'playerTurn'
+    return game, player
+
+
+def main():
+    game, player = deal_table()
+    repeat = 20
+    cold = timeit.timeit(lambda: EvaluateActions().execute(game, player), number=repeat) / repeat
+    advisor = EvaluateActions()
+    advisor.execute(game, player)
+    warm = timeit.timeit(lambda: advisor.execute(game, player), number=1000) / 1000
+    print(f"EvaluateActions: cold {cold * 1e3:8.2f} ms, warm {warm * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
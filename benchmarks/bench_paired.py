@@ -0,0 +1,32 @@
+"""Measures how many fewer rounds common random numbers need to separate two variants.
+
+Run from the project root:
+
+    python -m benchmarks.bench_paired
+"""
+
+from src.domain.GameRules import GameRules
+from src.application.compile_basic_strategy import CompileBasicStrategy
+from src.infrastructure.simulation.paired import PairedSimulator, Variant
+
+
+def main():
+    chart = CompileBasicStrategy().execute(GameRules())
+    variants = [
+        Variant('H17 3:2', GameRules(), chart),
+        Variant('H17 6:5', GameRules(blackjack_payout=1.2), chart),
+        Variant('S17 3:2', GameRules(dealer_hits_on_soft_17=False), CompileBasicStrategy().execute(GameRules(dealer_hits_on_soft_17=False))),
+    ]
+    comparison = PairedSimulator(variants, seed=0).run(1_000_000)
+    rounds = comparison.results[0].count
+    print(f"Rounds per variant: {rounds:,} in {comparison.elapsed_seconds:.1f}s")
+    for index in range(1, len(variants)):
+        low, high = comparison.difference_interval(index)
+        print(
+            f"{comparison.names[index]} - {comparison.names[0]}: {comparison.differences[index - 1].mean:+.4%}"
+            f" [{low:+.4%}, {high:+.4%}], variance reduction {comparison.variance_reduction(index):,.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
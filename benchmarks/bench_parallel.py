@@ -0,0 +1,29 @@
+"""Measures how simulation throughput scales with the number of worker processes.
+
+Run from the project root:
+
+    python -m benchmarks.bench_parallel
+"""
+
+import os
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.parallel import run_parallel
+
+
+def main():
+    rules = GameRules()
+    rounds_per_worker = 50_000
+    max_workers = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, max_workers} & set(range(1, max_workers + 1)))
+    baseline = None
+    for workers in worker_counts:
+        result = run_parallel(rules, rounds_per_worker * workers, master_seed=0, workers=workers, block_rounds=5_000)
+        baseline = baseline or result.hands_per_second
+        print(
+            f"{workers:>3} workers: {result.hands_per_second:>12,.0f} hands/s "
+            f"({result.hands_per_second / baseline:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measures round-start latency with the inline reshuffle and with a background shoe factory.
+
+Each round is started with `StartRound` and then cleared, with a short pause
+between rounds standing in for the rest of the round and the wait for the next
+request. The pause also gives the factory's worker thread the interpreter.
+
+Run from the project root:
+
+    python -m benchmarks.bench_round_start
+"""
+
+import random
+import time
+from src.application.reset_round import ResetRound
+from src.application.start_round import StartRound
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Deck import Deck
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.infrastructure.shoe_factory import BackgroundShoeFactory
+
+ROUNDS = 20_000
+PAUSE_SECONDS = 0.0002
+
+
+def percentile(samples, fraction: float) -> float:
+    """Returns the sample below which `fraction` of the sorted samples fall."""
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def measure(shoe_type, factory=None):
+    """Returns the sorted round-start latencies in microseconds."""
+    rules = GameRules(num_decks=8)
+    game = Game([Player(balance=10**9)], rules, deck=shoe_type(rules.num_decks, rng=random.Random(1)))
+    start_round, reset_round = StartRound(shoe_factory=factory), ResetRound()
+    latencies = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        start_round.execute(game)
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+        reset_round.execute(game)
+        time.sleep(PAUSE_SECONDS)
+    return sorted(latencies)
+
+
+def main():
+    print(f"{'shoe':10s} {'reshuffle':10s} {'p50':>8s} {'p99':>8s} {'p99.9':>8s} {'max':>8s}  (us)")
+    for shoe_type in (Deck, ArrayShoe):
+        inline = measure(shoe_type)
+        with BackgroundShoeFactory(8, rng=random.Random(2)) as factory:
+            prepared = measure(shoe_type, factory)
+        for name, latencies in (("inline", inline), ("background", prepared)):
+            print(
+                f"{shoe_type.__name__:10s} {name:10s} {percentile(latencies, 0.5):8.1f} "
+                f"{percentile(latencies, 0.99):8.1f} {percentile(latencies, 0.999):8.1f} {latencies[-1]:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compares dealing throughput of the list-backed Deck and the array-backed ArrayShoe.
+
+Also compares dealing the opening cards of a seven-seat table one at a time
+with dealing them in one `deal_many` call.
+
+Run from the project root:
+
+    python -m benchmarks.bench_shoe
+"""
+
+import timeit
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Deck import Deck
+
+
+def deal_shoe(shoe, penetration: float = 0.75):
+    """Deals cards until the penetration point, then reshuffles."""
+    for _ in range(int(shoe.total_cards * penetration)):
+        shoe.deal()
+    shoe.build_and_shuffle()
+
+
+def deal_openings(shoe, bulk: bool, seats: int = 7):
+    """Deals the opening cards of rounds until the penetration point, then reshuffles."""
+    cards = 2 * (seats + 1)
+    for _ in range(int(shoe.total_cards * 0.75) // cards):
+        if bulk:
+            shoe.deal_many(cards)
+        else:
+            for _ in range(cards):
+                shoe.deal()
+    shoe.build_and_shuffle()
+
+
+def main():
+    num_decks = 8
+    repeat = 200
+    for name, shoe in (("Deck", Deck(num_decks)), ("ArrayShoe", ArrayShoe(num_decks))):
+        seconds = timeit.timeit(lambda: deal_shoe(shoe), number=repeat)
+        cards = repeat * int(shoe.total_cards * 0.75)
+        print(f"{name:10s} {cards / seconds:>14,.0f} cards/s  ({seconds / repeat * 1e6:,.1f} us per shoe)")
+    for name, shoe in (("Deck", Deck(num_decks)), ("ArrayShoe", ArrayShoe(num_decks))):
+        for label, bulk in (("deal", False), ("deal_many", True)):
+            seconds = timeit.timeit(lambda: deal_openings(shoe, bulk), number=repeat)
+            print(f"{name:10s} {label:9s} openings: {seconds / repeat * 1e6:,.1f} us per shoe")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Compares generating shuffled shoes one Deck at a time with the vectorized batch generator.
+
+Run from the project root:
+
+    python -m benchmarks.bench_shoe_batch
+"""
+
+import time
+from src.domain.Deck import Deck
+from src.infrastructure.simulation.shoe_batch import generate_shoes
+
+
+def main():
+    n_shoes = 10_000
+    for num_decks in (6, 8):
+        start = time.perf_counter()
+        deck = Deck(num_decks)
+        for _ in range(n_shoes):
+            deck.build_and_shuffle()
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        generate_shoes(n_shoes, num_decks, seed=0)
+        batch_seconds = time.perf_counter() - start
+
+        print(
+            f"{num_decks} decks x {n_shoes:,} shoes: Deck loop {loop_seconds:.2f}s, "
+            f"batch {batch_seconds:.2f}s ({loop_seconds / batch_seconds:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
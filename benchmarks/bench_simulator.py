@@ -0,0 +1,38 @@
+"""Measures the throughput of the headless simulator and the lean round kernel.
+
+Run from the project root:
+
+    python -m benchmarks.bench_simulator
+"""
+
+import random
+import time
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.application.compile_basic_strategy import CompileBasicStrategy
+from src.infrastructure.simulation.round_kernel import LeanRoundKernel
+from src.infrastructure.simulation.simulator import Simulator
+from src.infrastructure.simulation.strategies import BasicStrategyPlayer
+
+
+def main():
+    rounds = 100_000
+    rules = GameRules()
+    chart = CompileBasicStrategy().execute(rules)
+    result = Simulator(rules, BasicStrategyPlayer(chart), rng=random.Random(0)).run(rounds)
+    print(f"GameController path: {result.hands_per_second:>12,.0f} hands/s")
+
+    game = Game([Player(balance=10**12)], rules, deck=ArrayShoe(rules.num_decks, rng=random.Random(0)))
+    kernel = LeanRoundKernel(game, chart, [rules.min_bet])
+    hands = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        kernel.play_round()
+        hands += kernel.num_hands[0]
+    print(f"Lean round kernel:   {hands / (time.perf_counter() - start):>12,.0f} hands/s")
+
+
+if __name__ == "__main__":
+    main()
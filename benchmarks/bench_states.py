@@ -0,0 +1,57 @@
+"""Measures action dispatch and the round loop with the integer-encoded states.
+
+Compares the string if/elif chain `PlayerAction` used to dispatch through with
+its lookup table keyed by `Action`, over the mix of actions basic strategy
+actually takes, and then times whole rounds through the `GameController` path.
+
+Run from the project root:
+
+    python -m benchmarks.bench_states
+"""
+
+import random
+import timeit
+from src.application.compile_basic_strategy import CompileBasicStrategy
+from src.application.player_action import PlayerAction
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.simulator import Simulator
+from src.infrastructure.simulation.strategies import BasicStrategyPlayer
+
+ROUNDS = 50_000
+
+
+def if_chain(action: str):
+    """The string dispatch `PlayerAction.execute` used before the lookup table."""
+    if action == 'hit':
+        return 0
+    elif action == 'stand':
+        return 1
+    elif action == 'doubleDown':
+        return 2
+    elif action == 'split':
+        return 3
+    raise ValueError(f"Invalid action: {action}")
+
+
+def main():
+    rules = GameRules()
+    chart = CompileBasicStrategy().execute(rules)
+    simulator = Simulator(rules, BasicStrategyPlayer(chart), rng=random.Random(0))
+    actions = []
+    for _ in range(2000):
+        simulator.play_round()
+        actions.extend(simulator.last_round_actions)
+
+    labels = [action.label for action in actions]
+    handlers = PlayerAction._HANDLERS
+    chain = timeit.timeit(lambda: [if_chain(label) for label in labels], number=200)
+    table = timeit.timeit(lambda: [handlers.get(action) for action in actions], number=200)
+    per_action = 1e9 / (200 * len(actions))
+    print(f"Action dispatch: if/elif chain {chain * per_action:6.1f} ns, lookup table {table * per_action:6.1f} ns")
+
+    result = Simulator(rules, BasicStrategyPlayer(chart), rng=random.Random(1)).run(ROUNDS)
+    print(f"GameController round loop: {result.hands_per_second:>10,.0f} hands/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Reports the effective-sample-size gain of each variance-reduction technique.
+
+Run from the project root:
+
+    python -m benchmarks.bench_variance_reduction
+"""
+
+from src.domain.GameRules import GameRules
+from src.application.compile_basic_strategy import CompileBasicStrategy
+from src.infrastructure.simulation.paired import PairedSimulator, Variant
+from src.infrastructure.simulation.variance_reduction import (
+    AntitheticSimulator,
+    Estimate,
+    ImportanceSampler,
+    control_variate_estimate,
+)
+
+
+def report(label: str, estimate: Estimate):
+    low, high = estimate.confidence_interval()
+    print(
+        f"{label:<34} {estimate.mean:+.6f} [{low:+.6f}, {high:+.6f}]"
+        f"  gain {estimate.efficiency_gain:>9,.1f}x  ESS {estimate.effective_sample_size:>15,.0f}"
+    )
+
+
+def main():
+    rules = GameRules()
+    chart = CompileBasicStrategy().execute(rules)
+
+    report("Antithetic EV per round", AntitheticSimulator(rules, chart, seed=0).estimate(2_000_000))
+
+    # The baseline's EV comes from a long antithetic run, standing in for a published figure.
+    baseline_ev = AntitheticSimulator(rules, chart, seed=1).estimate(8_000_000).mean
+    variants = [Variant('3:2', rules, chart), Variant('6:5', GameRules(blackjack_payout=1.2), chart)]
+    comparison = PairedSimulator(variants, seed=2).run(1_000_000)
+    report("6:5 EV, 3:2 as control variate", control_variate_estimate(comparison, 1, baseline_ev))
+
+    sampler = ImportanceSampler(rules, chart, bet=10, starting_bankroll=500, session_rounds=200, seed=3)
+    report("Ruin of 50 units in 200 rounds", sampler.estimate_ruin(200_000))
+    report("  plain Monte Carlo", sampler.estimate_ruin(200_000, tilt=0.0))
+    report("Drawdown of 60 units", sampler.estimate_drawdown(200_000, 600))
+    report("  plain Monte Carlo", sampler.estimate_drawdown(200_000, 600, tilt=0.0))
+
+
+if __name__ == "__main__":
+    main()
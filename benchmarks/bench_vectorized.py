@@ -0,0 +1,30 @@
+"""Compares the per-object simulator with the NumPy-vectorized simulator.
+
+Run from the project root:
+
+    python -m benchmarks.bench_vectorized
+"""
+
+import random
+from src.domain.GameRules import GameRules
+from src.application.compile_basic_strategy import CompileBasicStrategy
+from src.infrastructure.simulation.simulator import Simulator
+from src.infrastructure.simulation.strategies import BasicStrategyPlayer
+from src.infrastructure.simulation.vectorized import VectorizedSimulator
+
+
+def main():
+    rules = GameRules()
+    chart = CompileBasicStrategy().execute(rules)
+
+    reference = Simulator(rules, BasicStrategyPlayer(chart), rng=random.Random(0)).run(50_000)
+    print(f"GameController path: {reference.hands_per_second:>14,.0f} hands/s")
+
+    vectorized = VectorizedSimulator(rules, chart, seed=0).run(2_000_000)
+    print(f"Vectorized:          {vectorized.hands_per_second:>14,.0f} hands/s")
+    print(f"Speedup:             {vectorized.hands_per_second / reference.hands_per_second:>14,.1f}x")
+    print(f"House edge:          {vectorized.house_edge:>14.4%} +/- {vectorized.standard_error:.4%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""A compact, array-indexed basic-strategy chart."""
+
+from typing import Optional, Union
+from src.domain.GameState import Action
+
+# Action codes stored in the hard and soft tables.
+HIT = 0
+STAND = 1
+DOUBLE_OR_HIT = 2
+DOUBLE_OR_STAND = 3
+
+# The action each code calls for when doubling is allowed, and when it is not.
+# Enum member lookups are slow on Python 3.11, so `decide` only indexes these.
+DOUBLING_ACTIONS = (Action.HIT, Action.STAND, Action.DOUBLE_DOWN, Action.DOUBLE_DOWN)
+NON_DOUBLING_ACTIONS = (Action.HIT, Action.STAND, Action.HIT, Action.STAND)
+SPLIT_ACTION = Action.SPLIT
+STAND_ACTION = Action.STAND
+
+# Layout of the table: a hard and a soft section indexed by hand value (0 to 21),
+# then a pair section indexed by the value of the paired card (0 to 11). Each row
+# has one entry per dealer upcard value from 2 to 11. Pair entries are 1 when the
+# pair should be split and 0 when it should be played by its hard or soft total.
+UPCARDS = 10
+HARD_OFFSET = 0
+SOFT_OFFSET = 22 * UPCARDS
+PAIR_OFFSET = 44 * UPCARDS
+TABLE_SIZE = 56 * UPCARDS
+
+
+class BasicStrategy:
+    """A basic-strategy chart stored as a flat byte table.
+
+    Every decision is a single index into the table, so lookups cost the same
+    whether the table is a `bytes` object built in memory or a memory-mapped
+    file loaded by `StrategyStore`.
+
+    Attributes:
+        table (Union[bytes, bytearray, memoryview]): The flat table of `TABLE_SIZE` action codes.
+    """
+
+    def __init__(self, table: Union[bytes, bytearray, memoryview]):
+        """Initializes the chart.
+
+        Args:
+            table (Union[bytes, bytearray, memoryview]): The flat table of action codes.
+
+        Raises:
+            ValueError: If the table does not have the expected size.
+        """
+        if len(table) != TABLE_SIZE:
+            raise ValueError(f"A basic-strategy table must have {TABLE_SIZE} entries.")
+        self.table = table
+
+    def hard_action(self, total: int, upcard: int) -> int:
+        """Returns the action code for a hard total against a dealer upcard value."""
+        return self.table[HARD_OFFSET + total * UPCARDS + upcard - 2]
+
+    def soft_action(self, total: int, upcard: int) -> int:
+        """Returns the action code for a soft total against a dealer upcard value."""
+        return self.table[SOFT_OFFSET + total * UPCARDS + upcard - 2]
+
+    def should_split(self, card_value: int, upcard: int) -> bool:
+        """Returns True if a pair of the given card value should be split."""
+        return self.table[PAIR_OFFSET + card_value * UPCARDS + upcard - 2] == 1
+
+    def decide(
+        self,
+        total: int,
+        is_soft: bool,
+        upcard: int,
+        pair_value: Optional[int] = None,
+        can_double: bool = True,
+        can_split: bool = True,
+    ) -> Action:
+        """Returns the basic-strategy action for a hand.
+
+        Args:
+            total (int): The value of the hand.
+            is_soft (bool): True if the hand counts an Ace as 11.
+            upcard (int): The value of the dealer's upcard (2 to 11).
+            pair_value (Optional[int]): The card value if the hand is a splittable pair.
+            can_double (bool): True if doubling down is allowed for this hand.
+            can_split (bool): True if splitting is allowed for this hand.
+
+        Returns:
+            Action: The action to take.
+        """
+        if pair_value is not None and can_split and self.should_split(pair_value, upcard):
+            return SPLIT_ACTION
+        if total >= 21:
+            return STAND_ACTION
+        code = self.soft_action(total, upcard) if is_soft else self.hard_action(total, upcard)
+        return (DOUBLING_ACTIONS if can_double else NON_DOUBLING_ACTIONS)[code]
@@ -0,0 +1,92 @@
+"""Computes the optimal basic-strategy chart for a set of game rules."""
+
+from typing import Optional
+from src.application.basic_strategy import (
+    BasicStrategy,
+    HIT,
+    STAND,
+    DOUBLE_OR_HIT,
+    DOUBLE_OR_STAND,
+    UPCARDS,
+    HARD_OFFSET,
+    SOFT_OFFSET,
+    PAIR_OFFSET,
+    TABLE_SIZE,
+)
+from src.application.dealer_probabilities import DealerProbabilities
+from src.application.evaluate_actions import PlayerEvTable
+from src.domain.GameRules import GameRules
+from src.domain.ShoeComposition import ShoeComposition
+
+# Identifies the logic that builds the charts. Bump it whenever a change here, or in
+# the engines this use case relies on, can change a compiled chart, so that charts
+# cached on disk by earlier versions are compiled again.
+COMPILER_VERSION = 1
+
+
+class CompileBasicStrategy:
+    """A use case that builds the hard, soft and pair tables for every dealer upcard.
+
+    For each upcard, the player's expected values are computed against a full shoe
+    of `rules.num_decks` decks with only the upcard removed, using the same
+    `PlayerEvTable` as the in-game advisor. Each cell holds the action with the
+    highest expected value; double-down cells also record whether to hit or
+    stand when doubling is not allowed.
+    """
+
+    def __init__(self, dealer_probabilities: Optional[DealerProbabilities] = None):
+        """Initializes the use case.
+
+        Args:
+            dealer_probabilities (Optional[DealerProbabilities]): The engine used for
+                the dealer's distribution. Defaults to a new engine.
+        """
+        self.dealer_probabilities = dealer_probabilities or DealerProbabilities()
+
+    def execute(self, rules: GameRules) -> BasicStrategy:
+        """Compiles the basic-strategy chart for the given rules.
+
+        Args:
+            rules (GameRules): The rules the chart is computed for.
+
+        Returns:
+            BasicStrategy: The compiled chart.
+        """
+        table = bytearray(TABLE_SIZE)
+        full_shoe = ShoeComposition(rules.num_decks).counts
+
+        for upcard in range(2, 12):
+            unseen = list(full_shoe)
+            unseen[upcard - 2] -= 1
+            dealer = self.dealer_probabilities.distribution(upcard, rules.dealer_hits_on_soft_17, unseen)
+            evs = PlayerEvTable(unseen, dealer, rules.blackjack_payout)
+            column = upcard - 2
+
+            for total in range(4, 22):
+                table[HARD_OFFSET + total * UPCARDS + column] = _best_action(evs, total, False)
+            for total in range(12, 22):
+                table[SOFT_OFFSET + total * UPCARDS + column] = _best_action(evs, total - 10, True)
+            for card_value in range(2, 12):
+                hard = 2 if card_value == 11 else 2 * card_value
+                played = _best_ev(evs, hard, card_value == 11)
+                split = evs.split(card_value, can_double=True)
+                table[PAIR_OFFSET + card_value * UPCARDS + column] = 1 if split > played else 0
+
+        return BasicStrategy(bytes(table))
+
+
+def _best_action(evs: PlayerEvTable, hard: int, has_ace: bool) -> int:
+    """Returns the best action code for a two-card hand."""
+    value = hard + 10 if has_ace and hard <= 11 else hard
+    hit = evs.hit(hard, has_ace)
+    stand = evs.stand(value)
+    fallback = HIT if hit > stand else STAND
+    if evs.double(hard, has_ace) > max(hit, stand):
+        return DOUBLE_OR_HIT if fallback == HIT else DOUBLE_OR_STAND
+    return fallback
+
+
+def _best_ev(evs: PlayerEvTable, hard: int, has_ace: bool) -> float:
+    """Returns the expected value of the best non-split play of a two-card hand."""
+    value = hard + 10 if has_ace and hard <= 11 else hard
+    return max(evs.hit(hard, has_ace), evs.stand(value), evs.double(hard, has_ace))
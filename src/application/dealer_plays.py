@@ -1,6 +1,13 @@
 """Handles the dealer's turn in a Blackjack game."""
 
 from src.domain.Game import Game
+from src.domain.GameState import GameState, HandStatus
+
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+BUSTED = HandStatus.BUSTED
+STAND = HandStatus.STAND
+DEALER_TURN = GameState.DEALER_TURN
+ROUND_OVER = GameState.ROUND_OVER
 
 
 class DealerPlays:
@@ -19,25 +26,25 @@ class DealerPlays:
         Raises:
             ValueError: If the game state is not 'dealerTurn'.
         """
-        if game.game_state != 'dealerTurn':
+        if game.game_state is not DEALER_TURN:
             raise ValueError("Not the dealer's turn.")
 
-        dealer = game.dealer
+        dealer_hand = game.dealer.hands[0]
         rules = game.rules
 
         # Dealer hits until 17 or more
-        while dealer.hands[0].get_value() < 17:
-            dealer.hands[0].add_card(game.deck.deal())
+        while dealer_hand.value < 17:
+            dealer_hand.add_card(game.deck.deal())
 
         # Handle soft 17 rule
-        is_soft_17 = dealer.hands[0].get_value() == 17 and any(card.rank == 'Ace' for card in dealer.hands[0].cards)
+        is_soft_17 = dealer_hand.value == 17 and dealer_hand.is_soft
         if is_soft_17 and rules.dealer_hits_on_soft_17:
-            dealer.hands[0].add_card(game.deck.deal())
+            dealer_hand.add_card(game.deck.deal())
 
         # Set dealer hand status
-        if dealer.hands[0].get_value() > 21:
-            dealer.hands[0].status = 'busted'
+        if dealer_hand.value > 21:
+            dealer_hand.status = BUSTED
         else:
-            dealer.hands[0].status = 'stand'
-            
-        game.game_state = 'roundOver'
+            dealer_hand.status = STAND
+
+        game.transition_to(ROUND_OVER)
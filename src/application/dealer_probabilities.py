@@ -0,0 +1,268 @@
+"""Computes the exact distribution of the dealer's final hand."""
+
+import functools
+from typing import Dict, Optional, Sequence, Tuple
+
+# A distribution is a tuple indexed by the dealer's final total (0 to 21), with two
+# extra slots for a bust and for a two-card 21.
+BUST = 22
+BLACKJACK = 23
+OUTCOME_SLOTS = 24
+
+# Probability of drawing each value from 2 to 11 (Ace) from an infinite deck.
+INFINITE_DECK_PROBABILITIES: Tuple[float, ...] = (1 / 13,) * 8 + (4 / 13, 1 / 13)
+
+# A draw table lists every multiset of cards the dealer can draw before stopping, as
+# `((value index, count), ...)` pairs, with its number of cards, the final slot and
+# the number of orders the dealer can draw it in.
+DrawTable = Tuple[Tuple[Tuple[Tuple[int, int], ...], int, int, int], ...]
+
+
+class DealerProbabilities:
+    """An engine for the probability of each final dealer result given the upcard.
+
+    The dealer draws exactly as `DealerPlays.execute` does: hit below 17, then, if
+    the rules say to hit soft 17 and the hand is a soft 17, take exactly one more
+    card and stop, even if that leaves the hand below 17. Because of that last
+    rule, final totals from 12 to 16 can have non-zero probability.
+
+    The cards the dealer may draw before stopping depend only on the upcard and
+    the soft-17 rule, never on the shoe. They are kept in a draw table shared by
+    every engine and every round. A finite-shoe distribution then weighs each
+    drawable multiset of cards by its probability under the composition. Every
+    order of the same multiset is equally likely, so no recursion over the shoe
+    is needed.
+
+    Distributions are also memoized in a bounded LRU cache keyed on the upcard,
+    the exact shoe composition and the soft-17 rule, so repeated queries for the
+    same situation (several decisions in a round) return the same tuple.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        """Initializes the engine.
+
+        Args:
+            cache_size (int): The maximum number of distributions kept in the cache.
+        """
+        self._cached_distribution = functools.lru_cache(maxsize=cache_size)(self._compute)
+
+    def distribution(
+        self,
+        upcard: int,
+        hits_soft_17: bool,
+        composition: Optional[Sequence[int]] = None,
+    ) -> Tuple[float, ...]:
+        """Returns the distribution of the dealer's final result.
+
+        Args:
+            upcard (int): The game value of the dealer's upcard (2 to 11).
+            hits_soft_17 (bool): True if the dealer hits on a soft 17.
+            composition (Optional[Sequence[int]]): The cards the dealer draws from,
+                as counts per value from 2 to 11 indexed by `value - 2` (the layout
+                of `ShoeComposition.counts`), with the upcard already removed.
+                None means an infinite deck.
+
+        Returns:
+            Tuple[float, ...]: Probabilities indexed by final total, `BUST` and `BLACKJACK`.
+        """
+        counts = tuple(composition) if composition is not None else None
+        return self._cached_distribution(upcard, hits_soft_17, counts)
+
+    def cache_info(self):
+        """Returns the hit and miss statistics of the distribution cache."""
+        return self._cached_distribution.cache_info()
+
+    def cache_clear(self):
+        """Empties the distribution cache."""
+        self._cached_distribution.cache_clear()
+
+    @staticmethod
+    def draw_table_info():
+        """Returns the hit and miss statistics of the draw tables shared across rounds."""
+        return _draw_table.cache_info()
+
+    def _compute(self, upcard: int, hits_soft_17: bool, counts: Optional[Tuple[int, ...]]) -> Tuple[float, ...]:
+        """Computes a distribution that is not in the cache."""
+        hard = 1 if upcard == 11 else upcard
+        memo: Dict[tuple, Tuple[float, ...]] = {}
+        if counts is None:
+            return self._infinite(hard, upcard == 11, 1, False, hits_soft_17, memo)
+        draws, max_draws = _draw_table(upcard, hits_soft_17)
+        if sum(counts) < max_draws:
+            # The shoe could run out mid-hand, which only the recursion handles.
+            return self._finite(hard, upcard == 11, 1, False, counts, hits_soft_17, memo)
+        return _weigh(draws, max_draws, counts)
+
+    def _infinite(self, hard, has_ace, num_cards, drew_on_soft_17, hits_soft_17, memo):
+        """Recursively computes the distribution when every draw has fixed probabilities."""
+        key = (hard, has_ace, num_cards, drew_on_soft_17)
+        result = memo.get(key)
+        if result is not None:
+            return result
+
+        must_draw, next_flag = _next_step(hard, has_ace, drew_on_soft_17, hits_soft_17)
+        if not must_draw:
+            result = _final(hard, has_ace, num_cards)
+        else:
+            outcome = [0.0] * OUTCOME_SLOTS
+            for index, probability in enumerate(INFINITE_DECK_PROBABILITIES):
+                value = index + 2
+                sub = self._infinite(
+                    hard + (1 if value == 11 else value),
+                    has_ace or value == 11,
+                    min(num_cards + 1, 3),
+                    next_flag,
+                    hits_soft_17,
+                    memo,
+                )
+                for slot in range(12, OUTCOME_SLOTS):
+                    outcome[slot] += probability * sub[slot]
+            result = tuple(outcome)
+
+        memo[key] = result
+        return result
+
+    def _finite(self, hard, has_ace, num_cards, drew_on_soft_17, counts, hits_soft_17, memo):
+        """Recursively computes the distribution while removing drawn cards from the shoe."""
+        key = (hard, has_ace, num_cards, drew_on_soft_17, counts)
+        result = memo.get(key)
+        if result is not None:
+            return result
+
+        must_draw, next_flag = _next_step(hard, has_ace, drew_on_soft_17, hits_soft_17)
+        total_cards = sum(counts)
+        if not must_draw:
+            result = _final(hard, has_ace, num_cards)
+        elif total_cards == 0:
+            # The shoe would be rebuilt mid-hand; approximate the fresh shoe as infinite.
+            result = self._infinite(hard, has_ace, num_cards, drew_on_soft_17, hits_soft_17, {})
+        else:
+            outcome = [0.0] * OUTCOME_SLOTS
+            remaining = list(counts)
+            for index, count in enumerate(counts):
+                if not count:
+                    continue
+                value = index + 2
+                remaining[index] -= 1
+                sub = self._finite(
+                    hard + (1 if value == 11 else value),
+                    has_ace or value == 11,
+                    min(num_cards + 1, 3),
+                    next_flag,
+                    tuple(remaining),
+                    hits_soft_17,
+                    memo,
+                )
+                remaining[index] += 1
+                probability = count / total_cards
+                for slot in range(12, OUTCOME_SLOTS):
+                    outcome[slot] += probability * sub[slot]
+            result = tuple(outcome)
+
+        memo[key] = result
+        return result
+
+
+@functools.lru_cache(maxsize=None)
+def _draw_table(upcard: int, hits_soft_17: bool) -> Tuple[DrawTable, int]:
+    """Lists every multiset of cards the dealer can draw to a given upcard.
+
+    Returns:
+        Tuple[DrawTable, int]: The draw table and the most cards any entry draws.
+    """
+    draws = _draws_from(1 if upcard == 11 else upcard, upcard == 11, 1, False, hits_soft_17, {})
+    table = tuple(
+        (tuple((index, count) for index, count in enumerate(drawn) if count), sum(drawn), slot, orders)
+        for drawn, (slot, orders) in draws.items()
+    )
+    return table, max(num_drawn for _, num_drawn, _, _ in table)
+
+
+def _draws_from(hard, has_ace, num_cards, drew_on_soft_17, hits_soft_17, memo):
+    """Maps each multiset the dealer can draw to a hand, as counts per value, to its final slot and number of orders."""
+    key = (hard, has_ace, num_cards, drew_on_soft_17)
+    result = memo.get(key)
+    if result is not None:
+        return result
+
+    must_draw, next_flag = _next_step(hard, has_ace, drew_on_soft_17, hits_soft_17)
+    if not must_draw:
+        result = {(0,) * 10: (_final(hard, has_ace, num_cards).index(1.0), 1)}
+    else:
+        result = {}
+        for index in range(10):
+            value = index + 2
+            sub = _draws_from(
+                hard + (1 if value == 11 else value),
+                has_ace or value == 11,
+                min(num_cards + 1, 3),
+                next_flag,
+                hits_soft_17,
+                memo,
+            )
+            for drawn, (slot, orders) in sub.items():
+                drawn = drawn[:index] + (drawn[index] + 1,) + drawn[index + 1:]
+                # A multiset always ends on the same slot, whatever order it is drawn in.
+                previous = result.get(drawn)
+                result[drawn] = (slot, orders + previous[1] if previous else orders)
+
+    memo[key] = result
+    return result
+
+
+def _weigh(draws: DrawTable, max_draws: int, counts: Tuple[int, ...]) -> Tuple[float, ...]:
+    """Returns the distribution of a draw table for a shoe of at least `max_draws` cards.
+
+    A given order of k cards, with k_v of each value v, is drawn with probability
+    prod(C_v * (C_v - 1) * ... * (C_v - k_v + 1)) / (N * (N - 1) * ... * (N - k + 1)),
+    which is the same for every order of the multiset.
+    """
+    falling = []
+    for count in counts:
+        row = [1.0]
+        for drawn in range(max_draws):
+            row.append(row[-1] * max(count - drawn, 0))
+        falling.append(row)
+    total_cards = sum(counts)
+    total_falling = [1.0]
+    for drawn in range(max_draws):
+        total_falling.append(total_falling[-1] * (total_cards - drawn))
+
+    outcome = [0.0] * OUTCOME_SLOTS
+    for pairs, num_drawn, slot, orders in draws:
+        probability = orders / total_falling[num_drawn]
+        for index, count in pairs:
+            probability *= falling[index][count]
+        outcome[slot] += probability
+    return tuple(outcome)
+
+
+def _next_step(hard: int, has_ace: bool, drew_on_soft_17: bool, hits_soft_17: bool) -> Tuple[bool, bool]:
+    """Applies the `DealerPlays` drawing rule to a hand.
+
+    Returns:
+        Tuple[bool, bool]: Whether the dealer draws, and whether that draw is the
+        single extra card taken on a soft 17.
+    """
+    if drew_on_soft_17:
+        return False, True
+    is_soft = has_ace and hard <= 11
+    value = hard + 10 if is_soft else hard
+    if value < 17:
+        return True, False
+    if value == 17 and is_soft and hits_soft_17:
+        return True, True
+    return False, False
+
+
+def _final(hard: int, has_ace: bool, num_cards: int) -> Tuple[float, ...]:
+    """Returns the certain distribution of a hand the dealer stands on."""
+    value = hard + 10 if has_ace and hard <= 11 else hard
+    outcome = [0.0] * OUTCOME_SLOTS
+    if value > 21:
+        outcome[BUST] = 1.0
+    elif value == 21 and num_cards == 2:
+        outcome[BLACKJACK] = 1.0
+    else:
+        outcome[value] = 1.0
+    return tuple(outcome)
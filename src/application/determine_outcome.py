@@ -1,6 +1,14 @@
 """Determines the outcome of a Blackjack round for all players."""
 
 from src.domain.Game import Game
+from src.domain.GameState import GameState, HandStatus
+
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+BUSTED = HandStatus.BUSTED
+WIN = HandStatus.WIN
+LOSE = HandStatus.LOSE
+PUSH = HandStatus.PUSH
+ROUND_OVER = GameState.ROUND_OVER
 
 
 class DetermineOutcome:
@@ -19,42 +27,42 @@ class DetermineOutcome:
         Raises:
             ValueError: If the game state is not 'roundOver'.
         """
-        if game.game_state != 'roundOver':
+        if game.game_state is not ROUND_OVER:
             raise ValueError("Can only determine outcome in 'roundOver' state.")
 
         dealer_hand = game.dealer.hands[0]
-        dealer_value = dealer_hand.get_value()
-        dealer_busted = dealer_hand.status == 'busted'
-        dealer_has_blackjack = dealer_value == 21 and len(dealer_hand.cards) == 2
+        dealer_value = dealer_hand.value
+        dealer_busted = dealer_hand.status is BUSTED
+        dealer_has_blackjack = dealer_hand.is_blackjack
 
         for player in game.players:
             # Iterate through all hands of the player
             for i, player_hand in enumerate(player.hands):
                 player_bet = player.bets[i]
 
-                if player_hand.status == 'busted':
+                if player_hand.status is BUSTED:
                     # Balance already deducted when bet was placed. No change needed here.
                     continue
 
-                player_value = player_hand.get_value()
-                player_has_blackjack = player_value == 21 and len(player_hand.cards) == 2
+                player_value = player_hand.value
+                player_has_blackjack = player_hand.is_blackjack
 
                 if dealer_busted:
                     if player_has_blackjack:
                         player.balance += player_bet + int(player_bet * game.rules.blackjack_payout)
-                        player_hand.status = 'win'
+                        player_hand.status = WIN
                     else:
                         player.balance += player_bet * 2  # Player gets back bet + wins bet
-                        player_hand.status = 'win'
+                        player_hand.status = WIN
                 elif player_has_blackjack and not dealer_has_blackjack:
                     player.balance += player_bet + int(player_bet * game.rules.blackjack_payout)
-                    player_hand.status = 'win'
+                    player_hand.status = WIN
                 elif player_value > dealer_value:
                     player.balance += player_bet * 2  # Player gets back bet + wins bet
-                    player_hand.status = 'win'
+                    player_hand.status = WIN
                 elif player_value < dealer_value:
                     # Balance already deducted. No change needed.
-                    player_hand.status = 'lose'
+                    player_hand.status = LOSE
                 else:  # Push
                     player.balance += player_bet  # Player gets back original bet
-                    player_hand.status = 'push'
+                    player_hand.status = PUSH
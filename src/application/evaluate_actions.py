@@ -0,0 +1,204 @@
+"""Estimates the expected value of each legal action for a player's current hand."""
+
+import functools
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.application.dealer_probabilities import DealerProbabilities, BUST, BLACKJACK
+from src.domain.Game import Game
+from src.domain.GameState import GameState, HandStatus
+from src.domain.Hand import Hand
+from src.domain.Player import Player
+
+
+class EvaluateActions:
+    """A use case that returns the expected value of hit, stand, double down and split.
+
+    The estimate is composition dependent: it uses the cards the player has not
+    seen (the remaining shoe plus the dealer's hole card) and the live game rules.
+    The dealer's final distribution comes from `DealerProbabilities` for that
+    composition. The player's later draws use the same composition, without
+    removing the cards they draw, and split hands are played out once, without
+    resplitting.
+
+    Expected values are returned in units of the current hand's bet, so 0.1
+    means the action wins a tenth of the bet on average and a double down's
+    value already accounts for the doubled stake.
+
+    The player's EV tables are cached per exact composition, which answers repeated
+    decisions within a round. The dealer's draw tables depend only on the upcard
+    and the soft-17 rule, so `DealerProbabilities` shares them across rounds and
+    only reweighs them for each new shoe composition.
+    """
+
+    def __init__(self, dealer_probabilities: Optional[DealerProbabilities] = None, cache_size: int = 256):
+        """Initializes the use case.
+
+        Args:
+            dealer_probabilities (Optional[DealerProbabilities]): The engine used for
+                the dealer's distribution. Defaults to a new engine.
+            cache_size (int): The maximum number of player EV tables kept in the cache.
+        """
+        self.dealer_probabilities = dealer_probabilities or DealerProbabilities()
+        self._cached_table = functools.lru_cache(maxsize=cache_size)(self._build_table)
+
+    def execute(self, game: Game, player: Player) -> Dict[str, float]:
+        """Evaluates the legal actions for the player's current hand.
+
+        Args:
+            game (Game): The current game instance.
+            player (Player): The player whose current hand is evaluated.
+
+        Returns:
+            Dict[str, float]: The expected value of each legal action, keyed by the
+            action names accepted by `PlayerAction`.
+
+        Raises:
+            ValueError: If it is not the player's turn or the current hand is finished.
+        """
+        if game.game_state is not GameState.PLAYER_TURN:
+            raise ValueError("Not the player's turn.")
+
+        hand = player.get_current_hand()
+        if hand.status is not HandStatus.PLAYING:
+            raise ValueError("The current hand is not being played.")
+
+        bet = player.get_current_bet()
+        table = self._table_for(game, bet)
+
+        evs = {
+            'hit': table.hit(_hard_total(hand), hand.is_soft),
+            'stand': table.stand(hand.value, hand.is_blackjack),
+        }
+        if len(hand.cards) == 2 and player.balance >= bet:
+            evs['doubleDown'] = table.double(_hard_total(hand), hand.is_soft)
+            if hand.is_pair:
+                evs['split'] = table.split(hand.cards[0].value, can_double=player.balance >= 2 * bet)
+        return evs
+
+    def cache_info(self):
+        """Returns the hit and miss statistics of the player EV table cache."""
+        return self._cached_table.cache_info()
+
+    def _table_for(self, game: Game, bet: int) -> 'PlayerEvTable':
+        """Returns the cached EV table for the unseen cards and rules of the game."""
+        dealer_hand = game.dealer.hands[0]
+        upcard = dealer_hand.cards[0].value
+        unseen = list(game.deck.composition.counts)
+        for hidden in dealer_hand.cards[1:]:
+            unseen[hidden.value - 2] += 1
+        blackjack_payout = int(bet * game.rules.blackjack_payout) / bet if bet else game.rules.blackjack_payout
+        return self._cached_table(upcard, tuple(unseen), game.rules.dealer_hits_on_soft_17, blackjack_payout)
+
+    def _build_table(
+        self,
+        upcard: int,
+        unseen: Tuple[int, ...],
+        hits_soft_17: bool,
+        blackjack_payout: float,
+    ) -> 'PlayerEvTable':
+        """Builds the EV table for one situation; wrapped by the LRU cache."""
+        dealer = self.dealer_probabilities.distribution(upcard, hits_soft_17, unseen)
+        return PlayerEvTable(unseen, dealer, blackjack_payout)
+
+
+class PlayerEvTable:
+    """Memoized player expected values against a fixed dealer distribution.
+
+    Player hands are identified by their hard total (every Ace as 1) and whether
+    they hold an Ace.
+    """
+
+    def __init__(self, unseen: Sequence[int], dealer: Sequence[float], blackjack_payout: float):
+        """Precomputes draw probabilities and the stand value of every total.
+
+        Args:
+            unseen (Sequence[int]): The cards the player may draw, as counts per value
+                from 2 to 11 indexed by `value - 2`.
+            dealer (Sequence[float]): The dealer's distribution from `DealerProbabilities`.
+            blackjack_payout (float): The amount a player blackjack wins per unit bet.
+        """
+        total_cards = sum(unseen)
+        self.draw_probabilities = [count / total_cards for count in unseen] if total_cards else [0.0] * 10
+        self.dealer_blackjack = dealer[BLACKJACK]
+        self.blackjack_payout = blackjack_payout
+
+        # A dealer two-card 21 is compared as a plain 21 against every player hand but a blackjack.
+        by_total = list(dealer[:22])
+        by_total[21] += dealer[BLACKJACK]
+        self._stand_by_total: List[float] = []
+        below = 0.0
+        for total in range(22):
+            above = 1.0 - dealer[BUST] - below - by_total[total]
+            self._stand_by_total.append(dealer[BUST] + below - above)
+            below += by_total[total]
+        self._hit_memo: Dict[Tuple[int, bool], float] = {}
+
+    def stand(self, value: int, is_blackjack: bool = False) -> float:
+        """Returns the expected value of standing on a hand value."""
+        if is_blackjack:
+            return (1.0 - self.dealer_blackjack) * self.blackjack_payout
+        if value > 21:
+            return -1.0
+        return self._stand_by_total[value]
+
+    def hit(self, hard: int, has_ace: bool) -> float:
+        """Returns the expected value of hitting and then playing optimally."""
+        key = (hard, has_ace)
+        result = self._hit_memo.get(key)
+        if result is None:
+            result = 0.0
+            for index, probability in enumerate(self.draw_probabilities):
+                if probability:
+                    result += probability * self._best(*_add(hard, has_ace, index + 2))
+            self._hit_memo[key] = result
+        return result
+
+    def double(self, hard: int, has_ace: bool) -> float:
+        """Returns the expected value of doubling, in units of the original bet."""
+        result = 0.0
+        for index, probability in enumerate(self.draw_probabilities):
+            if probability:
+                new_hard, new_ace = _add(hard, has_ace, index + 2)
+                result += probability * self.stand(_value(new_hard, new_ace))
+        return 2.0 * result
+
+    def split(self, card_value: int, can_double: bool) -> float:
+        """Returns the expected value of splitting a pair, in units of one hand's bet."""
+        hard, has_ace = _add(0, False, card_value)
+        result = 0.0
+        for index, probability in enumerate(self.draw_probabilities):
+            if not probability:
+                continue
+            new_hard, new_ace = _add(hard, has_ace, index + 2)
+            value = _value(new_hard, new_ace)
+            # Two-card 21s on split hands are settled as blackjacks by DetermineOutcome.
+            best = max(self.stand(value, is_blackjack=value == 21), self.hit(new_hard, new_ace))
+            if can_double:
+                best = max(best, self.double(new_hard, new_ace))
+            result += probability * best
+        return 2.0 * result
+
+    def _best(self, hard: int, has_ace: bool) -> float:
+        """Returns the value of the better of standing and hitting on a multi-card hand."""
+        value = _value(hard, has_ace)
+        if value > 21:
+            return -1.0
+        if value == 21:
+            return self.stand(value)
+        return max(self.stand(value), self.hit(hard, has_ace))
+
+
+def _add(hard: int, has_ace: bool, card_value: int) -> Tuple[int, bool]:
+    """Adds a card to a hand given by its hard total and Ace flag."""
+    if card_value == 11:
+        return hard + 1, True
+    return hard + card_value, has_ace
+
+
+def _value(hard: int, has_ace: bool) -> int:
+    """Returns the value of a hand given by its hard total and Ace flag."""
+    return hard + 10 if has_ace and hard <= 11 else hard
+
+
+def _hard_total(hand: Hand) -> int:
+    """Returns the hard total of a hand (every Ace counted as 1)."""
+    return hand.value - 10 if hand.is_soft else hand.value
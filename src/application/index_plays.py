@@ -0,0 +1,110 @@
+"""Count-dependent deviations from a basic-strategy chart."""
+
+import dataclasses
+import math
+from typing import Sequence, Tuple
+from src.application.basic_strategy import (
+    BasicStrategy,
+    HIT,
+    STAND,
+    DOUBLE_OR_HIT,
+    UPCARDS,
+    HARD_OFFSET,
+    SOFT_OFFSET,
+    PAIR_OFFSET,
+)
+
+# True counts are bucketed by their floor and clamped to this range.
+MAX_TRUE_COUNT = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class IndexPlay:
+    """A chart cell that changes once the true count crosses an index.
+
+    Attributes:
+        section (str): 'hard', 'soft' or 'pair'.
+        total (int): The hand value, or the card value for pairs.
+        upcard (int): The dealer upcard value (2 to 11).
+        index (int): The true count at which the deviation starts to apply.
+        action (int): The action code to play instead (1 or 0 to split or not, for pairs).
+        at_or_above (bool): True if the deviation applies at `index` and above, False
+            if it applies below `index`.
+    """
+
+    section: str
+    total: int
+    upcard: int
+    index: int
+    action: int
+    at_or_above: bool = True
+
+    def applies(self, true_count: int) -> bool:
+        """Returns True if the deviation applies at a floored true count."""
+        return true_count >= self.index if self.at_or_above else true_count < self.index
+
+    @property
+    def offset(self) -> int:
+        """The position of the deviated cell in a basic-strategy table."""
+        section_offset = {'hard': HARD_OFFSET, 'soft': SOFT_OFFSET, 'pair': PAIR_OFFSET}[self.section]
+        return section_offset + self.total * UPCARDS + self.upcard - 2
+
+
+# The Hi-Lo "Illustrious 18" without insurance, which this game does not offer.
+ILLUSTRIOUS_18: Tuple[IndexPlay, ...] = (
+    IndexPlay('hard', 16, 10, 0, STAND),
+    IndexPlay('hard', 15, 10, 4, STAND),
+    IndexPlay('pair', 10, 5, 5, 1),
+    IndexPlay('pair', 10, 6, 4, 1),
+    IndexPlay('hard', 10, 10, 4, DOUBLE_OR_HIT),
+    IndexPlay('hard', 12, 3, 2, STAND),
+    IndexPlay('hard', 12, 2, 3, STAND),
+    IndexPlay('hard', 11, 11, 1, DOUBLE_OR_HIT),
+    IndexPlay('hard', 9, 2, 1, DOUBLE_OR_HIT),
+    IndexPlay('hard', 10, 11, 4, DOUBLE_OR_HIT),
+    IndexPlay('hard', 9, 7, 3, DOUBLE_OR_HIT),
+    IndexPlay('hard', 16, 9, 5, STAND),
+    IndexPlay('hard', 13, 2, -1, HIT, at_or_above=False),
+    IndexPlay('hard', 12, 4, 0, HIT, at_or_above=False),
+    IndexPlay('hard', 12, 5, -2, HIT, at_or_above=False),
+    IndexPlay('hard', 12, 6, -1, HIT, at_or_above=False),
+    IndexPlay('hard', 13, 3, -2, HIT, at_or_above=False),
+)
+
+
+class DeviationCharts:
+    """Precomputed basic-strategy charts with index plays applied, one per true count.
+
+    Every floored true count from `-MAX_TRUE_COUNT` to `MAX_TRUE_COUNT` gets its
+    own table, so switching to the deviations costs one lookup per decision.
+
+    Attributes:
+        base (BasicStrategy): The chart played when no deviation applies.
+        plays (Tuple[IndexPlay, ...]): The deviations.
+    """
+
+    def __init__(self, base: BasicStrategy, plays: Sequence[IndexPlay] = ILLUSTRIOUS_18):
+        """Initializes the charts.
+
+        Args:
+            base (BasicStrategy): The chart played when no deviation applies.
+            plays (Sequence[IndexPlay]): The deviations.
+        """
+        self.base = base
+        self.plays = tuple(plays)
+        self._tables = []
+        for true_count in range(-MAX_TRUE_COUNT, MAX_TRUE_COUNT + 1):
+            table = bytearray(base.table)
+            for play in self.plays:
+                if play.applies(true_count):
+                    table[play.offset] = play.action
+            self._tables.append(bytes(table))
+
+    def table_for(self, true_count: float) -> bytes:
+        """Returns the table to play at a true count."""
+        bucket = min(max(math.floor(true_count), -MAX_TRUE_COUNT), MAX_TRUE_COUNT)
+        return self._tables[bucket + MAX_TRUE_COUNT]
+
+    def chart_for(self, true_count: float) -> BasicStrategy:
+        """Returns the chart to play at a true count."""
+        return BasicStrategy(self.table_for(true_count))
@@ -1,54 +1,56 @@
 """Handles all player actions during their turn."""
 
 from src.domain.Game import Game
+from src.domain.GameState import Action, GameState, HandStatus
 from src.domain.Player import Player
 from src.domain.Hand import Hand
 from src.domain.Card import Card
 
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+PLAYING = HandStatus.PLAYING
+BUSTED = HandStatus.BUSTED
+STAND = HandStatus.STAND
+PLAYER_TURN = GameState.PLAYER_TURN
+
 
 class PlayerAction:
     """A use case to handle all player actions (hit, stand, double down, split)."""
 
-    def execute(self, game: Game, player: Player, action: str):
+    def execute(self, game: Game, player: Player, action: Action):
         """Executes a given action for a player.
 
         Args:
             game (Game): The current game instance.
             player (Player): The player performing the action.
-            action (str): The action to perform (e.g., 'hit', 'stand').
+            action (Action): The action to perform. User interfaces convert their
+                input with `Action.of`.
 
         Raises:
             ValueError: If the action is invalid or not allowed at the current time.
         """
-        if game.game_state != 'playerTurn':
+        if game.game_state is not PLAYER_TURN:
             raise ValueError("Not the player's turn.")
 
-        current_hand = player.get_current_hand()
-
-        if action == 'hit':
-            self._hit(game, player, current_hand)
-        elif action == 'stand':
-            self._stand(player, current_hand)
-        elif action == 'doubleDown':
-            self._double_down(game, player, current_hand)
-        elif action == 'split':
-            self._split(game, player, current_hand)
-        else:
+        handler = self._HANDLERS.get(action)
+        if handler is None:
             raise ValueError(f"Invalid action: {action}")
 
+        current_hand = player.get_current_hand()
+        handler(self, game, player, current_hand)
+
         # After any action, check if the current hand is done and advance to the next active hand
-        if current_hand.status != 'playing':
+        if current_hand.status is not PLAYING:
             self._advance_to_next_active_hand(player)
 
     def _hit(self, game: Game, player: Player, hand: Hand):
         """Private method to handle the 'hit' action."""
         hand.add_card(game.deck.deal())
-        if hand.get_value() > 21:
-            hand.status = 'busted'
+        if hand.value > 21:
+            hand.status = BUSTED
 
-    def _stand(self, player: Player, hand: Hand):
+    def _stand(self, game: Game, player: Player, hand: Hand):
         """Private method to handle the 'stand' action."""
-        hand.status = 'stand'
+        hand.status = STAND
 
     def _double_down(self, game: Game, player: Player, hand: Hand):
         """Private method to handle the 'doubleDown' action."""
@@ -62,10 +64,10 @@ class PlayerAction:
         player.balance -= current_bet
         player.bets[player.current_hand_index] = current_bet * 2
         hand.add_card(game.deck.deal())
-        if hand.get_value() > 21:
-            hand.status = 'busted'
+        if hand.value > 21:
+            hand.status = BUSTED
         else:
-            hand.status = 'stand'
+            hand.status = STAND
 
     def _split(self, game: Game, player: Player, hand: Hand):
         """Private method to handle the 'split' action."""
@@ -73,7 +75,7 @@ class PlayerAction:
 
         if len(hand.cards) != 2:
             raise ValueError("Can only split a two-card hand.")
-        if hand.cards[0].rank != hand.cards[1].rank:
+        if not hand.is_pair:
             raise ValueError("Cards must be of the same rank to split.")
         if player.balance < current_bet:
             raise ValueError("Insufficient balance to split.")
@@ -81,10 +83,10 @@ class PlayerAction:
         # Deduct the second bet
         player.balance -= current_bet
 
-        # Create new hand and move one card
-        new_hand = Hand()
-        new_hand.add_card(hand.cards.pop())
-        new_hand.status = 'playing'  # New hand is active
+        # Take a new hand from the player's pool and move one card
+        new_hand = player.new_hand()
+        new_hand.add_card(hand.pop_card())
+        new_hand.status = PLAYING  # New hand is active
 
         # Add new hand to player's hands
         player.add_hand(new_hand, current_bet)
@@ -105,7 +107,7 @@ class PlayerAction:
         original_index = player.current_hand_index
         found_next = False
         for i in range(original_index + 1, len(player.hands)):
-            if player.hands[i].status == 'playing':
+            if player.hands[i].status is PLAYING:
                 player.set_current_hand_index(i)
                 found_next = True
                 break
@@ -114,7 +116,7 @@ class PlayerAction:
             # If no more playing hands, check if any hand is still active (not busted or stood)
             # This handles cases where a split hand might have been added after the current index
             for i in range(len(player.hands)):
-                if player.hands[i].status == 'playing':
+                if player.hands[i].status is PLAYING:
                     player.set_current_hand_index(i)
                     found_next = True
                     break
@@ -123,3 +125,11 @@ class PlayerAction:
             # All hands are played (busted or stood), so the player's turn is over
             # The overall player status will be determined by DetermineOutcome
             player.set_current_hand_index(0)  # Reset to first hand for next round or display
+
+    # Each action's handler, looked up by the `Action`.
+    _HANDLERS = {
+        Action.HIT: _hit,
+        Action.STAND: _stand,
+        Action.DOUBLE_DOWN: _double_down,
+        Action.SPLIT: _split,
+    }
@@ -1,6 +1,10 @@
 """Handles the resetting of the game state for a new round."""
 
 from src.domain.Game import Game
+from src.domain.GameState import GameState
+
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+BETTING = GameState.BETTING
 
 
 class ResetRound:
@@ -19,4 +23,4 @@ class ResetRound:
         
         game.dealer.clear_hands()
 
-        game.game_state = 'betting'
+        game.transition_to(BETTING)
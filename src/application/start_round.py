@@ -1,6 +1,19 @@
 """Handles the initialization of a new round in a Blackjack game."""
 
+from typing import Optional, Protocol, Sequence
 from src.domain.Game import Game
+from src.domain.GameState import GameState
+
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+PLAYER_TURN = GameState.PLAYER_TURN
+
+
+class ShoeFactory(Protocol):
+    """Supplies full shoes shuffled ahead of time."""
+
+    def take(self) -> Sequence[int]:
+        """Returns the card codes of the next shuffled shoe, in dealing order."""
+        ...
 
 
 class StartRound:
@@ -9,31 +22,60 @@ class StartRound:
     This includes checking if a reshuffle is needed and dealing initial cards.
     """
 
+    def __init__(self, shoe_factory: Optional[ShoeFactory] = None):
+        """Initializes the use case.
+
+        Args:
+            shoe_factory (Optional[ShoeFactory]): Supplies shoes shuffled ahead of time,
+                which are swapped in at the reshuffle. If None, the shoe is reshuffled
+                in place when the round starts.
+        """
+        self.shoe_factory = shoe_factory
+
     def execute(self, game: Game):
         """Executes the start of a new round.
 
-        Checks if the deck penetration has reached the threshold for a reshuffle.
-        Deals two cards to each player and the dealer.
+        Checks if the deck penetration has reached the threshold for a reshuffle,
+        in which case the discard pile goes back into the shoe, or a shoe from the
+        shoe factory replaces it. Deals two cards to each player and the dealer.
 
         Args:
             game (Game): The current game instance.
 
         Returns:
             Game: The updated game instance after dealing.
+
+        Raises:
+            ValueError: If the game is not in the 'betting' state.
         """
+        # Checked before dealing, so a refused transition leaves the shoe untouched.
+        game.transition_to(PLAYER_TURN)
+
+        # The previous round's cards have been cleared from the table.
+        game.deck.begin_round()
+
         # Check if the deck needs to be reshuffled
-        num_remaining_cards = len(game.deck.cards)
+        num_remaining_cards = game.deck.cards_remaining
         penetration = 1.0 - (num_remaining_cards / game.deck.total_cards)
         if penetration >= game.rules.reshuffle_penetration:
-            game.deck.build_and_shuffle()
+            if self.shoe_factory is not None:
+                game.deck.load_shuffled(self.shoe_factory.take())
+            else:
+                game.deck.reshuffle()
             # Optionally, you could add a message to the game state to inform the UI
             # game.add_message("Deck has been reshuffled.")
 
-        # Deal initial cards
-        for _ in range(2):
-            for player in game.players:
-                player.hands[0].add_card(game.deck.deal())
-            game.dealer.hands[0].add_card(game.deck.deal())
-        
-        game.game_state = 'playerTurn'
+        # Deal initial cards in casino order, one to each player and then the dealer,
+        # twice, from a single bulk deal.
+        players = game.players
+        seats = len(players) + 1
+        cards = game.deck.deal_many(2 * seats)
+        for seat, player in enumerate(players):
+            hand = player.hands[0]
+            hand.add_card(cards[seat])
+            hand.add_card(cards[seats + seat])
+        dealer_hand = game.dealer.hands[0]
+        dealer_hand.add_card(cards[seats - 1])
+        dealer_hand.add_card(cards[2 * seats - 1])
+
         return game
@@ -0,0 +1,281 @@
+"""Represents a compact, array-backed shoe of cards for the Blackjack game."""
+
+import random
+from array import array
+from typing import Iterable, List, Optional, Sequence
+from .Card import Card, STANDARD_CARDS
+from .CountingSystem import CountingSystem, HI_LO
+from .ShoeComposition import ShoeComposition
+
+
+class ArrayShoe:
+    """A drop-in alternative to `Deck` that stores the shoe as an array of card codes.
+
+    The shoe order is a compact `array('B')` of integer codes into `STANDARD_CARDS`.
+    Dealing advances a cursor instead of popping and appending, so the cards
+    before the cursor form the discard pile and the cards after it are still
+    in the shoe. As with `Deck`, `begin_round` marks the cards dealt from then
+    on as being on the table, and `reshuffle` keeps them out of the new shoe.
+
+    Attributes:
+        order (array): The card codes of the whole shoe, in dealing order.
+        position (int): The index of the next card to deal.
+        num_decks (int): The number of 52-card decks in the shoe.
+        rng (random.Random): The random number generator used for shuffling.
+        composition (ShoeComposition): The remaining cards per value and the running count.
+    """
+
+    def __init__(
+        self,
+        num_decks: int = 1,
+        rng: Optional[random.Random] = None,
+        counting_system: CountingSystem = HI_LO,
+    ):
+        """Initializes the shoe for a specified number of 52-card decks.
+
+        Args:
+            num_decks (int): The number of standard 52-card decks to use.
+            rng (Optional[random.Random]): The random number generator used for shuffling.
+                Defaults to a new, unseeded `random.Random`.
+            counting_system (CountingSystem): The system used for the running count.
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.composition = ShoeComposition(num_decks, counting_system)
+        self.num_decks = num_decks
+        self.order = array('B', range(len(STANDARD_CARDS))) * num_decks
+        self.position = 0
+        self._round_start: Optional[int] = None
+        self.build_and_shuffle()
+
+    @classmethod
+    def from_order(
+        cls,
+        order: Iterable[int],
+        rng: Optional[random.Random] = None,
+        counting_system: CountingSystem = HI_LO,
+    ) -> 'ArrayShoe':
+        """Creates a shoe that deals the given card codes in order, without shuffling it.
+
+        Later reshuffles use `rng`. This is how pre-shuffled shoes, such as rows of a
+        batch generated for simulation, are fed to the use cases.
+
+        Args:
+            order (Iterable[int]): Card codes in dealing order. The length must be a
+                multiple of 52.
+            rng (Optional[random.Random]): The random number generator for later reshuffles.
+            counting_system (CountingSystem): The system used for the running count.
+
+        Returns:
+            ArrayShoe: A shoe positioned at the first card of `order`.
+
+        Raises:
+            ValueError: If a code is not in `range(len(STANDARD_CARDS))` or the number
+                of cards is not a whole number of decks.
+        """
+        try:
+            codes = array('B', order)
+        except OverflowError:
+            codes = None
+        if codes is None or (codes and max(codes) >= len(STANDARD_CARDS)):
+            raise ValueError(f"Card codes must be in range({len(STANDARD_CARDS)}).")
+        if not codes or len(codes) % len(STANDARD_CARDS):
+            raise ValueError("A shoe must contain a whole number of 52-card decks.")
+
+        shoe = cls.__new__(cls)
+        shoe.rng = rng if rng is not None else random.Random()
+        shoe.num_decks = len(codes) // len(STANDARD_CARDS)
+        shoe.composition = ShoeComposition(shoe.num_decks, counting_system)
+        shoe.order = codes
+        shoe.position = 0
+        shoe._round_start = None
+        return shoe
+
+    def build_and_shuffle(self):
+        """Returns every card to the shoe and shuffles it."""
+        self.position = 0
+        self._round_start = None
+        self.composition.reset(self.num_decks)
+        self.shuffle()
+
+    def begin_round(self):
+        """Marks every card dealt so far as cleared from the table."""
+        self._round_start = self.position
+
+    @property
+    def cards_in_play(self) -> int:
+        """Returns the number of cards dealt since `begin_round`, which are still on the table.
+
+        Without a round begun since the last full reshuffle, no card counts as in play.
+        """
+        if self._round_start is None:
+            return 0
+        return self.position - self._round_start
+
+    def reshuffle(self, in_play: Optional[int] = None):
+        """Returns the dealt cards to the shoe in place and shuffles it.
+
+        The last `in_play` dealt cards are still on the table. The dealt part of
+        `order` is rotated so they come first and count as dealt, and only the
+        cards after them are shuffled.
+
+        Args:
+            in_play (Optional[int]): The number of cards still on the table.
+                Defaults to `cards_in_play`.
+        """
+        if in_play is None:
+            in_play = self.cards_in_play
+        order = self.order
+        if in_play:
+            dealt = self.position
+            order[:dealt] = order[dealt - in_play:dealt] + order[:dealt - in_play]
+        self.position = in_play
+        if self._round_start is not None:
+            self._round_start = 0
+        composition = self.composition
+        composition.reset(self.num_decks)
+        for code in order[:in_play]:
+            composition.remove(STANDARD_CARDS[code].value)
+        self.shuffle()
+
+    def load_shuffled(self, order: Sequence[int], in_play: Optional[int] = None):
+        """Replaces the shoe with a full shoe shuffled ahead of time.
+
+        The cards still on the table move to the front of the new `order` and
+        count as dealt, and the shoe deals the rest of `order` in the given
+        order; see `Deck.load_shuffled`.
+
+        Args:
+            order (Sequence[int]): The card codes of a full shoe, in dealing order.
+            in_play (Optional[int]): The number of cards still on the table.
+                Defaults to `cards_in_play`.
+
+        Raises:
+            ValueError: If `order` does not hold exactly the cards of a full shoe.
+        """
+        if len(order) != len(self.order):
+            raise ValueError("A prepared shoe must hold every card of the shoe.")
+        if in_play is None:
+            in_play = self.cards_in_play
+        on_table = self.order[self.position - in_play:self.position]
+        if on_table:
+            order = list(order)
+            for code in on_table:
+                order.remove(code)
+        self.order = on_table + array('B', order)
+        self.position = in_play
+        if self._round_start is not None:
+            self._round_start = 0
+        composition = self.composition
+        composition.reset(self.num_decks)
+        for code in on_table:
+            composition.remove(STANDARD_CARDS[code].value)
+
+    def shuffle(self):
+        """Randomly shuffles the cards that have not been dealt yet.
+
+        Sorting by independent random keys gives a uniform permutation and runs
+        mostly in C, which is noticeably faster than `random.shuffle` on an array.
+        """
+        rand = self.rng.random
+        self.order[self.position:] = array('B', sorted(self.order[self.position:], key=lambda _: rand()))
+
+    def deal_code(self) -> int:
+        """Deals one card from the shoe and returns its integer code.
+
+        If the shoe is exhausted, it reshuffles before dealing, keeping the cards dealt
+        since `begin_round` out of the shoe.
+
+        Returns:
+            int: The code of the dealt card, an index into `STANDARD_CARDS`.
+        """
+        if self.position >= len(self.order):
+            self._reshuffle_exhausted()
+
+        code = self.order[self.position]
+        self.position += 1
+        self.composition.remove(STANDARD_CARDS[code].value)
+        return code
+
+    def deal(self) -> Card:
+        """Deals one card from the shoe.
+
+        Returns:
+            Card: The interned Card dealt from the shoe.
+        """
+        if self.position >= len(self.order):
+            self._reshuffle_exhausted()
+
+        card = STANDARD_CARDS[self.order[self.position]]
+        self.position += 1
+        self.composition.remove(card.value)
+        return card
+
+    def deal_codes(self, n: int) -> array:
+        """Deals `n` cards in one operation and returns their integer codes.
+
+        The codes are one slice of `order`, taken with a single cursor move and a
+        single update of the composition. If fewer than `n` cards are left, the
+        cards are dealt one at a time so the shoe reshuffles as `deal_code` does.
+
+        Args:
+            n (int): The number of cards to deal.
+
+        Returns:
+            array: The codes of the dealt cards, first dealt first.
+        """
+        position = self.position
+        if position + n > len(self.order):
+            return array('B', [self.deal_code() for _ in range(n)])
+        codes = self.order[position:position + n]
+        self.position = position + n
+        self.composition.remove_many([STANDARD_CARDS[code].value for code in codes])
+        return codes
+
+    def deal_many(self, n: int) -> List[Card]:
+        """Deals `n` cards in one operation; see `deal_codes`.
+
+        Args:
+            n (int): The number of cards to deal.
+
+        Returns:
+            List[Card]: The interned Cards dealt from the shoe, first dealt first.
+        """
+        return list(map(STANDARD_CARDS.__getitem__, self.deal_codes(n)))
+
+    def _reshuffle_exhausted(self):
+        """Reshuffles an empty shoe; a round that has dealt the whole shoe gives its own cards back."""
+        in_play = self.cards_in_play
+        self.reshuffle(in_play if in_play < self.position else 0)
+
+    @property
+    def cards(self) -> List[Card]:
+        """Returns the cards still in the shoe, with the next card to be dealt last.
+
+        This mirrors `Deck.cards`, which deals by popping from the end of its list.
+        """
+        return [STANDARD_CARDS[code] for code in reversed(self.order[self.position:])]
+
+    @property
+    def discard_pile(self) -> List[Card]:
+        """Returns the cards already dealt from the shoe, in dealing order."""
+        return [STANDARD_CARDS[code] for code in self.order[:self.position]]
+
+    @property
+    def cards_remaining(self) -> int:
+        """Returns the number of cards still in the shoe."""
+        return len(self.order) - self.position
+
+    @property
+    def running_count(self) -> int:
+        """Returns the running count of the dealt cards under the shoe's counting system."""
+        return self.composition.running_count
+
+    @property
+    def true_count(self) -> float:
+        """Returns the running count per remaining deck."""
+        return self.composition.true_count
+
+    @property
+    def total_cards(self) -> int:
+        """Returns the total number of cards that should be in a full shoe."""
+        return self.num_decks * 52
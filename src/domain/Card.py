@@ -1,11 +1,17 @@
 """Represents a single playing card."""
 
 import dataclasses
+from typing import Dict, Tuple
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Card:
-    """A dataclass representing a card with a suit, rank, and game value.
+    """An immutable dataclass representing a card with a suit, rank, and game value.
+
+    Cards are frozen and hashable, so they can be shared between shoes and used as
+    dictionary keys. The 52 distinct cards of a standard deck are interned in
+    `STANDARD_CARDS`; shoes hold references into that table instead of allocating
+    new cards on every reshuffle.
 
     Attributes:
         suit (str): The suit of the card (e.g., 'Hearts', 'Spades').
@@ -13,6 +19,36 @@ class Card:
         value (int): The integer value of the card in Blackjack.
     """
 
+    __slots__ = ('suit', 'rank', 'value')
+
     suit: str
     rank: str
     value: int
+
+
+SUITS: Tuple[str, ...] = ("Hearts", "Diamonds", "Clubs", "Spades")
+RANKS: Tuple[str, ...] = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack", "Queen", "King", "Ace")
+RANK_VALUES: Dict[str, int] = {
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+    "10": 10,
+    "Jack": 10,
+    "Queen": 10,
+    "King": 10,
+    "Ace": 11,
+}
+
+# Process-wide table of the 52 distinct cards, in deck-building order (suit-major).
+# A card's position in this table is its integer code.
+STANDARD_CARDS: Tuple[Card, ...] = tuple(
+    Card(suit, rank, RANK_VALUES[rank]) for suit in SUITS for rank in RANKS
+)
+
+# Maps any card (interned or an equal instance) back to its integer code.
+CARD_CODES: Dict[Card, int] = {card: code for code, card in enumerate(STANDARD_CARDS)}
@@ -0,0 +1,41 @@
+"""Defines card counting systems used to track the running count of a shoe."""
+
+import dataclasses
+from typing import Tuple
+
+
+@dataclasses.dataclass(frozen=True)
+class CountingSystem:
+    """A dataclass holding the count tag of every card value.
+
+    Attributes:
+        name (str): The name of the system (e.g., 'Hi-Lo').
+        tags (Tuple[int, ...]): The tag of each card value from 2 to 11 (Ace), so
+            `tags[card.value - 2]` is added to the running count when a card is dealt.
+    """
+
+    name: str
+    tags: Tuple[int, ...]
+
+    def initial_running_count(self, num_decks: int) -> int:
+        """Returns the running count of a freshly shuffled shoe.
+
+        Balanced systems start at zero. Unbalanced systems such as KO start at
+        the negated deck imbalance for every deck but one, so their pivot is
+        the same for any number of decks.
+
+        Args:
+            num_decks (int): The number of 52-card decks in the shoe.
+
+        Returns:
+            int: The initial running count.
+        """
+        # Each value appears four times per deck, except 10-valued cards (sixteen).
+        deck_imbalance = sum(tag * (16 if value == 10 else 4) for value, tag in enumerate(self.tags, start=2))
+        return -deck_imbalance * (num_decks - 1)
+
+
+#                              2  3  4  5  6  7  8  9 10  A
+HI_LO = CountingSystem('Hi-Lo', (1, 1, 1, 1, 1, 0, 0, 0, -1, -1))
+KO = CountingSystem('KO', (1, 1, 1, 1, 1, 1, 0, 0, -1, -1))
+OMEGA_II = CountingSystem('Omega II', (1, 1, 2, 2, 2, 1, 0, -1, -2, 0))
@@ -1,67 +1,217 @@
 """Represents the deck of cards for the Blackjack game."""
 
 import random
-from typing import List
-from .Card import Card
+from typing import List, Optional, Sequence
+from .Card import Card, CARD_CODES, STANDARD_CARDS
+from .CountingSystem import CountingSystem, HI_LO
+from .ShoeComposition import ShoeComposition
 
 
 class Deck:
-    """Manages a collection of cards, supporting multiple decks, shuffling, and dealing."""
+    """Manages a collection of cards, supporting multiple decks, shuffling, and dealing.
 
-    def __init__(self, num_decks: int = 1):
+    The deck keeps a `ShoeComposition` in step with every deal, so the remaining
+    cards per value and the running and true counts are available in O(1).
+
+    Dealt cards go to the discard pile straight away, including the cards still
+    on the table. `begin_round` marks where the current round starts in the
+    pile, so `reshuffle` can return everything else to the shoe while the cards
+    in play stay out.
+    """
+
+    def __init__(
+        self,
+        num_decks: int = 1,
+        rng: Optional[random.Random] = None,
+        counting_system: CountingSystem = HI_LO,
+    ):
         """Initializes the Deck for a specified number of 52-card decks.
 
         Args:
             num_decks (int): The number of standard 52-card decks to use.
+            rng (Optional[random.Random]): The random number generator used for shuffling.
+                Pass a seeded instance to make the shoe reproducible. Defaults to a new,
+                unseeded `random.Random`.
+            counting_system (CountingSystem): The system used for the running count.
         """
+        self.rng = rng if rng is not None else random.Random()
+        self.composition = ShoeComposition(num_decks, counting_system)
         self.cards: List[Card] = []
         self.discard_pile: List[Card] = []
         self.num_decks = num_decks
+        self._round_start: Optional[int] = None
         self.build_and_shuffle()
 
     def build_and_shuffle(self):
-        """Builds a new, full, and shuffled deck of cards."""
-        self.cards = []
+        """Builds a new, full, and shuffled deck of cards.
+
+        The shoe holds references to the interned cards in `STANDARD_CARDS`, so no
+        new Card objects are created.
+        """
         self.discard_pile = []
-        for _ in range(self.num_decks):
-            for suit in ["Hearts", "Diamonds", "Clubs", "Spades"]:
-                for rank, value in {
-                    "2": 2,
-                    "3": 3,
-                    "4": 4,
-                    "5": 5,
-                    "6": 6,
-                    "7": 7,
-                    "8": 8,
-                    "9": 9,
-                    "10": 10,
-                    "Jack": 10,
-                    "Queen": 10,
-                    "King": 10,
-                    "Ace": 11,
-                }.items():
-                    self.cards.append(Card(suit, rank, value))
+        self._round_start = None
+        self.cards = list(STANDARD_CARDS) * self.num_decks
+        self.composition.reset(self.num_decks)
         self.shuffle()
 
+    def begin_round(self):
+        """Marks every card dealt so far as cleared from the table."""
+        self._round_start = len(self.discard_pile)
+
+    @property
+    def cards_in_play(self) -> int:
+        """Returns the number of cards dealt since `begin_round`, which are still on the table.
+
+        Without a round begun since the last full rebuild, no card counts as in play.
+        """
+        if self._round_start is None:
+            return 0
+        return len(self.discard_pile) - self._round_start
+
+    def reshuffle(self, in_play: Optional[int] = None):
+        """Returns the discard pile to the shoe in place and shuffles it.
+
+        The same Card references move from the discard pile back into `cards`,
+        so nothing is rebuilt. The last `in_play` cards of the discard pile are
+        still on the table; they stay in the pile and out of the shoe, and the
+        composition counts them as dealt.
+
+        Args:
+            in_play (Optional[int]): The number of cards still on the table.
+                Defaults to `cards_in_play`.
+        """
+        if in_play is None:
+            in_play = self.cards_in_play
+        discard_pile = self.discard_pile
+        on_table = discard_pile[len(discard_pile) - in_play:]
+        del discard_pile[len(discard_pile) - in_play:]
+        self.cards.extend(discard_pile)
+        discard_pile.clear()
+        discard_pile.extend(on_table)
+        if self._round_start is not None:
+            self._round_start = 0
+        composition = self.composition
+        composition.reset(self.num_decks)
+        for card in discard_pile:
+            composition.remove(card.value)
+        self.shuffle()
+
+    def load_shuffled(self, order: Sequence[int], in_play: Optional[int] = None):
+        """Replaces the shoe with a full shoe shuffled ahead of time.
+
+        The cards still on the table are taken out of `order`, so the shoe deals
+        the rest of it in the given order. Dropping fixed cards from a uniform
+        permutation leaves a uniform permutation of the others, so this is as
+        random as `reshuffle`.
+
+        Args:
+            order (Sequence[int]): The card codes of a full shoe, in dealing order.
+            in_play (Optional[int]): The number of cards still on the table.
+                Defaults to `cards_in_play`.
+
+        Raises:
+            ValueError: If `order` does not hold exactly the cards of a full shoe.
+        """
+        if len(order) != self.total_cards:
+            raise ValueError("A prepared shoe must hold every card of the shoe.")
+        if in_play is None:
+            in_play = self.cards_in_play
+        on_table = self.discard_pile[len(self.discard_pile) - in_play:]
+        if on_table:
+            order = list(order)
+            for card in on_table:
+                order.remove(CARD_CODES[card])
+        # The last card of `cards` is dealt first.
+        self.cards = list(map(STANDARD_CARDS.__getitem__, reversed(order)))
+        self.discard_pile = on_table
+        if self._round_start is not None:
+            self._round_start = 0
+        composition = self.composition
+        composition.reset(self.num_decks)
+        for card in on_table:
+            composition.remove(card.value)
+
     def shuffle(self):
         """Randomly shuffles the cards in the deck."""
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def deal(self) -> Card:
         """Deals one card from the top of the deck and adds it to the discard pile.
 
-        If the deck is empty, it automatically rebuilds and shuffles it before dealing.
+        If the deck is empty, the discard pile is reshuffled into it first, except for
+        the cards dealt since `begin_round`.
 
         Returns:
             Card: The card dealt from the top of the deck.
         """
         if not self.cards:
-            self.build_and_shuffle()
-        
+            # A round that has dealt the whole shoe has to give its own cards back.
+            in_play = self.cards_in_play
+            self.reshuffle(in_play if in_play < len(self.discard_pile) else 0)
+
         card = self.cards.pop()
         self.discard_pile.append(card)
+        self.composition.remove(card.value)
         return card
 
+    def deal_many(self, n: int) -> List[Card]:
+        """Deals `n` cards in one operation, in the order `deal` would deal them.
+
+        The cards come off the top of the deck as one slice, with a single update
+        of the discard pile and the composition. If fewer than `n` cards are left,
+        the cards are dealt one at a time so the deck reshuffles as `deal` does.
+
+        Args:
+            n (int): The number of cards to deal.
+
+        Returns:
+            List[Card]: The dealt cards, first dealt first.
+        """
+        cards = self.cards
+        if n > len(cards):
+            return [self.deal() for _ in range(n)]
+        start = len(cards) - n
+        dealt = cards[start:]
+        del cards[start:]
+        dealt.reverse()
+        self.discard_pile.extend(dealt)
+        self.composition.remove_many([card.value for card in dealt])
+        return dealt
+
+    def deal_code(self) -> int:
+        """Deals one card and returns its integer code.
+
+        Returns:
+            int: The code of the dealt card, an index into `STANDARD_CARDS`.
+        """
+        return CARD_CODES[self.deal()]
+
+    def deal_codes(self, n: int) -> List[int]:
+        """Deals `n` cards in one operation and returns their integer codes; see `deal_many`.
+
+        Args:
+            n (int): The number of cards to deal.
+
+        Returns:
+            List[int]: The codes of the dealt cards, first dealt first.
+        """
+        return [CARD_CODES[card] for card in self.deal_many(n)]
+
+    @property
+    def cards_remaining(self) -> int:
+        """Returns the number of cards still in the deck."""
+        return len(self.cards)
+
+    @property
+    def running_count(self) -> int:
+        """Returns the running count of the dealt cards under the shoe's counting system."""
+        return self.composition.running_count
+
+    @property
+    def true_count(self) -> float:
+        """Returns the running count per remaining deck."""
+        return self.composition.true_count
+
     @property
     def total_cards(self) -> int:
         """Returns the total number of cards that should be in a full shoe."""
@@ -1,27 +1,66 @@
 """Represents the central state of the Blackjack game."""
 
-from typing import List
+import random
+from typing import List, Optional, Union
 from .Player import Player
 from .Dealer import Dealer
 from .Deck import Deck
+from .ArrayShoe import ArrayShoe
 from .GameRules import GameRules
+from .GameState import GAME_TRANSITIONS, GameState
 
 
 class Game:
     """Holds the overall state of a Blackjack game.
 
     This includes all players, the dealer, the deck, the game rules, and the current game state.
+
+    `game_state` is a `GameState`. It only moves as `GAME_TRANSITIONS` allows:
+    use cases call `transition_to`, and assigning the property, including a label
+    string such as 'dealerTurn', goes through the same check.
     """
 
-    def __init__(self, players: List[Player], rules: GameRules):
+    def __init__(
+        self,
+        players: List[Player],
+        rules: GameRules,
+        deck: Optional[Union[Deck, ArrayShoe]] = None,
+        rng: Optional[random.Random] = None,
+    ):
         """Initializes a new game session.
 
         Args:
             players (List[Player]): A list of Player objects participating in the game.
             rules (GameRules): The set of rules governing this game instance.
+            deck (Optional[Union[Deck, ArrayShoe]]): The shoe to deal from. Defaults to a
+                new `Deck` with `rules.num_decks` decks.
+            rng (Optional[random.Random]): The random number generator for the default
+                deck. Ignored when `deck` is given.
         """
         self.players = players
         self.dealer = Dealer()
-        self.deck = Deck(rules.num_decks)
+        self.deck = deck if deck is not None else Deck(rules.num_decks, rng=rng)
         self.rules = rules
-        self.game_state = 'betting'  # Current state: 'betting', 'playerTurn', 'dealerTurn', 'roundOver'
+        self._game_state = GameState.BETTING
+
+    @property
+    def game_state(self) -> GameState:
+        """The current phase of the round."""
+        return self._game_state
+
+    @game_state.setter
+    def game_state(self, state: Union[GameState, str]):
+        self.transition_to(GameState.of(state))
+
+    def transition_to(self, state: GameState):
+        """Moves the game to another state, if the transition table allows it.
+
+        Args:
+            state (GameState): The state to move to.
+
+        Raises:
+            ValueError: If the game cannot move from its current state to `state`.
+        """
+        if state not in GAME_TRANSITIONS[self._game_state]:
+            raise ValueError(f"Cannot move from '{self._game_state.label}' to '{state.label}'.")
+        self._game_state = state
@@ -0,0 +1,97 @@
+"""Integer-encoded game states, hand statuses and player actions."""
+
+from enum import Enum
+from typing import Dict, FrozenSet, Union
+
+
+class LabelledEnum(Enum):
+    """An enum of integer-coded members, each with the label string it replaces.
+
+    Each member is declared as `(value, label)`. Members only ever equal
+    themselves, neither their label nor members of another enum, so strings are
+    converted at the edges: `of` turns a label (or a value) into the member and
+    `label` turns a member back into its string. Members are singletons, so hot
+    code compares them with `is`.
+
+    Attributes:
+        label (str): The string the member replaces, e.g. 'playerTurn'.
+    """
+
+    label: str
+
+    def __new__(cls, value: int, label: str):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.label = label
+        return member
+
+    # Equality is identity, so the identity hash is consistent with it and,
+    # unlike `Enum.__hash__`, costs no Python call in dict and set lookups.
+    __hash__ = object.__hash__
+
+    @classmethod
+    def of(cls, value: Union['LabelledEnum', int, str]) -> 'LabelledEnum':
+        """Returns the member for a member, its integer value or its label.
+
+        Raises:
+            ValueError: If no member has that value or label.
+        """
+        if value.__class__ is cls:
+            return value
+        member = _BY_LABEL[cls].get(value)
+        return member if member is not None else cls(value)
+
+    @classmethod
+    def _missing_(cls, value):
+        for member in cls:
+            if member.label == value:
+                return member
+        return None
+
+
+class GameState(LabelledEnum):
+    """The phase of a round."""
+
+    BETTING = 0, 'betting'
+    PLAYER_TURN = 1, 'playerTurn'
+    DEALER_TURN = 2, 'dealerTurn'
+    ROUND_OVER = 3, 'roundOver'
+
+
+class HandStatus(LabelledEnum):
+    """The status of a hand, from play through settlement."""
+
+    PLAYING = 0, 'playing'
+    STAND = 1, 'stand'
+    BUSTED = 2, 'busted'
+    WIN = 3, 'win'
+    LOSE = 4, 'lose'
+    PUSH = 5, 'push'
+    BETTING = 6, 'betting'
+
+
+class Action(LabelledEnum):
+    """A decision a player makes on a hand."""
+
+    HIT = 0, 'hit'
+    STAND = 1, 'stand'
+    DOUBLE_DOWN = 2, 'doubleDown'
+    SPLIT = 3, 'split'
+
+
+# The members of each enum by label. `of` looks labels up here, since `_missing_`
+# has to scan the members and attribute lookups on an enum class are slow.
+_BY_LABEL: Dict[type, Dict[str, LabelledEnum]] = {
+    enum: {member.label: member for member in enum} for enum in (GameState, HandStatus, Action)
+}
+
+
+# The states each state may move to through `Game.transition_to`. A round runs
+# betting -> player turn -> dealer turn -> round over, and resetting the table
+# returns to betting from any state, abandoning the round in progress.
+GAME_TRANSITIONS: Dict[GameState, FrozenSet[GameState]] = {
+    GameState.BETTING: frozenset({GameState.BETTING, GameState.PLAYER_TURN}),
+    GameState.PLAYER_TURN: frozenset({GameState.BETTING, GameState.DEALER_TURN}),
+    GameState.DEALER_TURN: frozenset({GameState.BETTING, GameState.ROUND_OVER}),
+    GameState.ROUND_OVER: frozenset({GameState.BETTING}),
+}
@@ -1,21 +1,48 @@
 """Represents a player's or dealer's hand of cards."""
 
-from typing import List
+from typing import List, Union
 from src.domain.Card import Card
+from src.domain.GameState import HandStatus
+
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+PLAYING = HandStatus.PLAYING
 
 
 class Hand:
-    """Manages the cards in a single hand and calculates its value.
+    """Manages the cards in a single hand and keeps its value up to date.
+
+    The hand keeps a running hard total (every Ace counted as 1) and the number of
+    Aces, updated as cards are added or removed, so its value and flags are
+    available in constant time. Cards should only be changed through `add_card`
+    and `pop_card` to keep the totals in sync.
 
     Attributes:
         cards (List[Card]): A list of Card objects currently in the hand.
-        status (str): The current status of the hand (e.g., 'playing', 'busted', 'stand').
     """
 
     def __init__(self):
         """Initializes an empty hand with a 'playing' status."""
-        self.cards = []
-        self.status = 'playing'  # playing, busted, stand
+        self.cards: List[Card] = []
+        self._status = PLAYING
+        self._hard_total = 0
+        self._num_aces = 0
+
+    def reset(self):
+        """Empties the hand in place and sets its status back to 'playing', so it can be reused."""
+        self.cards.clear()
+        self._status = PLAYING
+        self._hard_total = 0
+        self._num_aces = 0
+
+    @property
+    def status(self) -> HandStatus:
+        """The current status of the hand."""
+        return self._status
+
+    @status.setter
+    def status(self, status: Union[HandStatus, str]):
+        # Use cases assign members; only label strings need converting.
+        self._status = status if status.__class__ is HandStatus else HandStatus.of(status)
 
     def add_card(self, card: Card):
         """Adds a card to the hand.
@@ -24,9 +51,50 @@ class Hand:
             card (Card): The Card object to add to the hand.
         """
         self.cards.append(card)
+        if card.value == 11:
+            self._num_aces += 1
+            self._hard_total += 1
+        else:
+            self._hard_total += card.value
+
+    def pop_card(self) -> Card:
+        """Removes and returns the last card of the hand, e.g. when splitting.
+
+        Returns:
+            Card: The removed Card object.
+        """
+        card = self.cards.pop()
+        if card.value == 11:
+            self._num_aces -= 1
+            self._hard_total -= 1
+        else:
+            self._hard_total -= card.value
+        return card
+
+    @property
+    def value(self) -> int:
+        """The total value of the hand, counting one Ace as 11 when that does not bust it."""
+        if self._num_aces and self._hard_total <= 11:
+            return self._hard_total + 10
+        return self._hard_total
+
+    @property
+    def is_soft(self) -> bool:
+        """True if the hand counts an Ace as 11."""
+        return self._num_aces > 0 and self._hard_total <= 11
+
+    @property
+    def is_blackjack(self) -> bool:
+        """True if the hand is a two-card 21."""
+        return len(self.cards) == 2 and self._num_aces == 1 and self._hard_total == 11
+
+    @property
+    def is_pair(self) -> bool:
+        """True if the hand is two cards of the same rank."""
+        return len(self.cards) == 2 and self.cards[0].rank == self.cards[1].rank
 
     def get_value(self) -> int:
-        """Calculates the total value of the hand, intelligently handling Aces.
+        """Returns the total value of the hand, intelligently handling Aces.
 
         Aces are valued at 11 unless that would cause the hand to bust (exceed 21),
         in which case they are valued at 1.
@@ -34,16 +102,4 @@ class Hand:
         Returns:
             int: The calculated value of the hand.
         """
-        value = 0
-        num_aces = 0
-        for card in self.cards:
-            if card.rank == 'Ace':
-                num_aces += 1
-                value += 11
-            else:
-                value += card.value
-
-        while value > 21 and num_aces > 0:
-            value -= 10
-            num_aces -= 1
-        return value
+        return self.value
@@ -1,8 +1,17 @@
 """Represents a player in the Blackjack game."""
 
+from src.domain.GameState import HandStatus
 from src.domain.Hand import Hand
 from typing import List
 
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+PLAYING = HandStatus.PLAYING
+BUSTED = HandStatus.BUSTED
+WIN = HandStatus.WIN
+PUSH = HandStatus.PUSH
+STAND = HandStatus.STAND
+BETTING = HandStatus.BETTING
+
 
 class Player:
     """Manages a player's balance, bets, and one or more hands of cards.
@@ -12,6 +21,11 @@ class Player:
         hands (List[Hand]): A list of Hand objects the player currently holds.
         bets (List[int]): A list of bets corresponding to each hand.
         current_hand_index (int): The index of the hand currently being played (relevant for splits).
+
+    The player owns its `Hand` objects for its whole life. `clear_hands` resets
+    the first hand in place and keeps the hands added by splits in a pool that
+    `new_hand` draws from, so the pool grows to the most splits the seat has
+    needed in one round and steady-state rounds allocate no hands.
     """
 
     def __init__(self, balance: int):
@@ -24,6 +38,7 @@ class Player:
         self.hands = [Hand()]  # Player can have multiple hands after splitting
         self.bets = [0]  # Corresponding bets for each hand
         self.current_hand_index = 0  # Index of the hand currently being played
+        self._spare_hands: List[Hand] = []  # Reset hands from earlier splits, ready for reuse
 
     def place_bet(self, amount: int, hand_index: int = 0):
         """Places a bet for a specific hand and deducts the amount from the player's balance.
@@ -46,7 +61,7 @@ class Player:
 
         self.bets[hand_index] = amount
         self.balance -= amount
-        self.hands[hand_index].status = 'playing'  # Set hand status to playing
+        self.hands[hand_index].status = PLAYING
 
     def get_current_hand(self) -> Hand:
         """Returns the hand the player is currently playing.
@@ -67,13 +82,33 @@ class Player:
     def clear_hands(self):
         """Resets the player's hands and bets for a new round.
 
-        All existing hands are replaced with a single new hand, and bets are reset.
+        The player is left with a single empty hand, and bets are reset. The hand
+        and the `hands` and `bets` lists are reset in place, and any further hands
+        go back to the pool for later splits.
         """
-        self.hands = [Hand()]
-        self.hands[0].status = 'betting'  # Reset status of the initial hand
-        self.bets = [0]
+        hands = self.hands
+        spare_hands = self._spare_hands
+        while len(hands) > 1:
+            hand = hands.pop()
+            hand.reset()
+            spare_hands.append(hand)
+        first_hand = hands[0]
+        first_hand.reset()
+        first_hand.status = BETTING  # Reset status of the initial hand
+        del self.bets[1:]
+        self.bets[0] = 0
         self.current_hand_index = 0
 
+    def new_hand(self) -> Hand:
+        """Returns an empty hand for a split, reusing one from an earlier round when possible.
+
+        Returns:
+            Hand: An empty hand with a 'playing' status, not yet added to `hands`.
+        """
+        if self._spare_hands:
+            return self._spare_hands.pop()
+        return Hand()
+
     def add_hand(self, hand: Hand, bet: int):
         """Adds a new hand to the player, typically used during a split action.
 
@@ -105,23 +140,24 @@ class Player:
             bool: True if all hands are played, False otherwise.
         """
         for hand in self.hands:
-            if hand.status == 'playing':
+            if hand.status is PLAYING:
                 return False
         return True
 
-    def get_overall_status(self) -> str:
+    def get_overall_status(self) -> HandStatus:
         """Determines the player's overall status based on the status of all their hands.
 
         Returns:
-            str: The overall status (e.g., 'playing', 'busted', 'win', 'push', 'stand').
+            HandStatus: The overall status (e.g., 'playing', 'busted', 'win', 'push', 'stand').
         """
-        if any(hand.status == 'playing' for hand in self.hands):
-            return 'playing'
-        elif all(hand.status == 'busted' for hand in self.hands):
-            return 'busted'
-        elif any(hand.status == 'win' for hand in self.hands):
-            return 'win'
-        elif any(hand.status == 'push' for hand in self.hands):
-            return 'push'
+        statuses = [hand.status for hand in self.hands]
+        if PLAYING in statuses:
+            return PLAYING
+        elif all(status is BUSTED for status in statuses):
+            return BUSTED
+        elif WIN in statuses:
+            return WIN
+        elif PUSH in statuses:
+            return PUSH
         else:
-            return 'stand'  # Default if all hands are stood or a mix of outcomes
+            return STAND  # Default if all hands are stood or a mix of outcomes
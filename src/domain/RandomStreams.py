@@ -0,0 +1,49 @@
+"""Derives independent, reproducible random number streams from a master seed."""
+
+import hashlib
+import random
+
+
+class RandomStreams:
+    """A factory for seeded `random.Random` instances derived from one master seed.
+
+    Each stream is identified by a tuple of integer keys (e.g. a worker or block
+    index). The stream seed is a SHA-256 digest of the master seed and the keys,
+    so the same keys always produce the same stream, different keys produce
+    statistically independent streams, and no stream depends on how many other
+    streams were spawned before it.
+
+    Attributes:
+        master_seed (int): The seed all streams are derived from.
+    """
+
+    def __init__(self, master_seed: int):
+        """Initializes the factory.
+
+        Args:
+            master_seed (int): The seed all streams are derived from.
+        """
+        self.master_seed = master_seed
+
+    def seed_for(self, *keys: int) -> int:
+        """Returns the integer seed of the stream identified by `keys`.
+
+        Args:
+            *keys (int): The identifiers of the stream.
+
+        Returns:
+            int: A 256-bit seed for `random.Random`.
+        """
+        material = ":".join(str(part) for part in (self.master_seed, *keys)).encode()
+        return int.from_bytes(hashlib.sha256(material).digest(), "big")
+
+    def spawn(self, *keys: int) -> random.Random:
+        """Creates the random number generator identified by `keys`.
+
+        Args:
+            *keys (int): The identifiers of the stream.
+
+        Returns:
+            random.Random: A generator seeded for this stream.
+        """
+        return random.Random(self.seed_for(*keys))
@@ -0,0 +1,80 @@
+"""Tracks what is left in a shoe as cards are dealt."""
+
+from typing import List, Sequence
+from .CountingSystem import CountingSystem, HI_LO
+
+
+class ShoeComposition:
+    """Keeps per-value remaining card counts and a running count for a shoe.
+
+    Ranks are grouped by game value, so all 10-valued cards share one bucket.
+    Every update is O(1), which lets penetration checks, probability engines
+    and counting strategies query the shoe without scanning its cards.
+
+    Attributes:
+        counts (List[int]): The number of remaining cards of each value from 2 to
+            11 (Ace), indexed by `value - 2`.
+        remaining (int): The total number of cards remaining.
+        running_count (int): The running count under `system`.
+        system (CountingSystem): The counting system used for the running count.
+    """
+
+    def __init__(self, num_decks: int, system: CountingSystem = HI_LO):
+        """Initializes the composition of a full shoe.
+
+        Args:
+            num_decks (int): The number of 52-card decks in the shoe.
+            system (CountingSystem): The counting system used for the running count.
+        """
+        self.system = system
+        self.counts: List[int] = []
+        self.remaining = 0
+        self.running_count = 0
+        self.reset(num_decks)
+
+    def reset(self, num_decks: int):
+        """Restores the composition of a full, freshly shuffled shoe.
+
+        Args:
+            num_decks (int): The number of 52-card decks in the shoe.
+        """
+        self.counts = [4 * num_decks] * 10
+        self.counts[8] = 16 * num_decks  # 10, Jack, Queen and King
+        self.remaining = 52 * num_decks
+        self.running_count = self.system.initial_running_count(num_decks)
+
+    def remove(self, value: int):
+        """Records that a card of the given value has left the shoe.
+
+        Args:
+            value (int): The game value of the dealt card (2 to 11).
+        """
+        self.counts[value - 2] -= 1
+        self.remaining -= 1
+        self.running_count += self.system.tags[value - 2]
+
+    def remove_many(self, values: Sequence[int]):
+        """Records that cards of the given values have left the shoe, in one update.
+
+        Args:
+            values (Sequence[int]): The game values of the dealt cards (2 to 11).
+        """
+        counts, tags = self.counts, self.system.tags
+        running_count = 0
+        for value in values:
+            counts[value - 2] -= 1
+            running_count += tags[value - 2]
+        self.remaining -= len(values)
+        self.running_count += running_count
+
+    @property
+    def decks_remaining(self) -> float:
+        """The number of decks left in the shoe."""
+        return self.remaining / 52
+
+    @property
+    def true_count(self) -> float:
+        """The running count divided by the number of decks remaining."""
+        if not self.remaining:
+            return float(self.running_count)
+        return self.running_count * 52 / self.remaining
@@ -0,0 +1,103 @@
+"""Prepares shuffled shoes on a background thread, ahead of the reshuffle that needs them."""
+
+import random
+import threading
+from array import array
+from typing import Optional
+from src.domain.Card import STANDARD_CARDS
+
+
+class BackgroundShoeFactory:
+    """Keeps the next shuffled shoe ready while the current one is in play.
+
+    The factory is double-buffered: one shoe is in play on the table and the
+    next is shuffled by a worker thread. `take` hands over the prepared shoe
+    and lets the worker start on the one after it, so the reshuffle in
+    `StartRound` only has to swap the new order in.
+
+    The two threads hand shoes over with a pair of plain locks rather than an
+    executor, since waking the worker is on the round-start path and a lock
+    release is several times cheaper than submitting a task. A factory serves
+    a single table; `take` must not be called from several threads at once.
+
+    Only the worker thread uses `rng`, one shoe at a time, so a seeded factory
+    prepares the same sequence of shoes on every run.
+
+    Attributes:
+        num_decks (int): The number of 52-card decks in each shoe.
+        rng (random.Random): The random number generator used for shuffling.
+    """
+
+    def __init__(self, num_decks: int = 1, rng: Optional[random.Random] = None):
+        """Initializes the factory and starts preparing the first shoe.
+
+        Args:
+            num_decks (int): The number of 52-card decks in each shoe.
+            rng (Optional[random.Random]): The random number generator used for shuffling.
+                Defaults to a new, unseeded `random.Random`.
+        """
+        self.num_decks = num_decks
+        self.rng = rng if rng is not None else random.Random()
+        self._prepared: Optional[array] = None
+        self._closed = False
+        # Held while no shoe is prepared; the worker releases it.
+        self._ready = threading.Lock()
+        self._ready.acquire()
+        # Held while the worker should wait; `take` releases it.
+        self._wanted = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="shoe-factory", daemon=True)
+        self._worker.start()
+
+    def _run(self):
+        """Prepares one shoe each time the previous one has been taken."""
+        while True:
+            self._wanted.acquire()
+            if self._closed:
+                return
+            self._prepared = self._prepare()
+            self._ready.release()
+
+    def _prepare(self) -> array:
+        """Shuffles a full shoe; runs on the worker thread."""
+        rand = self.rng.random
+        codes = array('B', range(len(STANDARD_CARDS))) * self.num_decks
+        return array('B', sorted(codes, key=lambda _: rand()))
+
+    @property
+    def ready(self) -> bool:
+        """True if the next shoe has been shuffled and `take` will not wait."""
+        return not self._ready.locked()
+
+    def take(self) -> array:
+        """Returns the prepared shoe and lets the worker prepare the next one.
+
+        If the worker has not finished yet, this waits for it.
+
+        Returns:
+            array: The card codes of a full shuffled shoe, in dealing order.
+
+        Raises:
+            ValueError: If the factory has been closed.
+        """
+        if self._closed:
+            raise ValueError("The shoe factory has been closed.")
+        self._ready.acquire()
+        order = self._prepared
+        self._wanted.release()
+        return order
+
+    def close(self):
+        """Stops the worker thread; the factory cannot be used afterwards."""
+        if self._closed:
+            return
+        self._closed = True
+        # The worker is either waiting for `_wanted` or will check `_closed` before preparing again.
+        if self._wanted.locked():
+            self._wanted.release()
+        self._worker.join()
+
+    def __enter__(self) -> 'BackgroundShoeFactory':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,192 @@
+"""Command-line entry point for headless Blackjack simulations.
+
+Run from the project root:
+
+    python -m src.infrastructure.simulation --rounds 100000 --seed 1 --workers 8
+
+Add `--records rounds.csv` (or `--records -` for standard output) to stream one
+record per round while the simulation runs, or `--precision 0.001` to stop as
+soon as the house edge is known to within ±0.1% (with `--rounds` as the limit).
+
+Long runs can checkpoint themselves with `--checkpoint run.ckpt`; after the
+process is killed, `--resume run.ckpt` continues with identical results.
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import TextIO
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.checkpoint import DEFAULT_CHECKPOINT_EVERY, CheckpointedRun
+from src.infrastructure.simulation.parallel import (
+    DEFAULT_BLOCK_ROUNDS,
+    BasicStrategyFactory,
+    run_parallel,
+    run_until_precision,
+    stream_records,
+)
+from src.infrastructure.simulation.simulator import SimulationResult
+from src.infrastructure.simulation.statistics import DEFAULT_CONFIDENCE, RoundStatistics
+from src.infrastructure.simulation.sinks import CsvSink, JsonLinesSink, drain, tally
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser for the simulation command."""
+    parser = argparse.ArgumentParser(description="Simulate Blackjack rounds with basic strategy.")
+    parser.add_argument("--rounds", type=int, default=100_000, help="number of rounds to play")
+    parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible run")
+    parser.add_argument("--decks", type=int, default=GameRules.num_decks, help="number of decks in the shoe")
+    parser.add_argument("--stand-soft-17", action="store_true", help="dealer stands on soft 17")
+    parser.add_argument("--payout", type=float, default=GameRules.blackjack_payout, help="blackjack payout")
+    parser.add_argument("--bet", type=int, default=GameRules.min_bet, help="flat bet per round")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument(
+        "--block-rounds", type=int, default=DEFAULT_BLOCK_ROUNDS, help="rounds per independently seeded block"
+    )
+    parser.add_argument("--records", default=None, help="stream round records to this file, or - for stdout")
+    parser.add_argument(
+        "--records-format", choices=("csv", "jsonl"), default="csv", help="format of the streamed records"
+    )
+    parser.add_argument(
+        "--precision",
+        type=float,
+        default=None,
+        help="stop once the 95%% confidence interval of the house edge is this narrow on each side",
+    )
+    parser.add_argument("--checkpoint", default=None, help="save a checkpoint of the run to this file")
+    parser.add_argument(
+        "--checkpoint-every", type=int, default=DEFAULT_CHECKPOINT_EVERY, help="rounds between checkpoints"
+    )
+    parser.add_argument(
+        "--strategy-dir", default=None, help="cache compiled strategy charts in this directory"
+    )
+    parser.add_argument(
+        "--resume", default=None, help="continue the run saved in this checkpoint; other run options are ignored"
+    )
+    return parser
+
+
+def rules_from_args(args: argparse.Namespace) -> GameRules:
+    """Builds the table rules from parsed arguments."""
+    return GameRules(
+        blackjack_payout=args.payout,
+        dealer_hits_on_soft_17=not args.stand_soft_17,
+        num_decks=args.decks,
+        min_bet=min(args.bet, GameRules.min_bet),
+        max_bet=max(args.bet, GameRules.max_bet),
+    )
+
+
+def print_report(result: SimulationResult, file: TextIO = sys.stdout):
+    """Prints the summary of a simulation run."""
+    print(f"Rounds:      {result.rounds:,} ({result.hands:,} hands)", file=file)
+    print(f"House edge:  {result.house_edge:+.4%} ± {1.96 * result.standard_error:.4%} (95% CI)", file=file)
+    print(f"Std dev:     {result.std_dev:.4f} bets per round", file=file)
+    print(f"Throughput:  {result.hands_per_second:,.0f} hands/s", file=file)
+
+
+def print_statistics(statistics: RoundStatistics, elapsed_seconds: float, file: TextIO = sys.stdout):
+    """Prints the summary of a run that stopped at a target precision."""
+    low, high = statistics.house_edge_interval(DEFAULT_CONFIDENCE)
+    rounds = statistics.rounds.count
+    print(f"Rounds:      {rounds:,} ({statistics.hands:,} hands)", file=file)
+    print(f"House edge:  {statistics.house_edge:+.4%} (95% CI {low:+.4%} to {high:+.4%})", file=file)
+    print(f"Std dev:     {statistics.rounds.std_dev:.4f} bets per round", file=file)
+    print(
+        f"Hands:       {statistics.win_rate:.2%} won, {statistics.push_rate:.2%} pushed, "
+        f"{statistics.loss_rate:.2%} lost",
+        file=file,
+    )
+    print(f"Blackjacks:  {statistics.blackjack_frequency:.2%} of rounds", file=file)
+    print("By upcard:   " + ", ".join(
+        f"{'A' if upcard == 11 else upcard}: {stats.mean:+.3f}" for upcard, stats in sorted(statistics.by_upcard.items())
+    ), file=file)
+    print(f"Throughput:  {statistics.hands / elapsed_seconds if elapsed_seconds else 0.0:,.0f} hands/s", file=file)
+
+
+def run_streaming(rules: GameRules, args: argparse.Namespace, seed: int, stream: TextIO) -> SimulationResult:
+    """Plays the run in this process, writing every round record to a stream."""
+    sink_type = CsvSink if args.records_format == "csv" else JsonLinesSink
+    result = SimulationResult(bet=args.bet)
+    start = time.perf_counter()
+    records = stream_records(
+        rules,
+        args.rounds,
+        master_seed=seed,
+        strategy_factory=BasicStrategyFactory(args.strategy_dir),
+        bet=args.bet,
+        block_rounds=args.block_rounds,
+    )
+    drain(tally(records, result), sink_type(stream))
+    result.elapsed_seconds = time.perf_counter() - start
+    return result
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    strategy_factory = BasicStrategyFactory(args.strategy_dir)
+    if args.resume:
+        run = CheckpointedRun.resume(args.resume, checkpoint_every=args.checkpoint_every, strategy_factory=strategy_factory)
+        print(f"Master seed: {run.master_seed} (resumed after {run.rounds_played:,} rounds)")
+        print_report(run.run())
+        return
+    if args.checkpoint and (args.records or args.precision is not None or args.workers > 1):
+        parser.error("--checkpoint runs in a single process without --records or --precision")
+    if args.precision is not None and args.records:
+        parser.error("--precision reports statistics only and cannot be combined with --records")
+    if args.records and args.workers > 1:
+        parser.error("--records streams the run from a single process and cannot be combined with --workers")
+
+    rules = rules_from_args(args)
+    seed = args.seed if args.seed is not None else random.SystemRandom().randrange(2**63)
+    # When records go to standard output, the summary goes to standard error.
+    report_file = sys.stderr if args.records == "-" else sys.stdout
+    print(f"Master seed: {seed}", file=report_file)
+
+    if args.precision is not None:
+        start = time.perf_counter()
+        statistics = run_until_precision(
+            rules,
+            args.precision,
+            master_seed=seed,
+            max_rounds=args.rounds,
+            workers=args.workers,
+            strategy_factory=strategy_factory,
+            bet=args.bet,
+            block_rounds=args.block_rounds,
+        )
+        print_statistics(statistics, time.perf_counter() - start, file=report_file)
+        return
+    if args.records == "-":
+        result = run_streaming(rules, args, seed, sys.stdout)
+    elif args.records:
+        with open(args.records, "w", newline="") as stream:
+            result = run_streaming(rules, args, seed, stream)
+    elif args.checkpoint:
+        result = CheckpointedRun(
+            rules,
+            args.rounds,
+            seed,
+            args.checkpoint,
+            bet=args.bet,
+            block_rounds=args.block_rounds,
+            checkpoint_every=args.checkpoint_every,
+            strategy_factory=strategy_factory,
+        ).run()
+    else:
+        result = run_parallel(
+            rules,
+            args.rounds,
+            master_seed=seed,
+            workers=args.workers,
+            strategy_factory=strategy_factory,
+            bet=args.bet,
+            block_rounds=args.block_rounds,
+        )
+    print_report(result, file=report_file)
+
+
+if __name__ == "__main__":
+    main()
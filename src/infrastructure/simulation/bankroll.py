@@ -0,0 +1,228 @@
+"""Simulates many independent bankroll trajectories to estimate the risk of ruin."""
+
+import dataclasses
+import time
+from typing import Protocol, Sequence, Union
+import numpy as np
+from src.application.basic_strategy import BasicStrategy
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.vectorized import DEFAULT_LANES, VectorizedSimulator
+
+
+class BettingPolicy(Protocol):
+    """Chooses the next bet of every session from its current bankroll."""
+
+    def bets(self, bankrolls: np.ndarray) -> np.ndarray:
+        """Returns the desired bet of each session; the table limits are applied afterwards."""
+        ...
+
+
+class FlatBetting:
+    """Bets the same amount every round.
+
+    Attributes:
+        amount (int): The bet.
+    """
+
+    def __init__(self, amount: int):
+        """Initializes the policy.
+
+        Args:
+            amount (int): The bet.
+        """
+        self.amount = amount
+
+    def bets(self, bankrolls: np.ndarray) -> np.ndarray:
+        return np.full(bankrolls.shape, self.amount, dtype=np.int64)
+
+
+class ProportionalBetting:
+    """Bets a fixed fraction of the current bankroll, rounded down to a multiple of a unit.
+
+    Attributes:
+        fraction (float): The share of the bankroll to bet.
+        unit (int): The betting unit bets are rounded down to.
+    """
+
+    def __init__(self, fraction: float, unit: int = 1):
+        """Initializes the policy.
+
+        Args:
+            fraction (float): The share of the bankroll to bet.
+            unit (int): The betting unit bets are rounded down to.
+        """
+        self.fraction = fraction
+        self.unit = unit
+
+    def bets(self, bankrolls: np.ndarray) -> np.ndarray:
+        return (bankrolls * self.fraction // self.unit).astype(np.int64) * self.unit
+
+
+@dataclasses.dataclass
+class SessionResults:
+    """The outcome of a batch of bankroll sessions.
+
+    Attributes:
+        starting_bankroll (int): The bankroll every session started with.
+        final_bankrolls (np.ndarray): The bankroll of each session when it ended.
+        max_drawdowns (np.ndarray): The largest fall from a running peak in each session.
+        rounds_played (np.ndarray): The number of rounds each session played.
+        ruined (np.ndarray): True for sessions that could no longer cover the minimum bet.
+        longest_losing_streaks (np.ndarray): The most consecutive losing rounds in each session.
+        elapsed_seconds (float): The wall-clock time spent playing.
+    """
+
+    starting_bankroll: int
+    final_bankrolls: np.ndarray
+    max_drawdowns: np.ndarray
+    rounds_played: np.ndarray
+    ruined: np.ndarray
+    longest_losing_streaks: np.ndarray
+    elapsed_seconds: float = 0.0
+
+    @property
+    def sessions(self) -> int:
+        """The number of sessions played."""
+        return len(self.final_bankrolls)
+
+    @property
+    def risk_of_ruin(self) -> float:
+        """The fraction of sessions that went broke."""
+        return float(self.ruined.mean()) if self.sessions else 0.0
+
+    @property
+    def median_final_bankroll(self) -> float:
+        """The median bankroll at the end of a session."""
+        return float(np.median(self.final_bankrolls)) if self.sessions else 0.0
+
+    def drawdown_quantiles(self, quantiles: Sequence[float] = (0.5, 0.9, 0.99)) -> np.ndarray:
+        """Returns quantiles of the maximum drawdown distribution.
+
+        Args:
+            quantiles (Sequence[float]): The quantiles to compute, between 0 and 1.
+
+        Returns:
+            np.ndarray: The drawdown at each quantile.
+        """
+        return np.quantile(self.max_drawdowns, quantiles)
+
+    def merge(self, other: 'SessionResults') -> 'SessionResults':
+        """Returns the results of both batches of sessions combined."""
+        return SessionResults(
+            starting_bankroll=self.starting_bankroll,
+            final_bankrolls=np.concatenate((self.final_bankrolls, other.final_bankrolls)),
+            max_drawdowns=np.concatenate((self.max_drawdowns, other.max_drawdowns)),
+            rounds_played=np.concatenate((self.rounds_played, other.rounds_played)),
+            ruined=np.concatenate((self.ruined, other.ruined)),
+            longest_losing_streaks=np.concatenate((self.longest_losing_streaks, other.longest_losing_streaks)),
+            elapsed_seconds=self.elapsed_seconds + other.elapsed_seconds,
+        )
+
+
+class BankrollSimulator:
+    """Plays independent bankroll sessions side by side, one per vectorized lane.
+
+    Each session starts with the same bankroll and plays up to `session_rounds`
+    rounds. Every round the policy's bet is clipped to the table limits and to
+    the bankroll; doubles and splits are only made when the rest of the bankroll
+    covers them. A session is ruined, and stops, once its bankroll falls below
+    `rules.min_bet`.
+
+    Sessions are played in batches of `lanes` by a single `VectorizedSimulator`,
+    so the cost of a session is a slice of a few array operations per round
+    rather than a `Game` of its own.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        strategy: BasicStrategy,
+        policy: BettingPolicy,
+        starting_bankroll: int,
+        session_rounds: int,
+        lanes: int = DEFAULT_LANES,
+        seed: Union[int, np.random.Generator, None] = None,
+    ):
+        """Initializes the simulator.
+
+        Args:
+            rules (GameRules): The rules of the simulated table.
+            strategy (BasicStrategy): The chart the player follows.
+            policy (BettingPolicy): Chooses the bet of each round.
+            starting_bankroll (int): The bankroll each session starts with.
+            session_rounds (int): The maximum number of rounds per session.
+            lanes (int): The number of sessions played side by side.
+            seed (Union[int, np.random.Generator, None]): A seed or NumPy generator
+                for reproducible sessions.
+
+        Raises:
+            ValueError: If the starting bankroll or session length is not positive.
+        """
+        if starting_bankroll <= 0:
+            raise ValueError("The starting bankroll must be positive.")
+        if session_rounds <= 0:
+            raise ValueError("A session must have at least one round.")
+        self.rules = rules
+        self.policy = policy
+        self.starting_bankroll = starting_bankroll
+        self.session_rounds = session_rounds
+        self.simulator = VectorizedSimulator(rules, strategy, lanes=lanes, seed=seed)
+
+    def run(self, sessions: int) -> SessionResults:
+        """Plays a number of sessions.
+
+        Args:
+            sessions (int): The number of sessions to play.
+
+        Returns:
+            SessionResults: The outcome of every session.
+
+        Raises:
+            ValueError: If the number of sessions is not positive.
+        """
+        if sessions <= 0:
+            raise ValueError("There must be at least one session.")
+        start = time.perf_counter()
+        batches = [self._run_batch() for _ in range(-(-sessions // self.simulator.lanes))]
+
+        def column(name: str) -> np.ndarray:
+            return np.concatenate([getattr(batch, name) for batch in batches])[:sessions]
+
+        return SessionResults(
+            starting_bankroll=self.starting_bankroll,
+            final_bankrolls=column("final_bankrolls"),
+            max_drawdowns=column("max_drawdowns"),
+            rounds_played=column("rounds_played"),
+            ruined=column("ruined"),
+            longest_losing_streaks=column("longest_losing_streaks"),
+            elapsed_seconds=time.perf_counter() - start,
+        )
+
+    def _run_batch(self) -> SessionResults:
+        """Plays one session in every lane."""
+        rules = self.rules
+        lanes = self.simulator.lanes
+        bankrolls = np.full(lanes, self.starting_bankroll, dtype=np.int64)
+        peaks = bankrolls.copy()
+        max_drawdowns = np.zeros(lanes, dtype=np.int64)
+        rounds_played = np.zeros(lanes, dtype=np.int64)
+        streaks = np.zeros(lanes, dtype=np.int64)
+        longest_streaks = np.zeros(lanes, dtype=np.int64)
+        ruined = bankrolls < rules.min_bet
+
+        for _ in range(self.session_rounds):
+            if ruined.all():
+                break
+            bets = np.clip(self.policy.bets(bankrolls), rules.min_bet, rules.max_bet)
+            bets = np.minimum(bets, bankrolls)
+            bets[ruined] = 0
+            net = self.simulator.play_round(bets, bankrolls)
+            bankrolls += net
+            streaks = np.where(net < 0, streaks + 1, 0)
+            np.maximum(longest_streaks, streaks, out=longest_streaks)
+            rounds_played += ~ruined
+            np.maximum(peaks, bankrolls, out=peaks)
+            np.maximum(max_drawdowns, peaks - bankrolls, out=max_drawdowns)
+            ruined |= bankrolls < rules.min_bet
+
+        return SessionResults(self.starting_bankroll, bankrolls, max_drawdowns, rounds_played, ruined, longest_streaks)
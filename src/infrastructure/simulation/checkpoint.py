@@ -0,0 +1,297 @@
+"""Checkpoints long simulation runs to disk so they can resume after being killed."""
+
+import io
+import os
+import random
+import struct
+import time
+from typing import BinaryIO, Optional
+from src.domain.Card import CARD_CODES, STANDARD_CARDS
+from src.domain.GameRules import GameRules
+from src.domain.RandomStreams import RandomStreams
+from src.infrastructure.simulation.parallel import (
+    DEFAULT_BLOCK_ROUNDS,
+    StrategyFactory,
+    basic_strategy_factory,
+    block_sizes,
+)
+from src.infrastructure.simulation.simulator import SimulationResult, Simulator
+
+MAGIC = b"BJCP"
+FORMAT_VERSION = 1
+DEFAULT_CHECKPOINT_EVERY = 50_000
+
+_HEADER = struct.Struct("<4sH")
+_RULES = struct.Struct("<d?qqHd")
+_RUN = struct.Struct("<qqqq")
+_RESULT = struct.Struct("<qqd")
+_FLAG = struct.Struct("<?")
+# random.Random state: the version, 624 Mersenne Twister words plus the index,
+# and the cached Gaussian value if there is one.
+_RNG = struct.Struct("<B625I?d")
+_SHOE = struct.Struct("<HHqq")
+
+
+class CheckpointedRun:
+    """Plays the blocks of a run in this process, saving a checkpoint every few rounds.
+
+    The blocks and their random streams are exactly those of `run_parallel`, so
+    a finished run returns the same totals as `run_parallel` with the same master
+    seed and block size. A checkpoint holds the merged results of the finished
+    blocks and, for the block in progress, its partial results, the state of its
+    random number generator, the order of the cards left in the shoe and the
+    discard pile, the shoe id and the player's balance. `resume` rebuilds the run
+    from it and continues with identical results.
+
+    Checkpoints are written to a temporary file that then replaces `path`, so a
+    run killed while saving still leaves the previous checkpoint intact.
+
+    Attributes:
+        path (str): The checkpoint file.
+        block_index (int): The index of the block in progress.
+        merged (SimulationResult): The merged results of the finished blocks.
+        block_result (SimulationResult): The results of the block in progress so far.
+        simulator (Optional[Simulator]): The simulator of the block in progress, or None
+            between blocks.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        rounds: int,
+        master_seed: int,
+        path: str,
+        bet: Optional[int] = None,
+        block_rounds: int = DEFAULT_BLOCK_ROUNDS,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        strategy_factory: StrategyFactory = basic_strategy_factory,
+    ):
+        """Initializes a run from its first block.
+
+        Args:
+            rules (GameRules): The rules of the simulated table.
+            rounds (int): The total number of rounds to play.
+            master_seed (int): The seed of the whole run.
+            path (str): The checkpoint file.
+            bet (Optional[int]): The flat bet. Defaults to `rules.min_bet`.
+            block_rounds (int): The number of rounds per block.
+            checkpoint_every (int): The number of rounds between checkpoints.
+            strategy_factory (StrategyFactory): Builds the strategy for each block.
+
+        Raises:
+            ValueError: If the checkpoint interval is not positive.
+        """
+        if checkpoint_every <= 0:
+            raise ValueError("The checkpoint interval must be positive.")
+        self.rules = rules
+        self.rounds = rounds
+        self.master_seed = master_seed
+        self.path = path
+        self.bet = bet if bet is not None else rules.min_bet
+        self.block_rounds = block_rounds
+        self.checkpoint_every = checkpoint_every
+        self.strategy_factory = strategy_factory
+        self.block_index = 0
+        self.merged = SimulationResult(bet=self.bet)
+        self.block_result = SimulationResult(bet=self.bet)
+        self.simulator: Optional[Simulator] = None
+
+    @classmethod
+    def resume(
+        cls,
+        path: str,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        strategy_factory: StrategyFactory = basic_strategy_factory,
+    ) -> 'CheckpointedRun':
+        """Rebuilds a run from its checkpoint file.
+
+        Args:
+            path (str): The checkpoint file, which later checkpoints overwrite.
+            checkpoint_every (int): The number of rounds between checkpoints.
+            strategy_factory (StrategyFactory): Builds the strategy for each block;
+                it must be the one the run started with.
+
+        Returns:
+            CheckpointedRun: The run, ready to continue where the checkpoint was taken.
+
+        Raises:
+            ValueError: If the file is not a checkpoint of a supported version.
+        """
+        with open(path, "rb") as stream:
+            return cls.read(stream, path, checkpoint_every, strategy_factory)
+
+    @classmethod
+    def read(
+        cls,
+        stream: BinaryIO,
+        path: str,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        strategy_factory: StrategyFactory = basic_strategy_factory,
+    ) -> 'CheckpointedRun':
+        """Rebuilds a run from a checkpoint stream; see `resume`."""
+        magic, version = _unpack(_HEADER, stream)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a simulation checkpoint of a supported version.")
+        payout, hits_soft_17, min_bet, max_bet, num_decks, penetration = _unpack(_RULES, stream)
+        rules = GameRules(payout, hits_soft_17, min_bet, max_bet, num_decks, penetration)
+        rounds, bet, block_rounds, block_index = _unpack(_RUN, stream)
+        run = cls(rules, rounds, _read_int(stream), path, bet, block_rounds, checkpoint_every, strategy_factory)
+        run.block_index = block_index
+        run.merged = _read_result(stream, bet)
+        run.block_result = _read_result(stream, bet)
+        (has_simulator,) = _unpack(_FLAG, stream)
+        if has_simulator:
+            run.simulator = Simulator(rules, strategy_factory(rules), bet=bet, rng=random.Random())
+            _read_simulator(stream, run.simulator)
+        return run
+
+    def write(self, stream: BinaryIO):
+        """Writes the checkpoint of the run to a binary stream."""
+        rules = self.rules
+        stream.write(_HEADER.pack(MAGIC, FORMAT_VERSION))
+        stream.write(_RULES.pack(
+            rules.blackjack_payout,
+            rules.dealer_hits_on_soft_17,
+            rules.min_bet,
+            rules.max_bet,
+            rules.num_decks,
+            rules.reshuffle_penetration,
+        ))
+        stream.write(_RUN.pack(self.rounds, self.bet, self.block_rounds, self.block_index))
+        _write_int(stream, self.master_seed)
+        _write_result(stream, self.merged)
+        _write_result(stream, self.block_result)
+        stream.write(_FLAG.pack(self.simulator is not None))
+        if self.simulator is not None:
+            _write_simulator(stream, self.simulator)
+
+    def save(self):
+        """Writes the checkpoint file, replacing the previous one atomically."""
+        buffer = io.BytesIO()
+        self.write(buffer)
+        temporary = self.path + ".tmp"
+        with open(temporary, "wb") as stream:
+            stream.write(buffer.getvalue())
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temporary, self.path)
+
+    @property
+    def rounds_played(self) -> int:
+        """The number of rounds played so far, across every session of the run."""
+        return self.merged.rounds + self.block_result.rounds
+
+    @property
+    def finished(self) -> bool:
+        """True once every block has been played."""
+        return self.rounds_played >= self.rounds
+
+    def run(self, max_rounds: Optional[int] = None) -> SimulationResult:
+        """Plays the rest of the run, saving a checkpoint every `checkpoint_every` rounds.
+
+        Args:
+            max_rounds (Optional[int]): Stop after this many rounds in this call, with a
+                checkpoint, even if the run is not finished. Plays to the end if None.
+
+        Returns:
+            SimulationResult: The merged results of all rounds played so far.
+            `elapsed_seconds` adds up the time of every session of the run.
+        """
+        sizes = block_sizes(self.rounds, self.block_rounds)
+        budget = self.rounds if max_rounds is None else max_rounds
+        since_checkpoint = 0
+        while self.block_index < len(sizes) and budget > 0:
+            if self.simulator is None:
+                rng = RandomStreams(self.master_seed).spawn(self.block_index)
+                self.simulator = Simulator(self.rules, self.strategy_factory(self.rules), bet=self.bet, rng=rng)
+                self.block_result = SimulationResult(bet=self.bet)
+            chunk = min(
+                sizes[self.block_index] - self.block_result.rounds,
+                self.checkpoint_every - since_checkpoint,
+                budget,
+            )
+            self.block_result = self.block_result.merge(self.simulator.run(chunk))
+            since_checkpoint += chunk
+            budget -= chunk
+            if self.block_result.rounds == sizes[self.block_index]:
+                self.merged = self.merged.merge(self.block_result)
+                self.block_result = SimulationResult(bet=self.bet)
+                self.block_index += 1
+                self.simulator = None
+            if since_checkpoint >= self.checkpoint_every:
+                start = time.perf_counter()
+                self.save()
+                self.merged.elapsed_seconds += time.perf_counter() - start
+                since_checkpoint = 0
+        self.save()
+        return self.merged.merge(self.block_result)
+
+
+def _unpack(layout: struct.Struct, stream: BinaryIO) -> tuple:
+    """Reads one fixed-size record from a stream."""
+    data = stream.read(layout.size)
+    if len(data) != layout.size:
+        raise ValueError("The checkpoint is truncated.")
+    return layout.unpack(data)
+
+
+def _write_int(stream: BinaryIO, value: int):
+    """Writes an integer of any size as a length-prefixed signed big-endian number."""
+    data = value.to_bytes(value.bit_length() // 8 + 1, "big", signed=True)
+    stream.write(struct.pack("<B", len(data)) + data)
+
+
+def _read_int(stream: BinaryIO) -> int:
+    """Reads an integer written by `_write_int`."""
+    (length,) = _unpack(struct.Struct("<B"), stream)
+    data = stream.read(length)
+    if len(data) != length:
+        raise ValueError("The checkpoint is truncated.")
+    return int.from_bytes(data, "big", signed=True)
+
+
+def _write_result(stream: BinaryIO, result: SimulationResult):
+    """Writes the accumulators of a result; the bet is stored once for the run."""
+    stream.write(_RESULT.pack(result.rounds, result.hands, result.elapsed_seconds))
+    _write_int(stream, result.net)
+    _write_int(stream, result.net_squared)
+
+
+def _read_result(stream: BinaryIO, bet: int) -> SimulationResult:
+    """Reads a result written by `_write_result`."""
+    rounds, hands, elapsed_seconds = _unpack(_RESULT, stream)
+    net = _read_int(stream)
+    net_squared = _read_int(stream)
+    return SimulationResult(rounds, hands, bet, net, net_squared, elapsed_seconds)
+
+
+def _write_simulator(stream: BinaryIO, simulator: Simulator):
+    """Writes the random number generator, shoe and player of a simulator between rounds."""
+    deck = simulator.game.deck
+    version, words, gauss_next = deck.rng.getstate()
+    stream.write(_RNG.pack(version, *words, gauss_next is not None, gauss_next or 0.0))
+    stream.write(_SHOE.pack(len(deck.cards), len(deck.discard_pile), simulator.shoe_id, simulator.player.balance))
+    stream.write(bytes(CARD_CODES[card] for card in deck.cards))
+    stream.write(bytes(CARD_CODES[card] for card in deck.discard_pile))
+
+
+def _read_simulator(stream: BinaryIO, simulator: Simulator):
+    """Restores a simulator from the state written by `_write_simulator`."""
+    fields = _unpack(_RNG, stream)
+    version, words, has_gauss, gauss_next = fields[0], fields[1:626], fields[626], fields[627]
+    cards_count, discard_count, shoe_id, balance = _unpack(_SHOE, stream)
+    cards = stream.read(cards_count)
+    discard_pile = stream.read(discard_count)
+    if len(cards) != cards_count or len(discard_pile) != discard_count:
+        raise ValueError("The checkpoint is truncated.")
+
+    deck = simulator.game.deck
+    deck.rng.setstate((version, tuple(words), gauss_next if has_gauss else None))
+    deck.cards = [STANDARD_CARDS[code] for code in cards]
+    deck.discard_pile = [STANDARD_CARDS[code] for code in discard_pile]
+    # The composition is the full shoe minus every card dealt since the last shuffle.
+    deck.composition.reset(deck.num_decks)
+    for card in deck.discard_pile:
+        deck.composition.remove(card.value)
+    simulator.shoe_id = shoe_id
+    simulator.player.balance = balance
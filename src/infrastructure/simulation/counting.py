@@ -0,0 +1,182 @@
+"""Simulates a card counter who sizes bets and deviates from basic strategy by the count."""
+
+import dataclasses
+import math
+import random
+import time
+from typing import Dict, Optional, Sequence, Tuple
+from src.application.basic_strategy import BasicStrategy
+from src.application.index_plays import DeviationCharts, IndexPlay, ILLUSTRIOUS_18, MAX_TRUE_COUNT
+from src.domain.CountingSystem import CountingSystem, HI_LO
+from src.domain.Deck import Deck
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.infrastructure.simulation.round_kernel import LeanRoundKernel
+from src.infrastructure.simulation.statistics import RunningStats
+
+# A 1-8 spread: one unit up to a true count of 1, then 2, 4, 6 and 8 units.
+DEFAULT_RAMP: Tuple[Tuple[int, int], ...] = ((2, 2), (3, 4), (4, 6), (5, 8))
+
+
+class BetSpread:
+    """Bets a number of units that rises with the true count.
+
+    Attributes:
+        unit (int): The bet of one unit.
+        ramp (Tuple[Tuple[int, int], ...]): `(true_count, units)` steps in increasing
+            order; a step applies from its floored true count upwards.
+    """
+
+    def __init__(self, unit: int, ramp: Sequence[Tuple[int, int]] = DEFAULT_RAMP):
+        """Initializes the spread.
+
+        Args:
+            unit (int): The bet of one unit.
+            ramp (Sequence[Tuple[int, int]]): `(true_count, units)` steps. Below the first
+                step the bet is one unit.
+        """
+        self.unit = unit
+        self.ramp = tuple(sorted(ramp))
+
+    def bet(self, true_count: float) -> int:
+        """Returns the bet for a true count."""
+        bucket = math.floor(true_count)
+        units = 1
+        for threshold, step_units in self.ramp:
+            if bucket < threshold:
+                break
+            units = step_units
+        return units * self.unit
+
+    @property
+    def max_bet(self) -> int:
+        """The largest bet of the spread."""
+        return max([1] + [units for _, units in self.ramp]) * self.unit
+
+
+@dataclasses.dataclass
+class CountingResult:
+    """Aggregated results of a counting simulation.
+
+    Attributes:
+        rounds (int): The number of rounds played.
+        hands (int): The number of player hands played, counting split hands.
+        unit (int): The betting unit.
+        wagered (int): The sum of the initial bets.
+        net (int): The player's total winnings (negative for losses).
+        by_true_count (Dict[int, RunningStats]): The winnings per round in units of
+            its initial bet, by floored true count at the time of the bet.
+        elapsed_seconds (float): The wall-clock time spent playing.
+    """
+
+    rounds: int = 0
+    hands: int = 0
+    unit: int = 0
+    wagered: int = 0
+    net: int = 0
+    by_true_count: Dict[int, RunningStats] = dataclasses.field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def win_rate_per_100_hands(self) -> float:
+        """The player's winnings per 100 hands, in units."""
+        if not self.hands:
+            return 0.0
+        return 100 * self.net / (self.hands * self.unit)
+
+    @property
+    def advantage(self) -> float:
+        """The player's winnings per unit of initial bet wagered."""
+        return self.net / self.wagered if self.wagered else 0.0
+
+    @property
+    def average_bet(self) -> float:
+        """The average initial bet, in units."""
+        return self.wagered / (self.rounds * self.unit) if self.rounds else 0.0
+
+    @property
+    def hands_per_minute(self) -> float:
+        """The simulation throughput."""
+        return 60 * self.hands / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class CountingSimulator:
+    """Plays a counter's rounds on a `Deck` with the lean round kernel.
+
+    Before each round the shoe is reshuffled at `rules.reshuffle_penetration`, as
+    in `StartRound`. The bet is then sized from the shoe's true count. During
+    the round, the decisions use index plays against the true count of the cards
+    the player has seen.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        strategy: BasicStrategy,
+        spread: BetSpread,
+        system: CountingSystem = HI_LO,
+        plays: Sequence[IndexPlay] = ILLUSTRIOUS_18,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initializes the simulator.
+
+        Args:
+            rules (GameRules): The rules of the simulated table.
+            strategy (BasicStrategy): The chart played when no deviation applies.
+            spread (BetSpread): Sizes each bet from the true count.
+            system (CountingSystem): The counting system the shoe tracks.
+            plays (Sequence[IndexPlay]): The index plays; empty for basic strategy only.
+            rng (Optional[random.Random]): The random number generator for the shoe.
+
+        Raises:
+            ValueError: If the spread goes outside the table limits.
+        """
+        if spread.unit < rules.min_bet or spread.max_bet > rules.max_bet:
+            raise ValueError("The bet spread must stay within the table limits.")
+        self.rules = rules
+        self.spread = spread
+        self.deck = Deck(rules.num_decks, rng=rng, counting_system=system)
+        # Enough for the deepest split-and-double sequence of any round.
+        self.bankroll = spread.max_bet * 1_000
+        self.player = Player(balance=self.bankroll)
+        self.kernel = LeanRoundKernel(
+            Game([self.player], rules, deck=self.deck),
+            strategy,
+            [spread.unit],
+            deviations=DeviationCharts(strategy, plays) if plays else None,
+        )
+
+    def run(self, rounds: int) -> CountingResult:
+        """Plays a number of rounds.
+
+        Args:
+            rounds (int): The number of rounds to play.
+
+        Returns:
+            CountingResult: The aggregated results.
+        """
+        deck, rules, kernel, player = self.deck, self.rules, self.kernel, self.player
+        result = CountingResult(unit=self.spread.unit)
+        by_true_count = result.by_true_count
+        start = time.perf_counter()
+        for _ in range(rounds):
+            if 1.0 - deck.cards_remaining / deck.total_cards >= rules.reshuffle_penetration:
+                deck.reshuffle(in_play=0)
+            true_count = deck.true_count
+            bet = self.spread.bet(true_count)
+            kernel.bets[0] = bet
+            player.balance = self.bankroll
+            net = kernel.play_round()
+
+            result.rounds += 1
+            result.hands += kernel.num_hands[0]
+            result.wagered += bet
+            result.net += net
+            bucket = min(max(math.floor(true_count), -MAX_TRUE_COUNT), MAX_TRUE_COUNT)
+            stats = by_true_count.get(bucket)
+            if stats is None:
+                stats = by_true_count[bucket] = RunningStats()
+            stats.add(net / bet)
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
@@ -0,0 +1,196 @@
+"""Compares strategies and rule variants on common random numbers."""
+
+import dataclasses
+import time
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
+from src.application.basic_strategy import BasicStrategy
+from src.domain.GameRules import GameRules
+from src.domain.RandomStreams import RandomStreams
+from src.infrastructure.simulation.statistics import DEFAULT_CONFIDENCE, RunningStats
+from src.infrastructure.simulation.vectorized import DEFAULT_LANES, VectorizedSimulator
+
+
+def derived_seeds(seed: Union[int, np.random.Generator, None], count: int) -> Tuple[int, ...]:
+    """Derives the seeds of simulators that accompany one seeded with `seed`.
+
+    The seeds are the `RandomStreams` seeds for keys 1 to `count`, with `seed`
+    as the master seed. A NumPy generator, or None for fresh entropy, first
+    supplies an integer master seed.
+
+    Args:
+        seed (Union[int, np.random.Generator, None]): The seed of the main simulator.
+        count (int): The number of seeds to derive.
+
+    Returns:
+        Tuple[int, ...]: One seed per accompanying simulator.
+    """
+    master_seed = seed if isinstance(seed, int) else int(np.random.default_rng(seed).integers(2**63))
+    streams = RandomStreams(master_seed)
+    return tuple(streams.seed_for(key) for key in range(1, count + 1))
+
+
+@dataclasses.dataclass(frozen=True)
+class Variant:
+    """One strategy and rule set to compare.
+
+    Attributes:
+        name (str): The label of the variant in reports.
+        rules (GameRules): The rules of the table.
+        strategy (BasicStrategy): The chart the player follows.
+        bet (Optional[int]): The flat bet. Defaults to `rules.min_bet`.
+    """
+
+    name: str
+    rules: GameRules
+    strategy: BasicStrategy
+    bet: Optional[int] = None
+
+
+@dataclasses.dataclass
+class PairedComparison:
+    """Per-round results of several variants played on the same cards.
+
+    All values are per round, in units of each variant's initial bet.
+
+    Attributes:
+        names (Tuple[str, ...]): The variant names; the first is the baseline.
+        results (Tuple[RunningStats, ...]): The winnings of each variant.
+        differences (Tuple[RunningStats, ...]): The round-by-round winnings of each
+            variant minus the baseline's, starting with the second variant.
+        elapsed_seconds (float): The wall-clock time spent playing.
+    """
+
+    names: Tuple[str, ...]
+    results: Tuple[RunningStats, ...]
+    differences: Tuple[RunningStats, ...]
+    elapsed_seconds: float = 0.0
+
+    def difference_interval(self, variant: int, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+        """Returns the confidence interval of a variant's EV minus the baseline's.
+
+        Args:
+            variant (int): The index of the variant, 1 or above.
+            confidence (float): The confidence level.
+
+        Returns:
+            Tuple[float, float]: The lower and upper bounds.
+        """
+        return self.differences[variant - 1].confidence_interval(confidence)
+
+    def variance_reduction(self, variant: int) -> float:
+        """Returns how many times fewer rounds pairing needs than independent runs.
+
+        Independent runs would estimate the difference with the sum of both
+        variances; paired rounds with the variance of the differences.
+
+        Args:
+            variant (int): The index of the variant, 1 or above.
+
+        Returns:
+            float: The ratio of the two variances (infinite for identical variants).
+        """
+        independent = self.results[0].variance + self.results[variant].variance
+        paired = self.differences[variant - 1].variance
+        return independent / paired if paired else float('inf')
+
+
+class PairedSimulator:
+    """Plays several variants on the same shoes in one pass.
+
+    Every round, all variants start from the same position of the same shoe in
+    every lane. Each variant plays the round with its own rules and chart, and
+    the shoe then advances by the cards the baseline (the first variant) used.
+    The baseline therefore plays exactly like a standalone `VectorizedSimulator`
+    with the same integer seed. The other variants replay its rounds card for
+    card until their decisions diverge.
+
+    The variants must share the shoe, so their number of decks and reshuffle
+    penetration must match; payouts, soft-17 rules, charts and bets may differ.
+    A lane that runs out of cards in the middle of a round, which only happens
+    at penetrations close to 1, is reshuffled by whichever variant reaches the
+    end first, so that round is no longer paired.
+    """
+
+    def __init__(
+        self,
+        variants: Sequence[Variant],
+        lanes: int = DEFAULT_LANES,
+        seed: Union[int, np.random.Generator, None] = None,
+    ):
+        """Initializes the simulator.
+
+        Args:
+            variants (Sequence[Variant]): The variants to compare; the first is the baseline.
+            lanes (int): The number of shoes played side by side.
+            seed (Union[int, np.random.Generator, None]): A seed or NumPy generator
+                for reproducible shoes. The other variants' seeds are derived from it
+                with `derived_seeds`.
+
+        Raises:
+            ValueError: If there are fewer than two variants or they cannot share a shoe.
+        """
+        if len(variants) < 2:
+            raise ValueError("At least two variants are needed for a comparison.")
+        baseline = variants[0].rules
+        for variant in variants[1:]:
+            if (variant.rules.num_decks, variant.rules.reshuffle_penetration) != (
+                baseline.num_decks,
+                baseline.reshuffle_penetration,
+            ):
+                raise ValueError("Paired variants must use the same number of decks and reshuffle penetration.")
+
+        self.variants = tuple(variants)
+        seeds = (seed, *derived_seeds(seed, len(variants) - 1))
+        self.simulators = [
+            VectorizedSimulator(variant.rules, variant.strategy, bet=variant.bet, lanes=lanes, seed=variant_seed)
+            for variant, variant_seed in zip(variants, seeds)
+        ]
+        shared = self.simulators[0]
+        for simulator in self.simulators[1:]:
+            simulator.shoes = shared.shoes
+
+    def play_round(self) -> Tuple[np.ndarray, ...]:
+        """Plays one round of every variant on the same cards.
+
+        Returns:
+            Tuple[np.ndarray, ...]: The winnings of each variant in each lane.
+        """
+        baseline = self.simulators[0]
+        baseline.reshuffle_spent_shoes()
+
+        start = baseline.positions.copy()
+        nets = [baseline.play_round()]
+        for simulator in self.simulators[1:]:
+            simulator.positions[:] = start
+            nets.append(simulator.play_round())
+        return tuple(nets)
+
+    def run(self, rounds: int) -> PairedComparison:
+        """Plays at least the requested number of rounds, in lockstep batches.
+
+        Args:
+            rounds (int): The minimum number of rounds to play. The total is rounded
+                up to a whole number of batches of `lanes` rounds.
+
+        Returns:
+            PairedComparison: The results of every variant and the paired differences.
+        """
+        results = [RunningStats() for _ in self.variants]
+        differences = [RunningStats() for _ in self.variants[1:]]
+        bets = [simulator.bet for simulator in self.simulators]
+        played = 0
+        start = time.perf_counter()
+        while played < rounds:
+            nets = [net / bet for net, bet in zip(self.play_round(), bets)]
+            for index, net in enumerate(nets):
+                results[index] = results[index].merge(RunningStats.of(net))
+            for index, net in enumerate(nets[1:]):
+                differences[index] = differences[index].merge(RunningStats.of(net - nets[0]))
+            played += self.simulators[0].lanes
+        return PairedComparison(
+            names=tuple(variant.name for variant in self.variants),
+            results=tuple(results),
+            differences=tuple(differences),
+            elapsed_seconds=time.perf_counter() - start,
+        )
@@ -0,0 +1,273 @@
+"""Runs simulations across processes with results independent of the worker count."""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+from src.domain.GameRules import GameRules
+from src.domain.RandomStreams import RandomStreams
+from src.infrastructure.simulation.records import RoundRecord
+from src.infrastructure.simulation.simulator import Simulator, SimulationResult
+from src.infrastructure.simulation.statistics import DEFAULT_CONFIDENCE, RoundStatistics
+from src.infrastructure.simulation.strategies import BasicStrategyPlayer, PlayerStrategy
+from src.infrastructure.strategy_store import StrategyStore
+
+DEFAULT_BLOCK_ROUNDS = 10_000
+
+StrategyFactory = Callable[[GameRules], PlayerStrategy]
+
+# One store per cache directory, shared by every block a process plays. Workers
+# memory-map the charts from the on-disk cache, so a chart is compiled only if
+# no process has saved it yet.
+_strategy_stores: Dict[Optional[Path], StrategyStore] = {}
+
+
+class BasicStrategyFactory:
+    """Builds basic-strategy players, loading their charts through a `StrategyStore`.
+
+    Only the cache directory is pickled, so the factory can be handed to worker
+    processes; each process then opens one store per directory.
+
+    Attributes:
+        directory (Optional[Path]): The chart cache directory, or None for the
+            `StrategyStore` default.
+    """
+
+    def __init__(self, directory: Union[str, Path, None] = None):
+        """Initializes the factory.
+
+        Args:
+            directory (Union[str, Path, None]): The chart cache directory. Defaults
+                to the `StrategyStore` default.
+        """
+        self.directory = Path(directory) if directory is not None else None
+
+    def __call__(self, rules: GameRules) -> PlayerStrategy:
+        """Returns a basic-strategy player for the rules.
+
+        Args:
+            rules (GameRules): The rules of the simulated table.
+
+        Returns:
+            PlayerStrategy: A player following the chart for these rules.
+        """
+        store = _strategy_stores.get(self.directory)
+        if store is None:
+            store = _strategy_stores[self.directory] = StrategyStore(self.directory)
+        return BasicStrategyPlayer(store.load_or_compile(rules))
+
+
+# The default factory, caching charts in the `StrategyStore` default directory.
+basic_strategy_factory = BasicStrategyFactory()
+
+
+def run_block(
+    rules: GameRules,
+    strategy_factory: StrategyFactory,
+    bet: Optional[int],
+    master_seed: int,
+    block_index: int,
+    rounds: int,
+) -> SimulationResult:
+    """Plays one block of rounds on its own shoe stream.
+
+    A block always starts from a freshly shuffled shoe seeded from the master seed
+    and its index, so its results do not depend on which worker plays it.
+
+    Args:
+        rules (GameRules): The rules of the simulated table.
+        strategy_factory (StrategyFactory): Builds the strategy for the block.
+        bet (Optional[int]): The flat bet. Defaults to `rules.min_bet`.
+        master_seed (int): The seed of the whole run.
+        block_index (int): The index of the block within the run.
+        rounds (int): The number of rounds in the block.
+
+    Returns:
+        SimulationResult: The results of the block.
+    """
+    rng = RandomStreams(master_seed).spawn(block_index)
+    return Simulator(rules, strategy_factory(rules), bet=bet, rng=rng).run(rounds)
+
+
+def block_sizes(rounds: int, block_rounds: int) -> Tuple[int, ...]:
+    """Splits a number of rounds into fixed-size blocks, the last one possibly shorter."""
+    full_blocks, remainder = divmod(rounds, block_rounds)
+    return (block_rounds,) * full_blocks + ((remainder,) if remainder else ())
+
+
+def run_parallel(
+    rules: GameRules,
+    rounds: int,
+    master_seed: int,
+    workers: int = 1,
+    strategy_factory: StrategyFactory = basic_strategy_factory,
+    bet: Optional[int] = None,
+    block_rounds: int = DEFAULT_BLOCK_ROUNDS,
+) -> SimulationResult:
+    """Shards a simulation across a process pool.
+
+    The rounds are cut into blocks of `block_rounds`, and each block gets its own
+    random stream derived from the master seed and the block index. Block results
+    are merged in block order with exact integer arithmetic. For a given master
+    seed and block size, every total is therefore bit-identical whatever the
+    number of workers. Only the timing differs.
+
+    Args:
+        rules (GameRules): The rules of the simulated table.
+        rounds (int): The total number of rounds to play.
+        master_seed (int): The seed of the whole run.
+        workers (int): The number of worker processes. With 1, blocks run in this process.
+        strategy_factory (StrategyFactory): A picklable callable that builds the strategy.
+        bet (Optional[int]): The flat bet. Defaults to `rules.min_bet`.
+        block_rounds (int): The number of rounds per block.
+
+    Returns:
+        SimulationResult: The merged results, with `elapsed_seconds` set to the wall-clock time.
+    """
+    sizes = block_sizes(rounds, block_rounds)
+    start = time.perf_counter()
+
+    if workers <= 1:
+        block_results = [
+            run_block(rules, strategy_factory, bet, master_seed, index, size) for index, size in enumerate(sizes)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(run_block, rules, strategy_factory, bet, master_seed, index, size)
+                for index, size in enumerate(sizes)
+            ]
+            block_results = [future.result() for future in futures]
+
+    merged = SimulationResult(bet=bet if bet is not None else rules.min_bet)
+    for block_result in block_results:
+        merged = merged.merge(block_result)
+    merged.elapsed_seconds = time.perf_counter() - start
+    return merged
+
+
+def stream_records(
+    rules: GameRules,
+    rounds: int,
+    master_seed: int,
+    strategy_factory: StrategyFactory = basic_strategy_factory,
+    bet: Optional[int] = None,
+    block_rounds: int = DEFAULT_BLOCK_ROUNDS,
+) -> Iterator[RoundRecord]:
+    """Plays the blocks of a run one after another, yielding a record per round.
+
+    The rounds are exactly those `run_parallel` plays for the same master seed and
+    block size. Round indices, shoe ids and the running balance continue across
+    blocks, and only one round is held in memory at a time.
+
+    Args:
+        rules (GameRules): The rules of the simulated table.
+        rounds (int): The total number of rounds to play.
+        master_seed (int): The seed of the whole run.
+        strategy_factory (StrategyFactory): Builds the strategy for each block.
+        bet (Optional[int]): The flat bet. Defaults to `rules.min_bet`.
+        block_rounds (int): The number of rounds per block.
+
+    Yields:
+        RoundRecord: The record of each round, in order.
+    """
+    first_round = 0
+    shoe_id = 0
+    running_balance = None
+    for index, size in enumerate(block_sizes(rounds, block_rounds)):
+        rng = RandomStreams(master_seed).spawn(index)
+        simulator = Simulator(rules, strategy_factory(rules), bet=bet, rng=rng)
+        simulator.shoe_id = shoe_id
+        if running_balance is not None:
+            simulator.running_balance = running_balance
+        yield from simulator.records(size, start=first_round)
+        first_round += size
+        shoe_id = simulator.shoe_id + 1
+        running_balance = simulator.running_balance
+
+
+def run_block_statistics(
+    rules: GameRules,
+    strategy_factory: StrategyFactory,
+    bet: Optional[int],
+    master_seed: int,
+    block_index: int,
+    rounds: int,
+) -> RoundStatistics:
+    """Plays one block of rounds like `run_block`, into running statistics.
+
+    Args:
+        rules (GameRules): The rules of the simulated table.
+        strategy_factory (StrategyFactory): Builds the strategy for the block.
+        bet (Optional[int]): The flat bet. Defaults to `rules.min_bet`.
+        master_seed (int): The seed of the whole run.
+        block_index (int): The index of the block within the run.
+        rounds (int): The number of rounds in the block.
+
+    Returns:
+        RoundStatistics: The statistics of the block.
+    """
+    rng = RandomStreams(master_seed).spawn(block_index)
+    return Simulator(rules, strategy_factory(rules), bet=bet, rng=rng).run_statistics(rounds)
+
+
+def run_until_precision(
+    rules: GameRules,
+    target_precision: float,
+    master_seed: int,
+    max_rounds: int,
+    workers: int = 1,
+    strategy_factory: StrategyFactory = basic_strategy_factory,
+    bet: Optional[int] = None,
+    confidence: float = DEFAULT_CONFIDENCE,
+    block_rounds: int = DEFAULT_BLOCK_ROUNDS,
+) -> RoundStatistics:
+    """Plays seeded blocks until the house edge is known to a target precision.
+
+    Blocks are played in waves of one block per worker, and their statistics
+    are merged in block order. The run stops after the first block whose merged
+    statistics reach the target; blocks beyond it that were already played are
+    discarded. The result therefore depends only on the master seed and block
+    size, not on the number of workers.
+
+    Args:
+        rules (GameRules): The rules of the simulated table.
+        target_precision (float): The largest acceptable half-width of the house edge
+            confidence interval, in units of the initial bet.
+        master_seed (int): The seed of the whole run.
+        max_rounds (int): The number of rounds after which to stop regardless.
+        workers (int): The number of worker processes. With 1, blocks run in this process.
+        strategy_factory (StrategyFactory): A picklable callable that builds the strategy.
+        bet (Optional[int]): The flat bet. Defaults to `rules.min_bet`.
+        confidence (float): The confidence level of the interval.
+        block_rounds (int): The number of rounds per block.
+
+    Returns:
+        RoundStatistics: The merged statistics of the blocks played.
+    """
+    sizes = block_sizes(max_rounds, block_rounds)
+    wave = max(workers, 1)
+    merged = RoundStatistics()
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for first in range(0, len(sizes), wave):
+            indices = range(first, min(first + wave, len(sizes)))
+            if executor is None:
+                results = (
+                    run_block_statistics(rules, strategy_factory, bet, master_seed, index, sizes[index])
+                    for index in indices
+                )
+            else:
+                futures = [
+                    executor.submit(run_block_statistics, rules, strategy_factory, bet, master_seed, index, sizes[index])
+                    for index in indices
+                ]
+                results = (future.result() for future in futures)
+            for block_statistics in results:
+                merged = merged.merge(block_statistics)
+                if merged.precision(confidence) <= target_precision:
+                    return merged
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return merged
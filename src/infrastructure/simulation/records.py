@@ -0,0 +1,51 @@
+"""Per-round records emitted by a streaming simulation."""
+
+import dataclasses
+from typing import Tuple
+from src.domain.Card import Card
+from src.domain.Hand import Hand
+
+RECORD_FIELDS = ("round", "shoe_id", "player_hands", "dealer_hand", "actions", "bet", "payout", "balance")
+NUMERIC_FIELDS = ("round", "shoe_id", "bet", "payout", "balance")
+
+_SHORT_RANKS = {"Jack": "J", "Queen": "Q", "King": "K", "Ace": "A"}
+
+
+@dataclasses.dataclass(frozen=True)
+class RoundRecord:
+    """The outcome of one simulated round.
+
+    Cards are written as short labels such as `'AS'` or `'10H'`.
+
+    Attributes:
+        round (int): The index of the round within the run.
+        shoe_id (int): The index of the shoe the round was dealt from; it increases
+            every time the shoe is reshuffled.
+        player_hands (Tuple[Tuple[str, ...], ...]): The player's final hands,
+            including split hands.
+        dealer_hand (Tuple[str, ...]): The dealer's final hand.
+        actions (Tuple[str, ...]): The actions the player took, in order.
+        bet (int): The initial bet.
+        payout (int): The player's winnings for the round (negative for a loss).
+        balance (int): The player's running balance after the round: the starting
+            bankroll plus the winnings of every round so far.
+    """
+
+    round: int
+    shoe_id: int
+    player_hands: Tuple[Tuple[str, ...], ...]
+    dealer_hand: Tuple[str, ...]
+    actions: Tuple[str, ...]
+    bet: int
+    payout: int
+    balance: int
+
+
+def card_label(card: Card) -> str:
+    """Returns the short label of a card, e.g. `'QD'` for the Queen of Diamonds."""
+    return _SHORT_RANKS.get(card.rank, card.rank) + card.suit[0]
+
+
+def hand_labels(hand: Hand) -> Tuple[str, ...]:
+    """Returns the short labels of the cards in a hand."""
+    return tuple(card_label(card) for card in hand.cards)
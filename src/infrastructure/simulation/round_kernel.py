@@ -0,0 +1,339 @@
+"""An allocation-free round loop for high-volume simulation."""
+
+from typing import List, Optional, Sequence
+from src.application.basic_strategy import (
+    BasicStrategy,
+    HIT,
+    STAND,
+    DOUBLE_OR_HIT,
+    UPCARDS,
+    SOFT_OFFSET,
+    PAIR_OFFSET,
+)
+from src.application.index_plays import DeviationCharts
+from src.domain.Card import RANKS, STANDARD_CARDS
+from src.domain.Game import Game
+from src.domain.GameState import HandStatus
+
+CARD_VALUES = tuple(card.value for card in STANDARD_CARDS)
+# Cards are laid out suit-major, so the rank of a card code is its position within a suit.
+CARD_RANKS = tuple(code % len(RANKS) for code in range(len(STANDARD_CARDS)))
+
+# Hand states as plain ints, with the values of the reference `HandStatus`.
+PLAYING = HandStatus.PLAYING.value
+STOOD = HandStatus.STAND.value
+BUSTED = HandStatus.BUSTED.value
+WON = HandStatus.WIN.value
+LOST = HandStatus.LOSE.value
+PUSHED = HandStatus.PUSH.value
+STATUS_NAMES = tuple(HandStatus(status).label for status in range(PUSHED + 1))
+
+DEFAULT_HAND_CAPACITY = 8
+
+
+class LeanRoundKernel:
+    """Plays complete rounds on integer card codes with preallocated per-seat hands.
+
+    The kernel reproduces the reference round: `StartRound` (reshuffle check and
+    casino dealing order), `PlayerAction` (hit, stand, double down and split,
+    including resplits and their balance checks), `DealerPlays` and
+    `DetermineOutcome` (including the `int()` truncation of blackjack payouts).
+    Decisions come straight from a `BasicStrategy` chart, with the same choices
+    as `BasicStrategyPlayer`. With `deviations`, each decision instead uses the
+    chart for the true count the player can see: every card dealt so far except
+    the dealer's hole card.
+
+    It deals from `game.deck` and updates the balances of `game.players`, but it
+    keeps its own hand state in preallocated lists that are reset in place. A
+    round therefore builds no `Hand` objects, bet dictionaries or action
+    strings. The `Player` and `Dealer` hands of the game are left untouched.
+
+    Attributes:
+        game (Game): The game whose shoe, rules and players are used.
+        bets (List[int]): The bet of each seat, in player order. Callers may change
+            them between rounds, within the table limits.
+        num_hands (List[int]): The number of hands each seat played in the last round.
+        statuses (List[List[int]]): The final state of each seat's hands in the last round.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        strategy: BasicStrategy,
+        bets: Sequence[int],
+        hand_capacity: int = DEFAULT_HAND_CAPACITY,
+        deviations: Optional[DeviationCharts] = None,
+    ):
+        """Initializes the kernel and validates the bets once.
+
+        Args:
+            game (Game): The game whose shoe, rules and players are used.
+            strategy (BasicStrategy): The chart the players follow.
+            bets (Sequence[int]): The flat bet of each seat.
+            hand_capacity (int): The number of hands preallocated per seat. Seats that
+                split into more hands grow their storage once.
+            deviations (Optional[DeviationCharts]): Count-dependent charts that replace
+                `strategy` when given.
+
+        Raises:
+            ValueError: If the number of bets does not match the players or a bet is
+                outside the table limits.
+        """
+        if len(bets) != len(game.players):
+            raise ValueError("There must be exactly one bet per player.")
+        for amount in bets:
+            if not (game.rules.min_bet <= amount <= game.rules.max_bet):
+                raise ValueError("Bet is not within the table limits.")
+
+        self.game = game
+        self.table = strategy.table
+        self.deviations = deviations
+        self.bets = list(bets)
+        seats = len(bets)
+        self.num_hands = [0] * seats
+        self.statuses = [[PLAYING] * hand_capacity for _ in range(seats)]
+        self._hard = [[0] * hand_capacity for _ in range(seats)]
+        self._aces = [[0] * hand_capacity for _ in range(seats)]
+        self._cards = [[0] * hand_capacity for _ in range(seats)]
+        self._first_rank = [[0] * hand_capacity for _ in range(seats)]
+        self._second_rank = [[0] * hand_capacity for _ in range(seats)]
+        self._first_value = [[0] * hand_capacity for _ in range(seats)]
+        self._hand_bets = [[0] * hand_capacity for _ in range(seats)]
+        self.dealer_status = PLAYING
+
+    def play_round(self) -> int:
+        """Plays one complete round for every seat.
+
+        Returns:
+            int: The combined winnings of all seats for the round.
+
+        Raises:
+            ValueError: If a player cannot cover their bet. Nothing has been dealt
+                or deducted when this is raised.
+        """
+        game = self.game
+        deck = game.deck
+        rules = game.rules
+        deal = deck.deal_code
+        players = game.players
+        seats = len(players)
+        values = CARD_VALUES
+        ranks = CARD_RANKS
+        hard_of, aces_of, cards_of = self._hard, self._aces, self._cards
+        first_rank_of, second_rank_of, first_value_of = self._first_rank, self._second_rank, self._first_value
+        bets_of, statuses_of = self._hand_bets, self.statuses
+        num_hands = self.num_hands
+
+        # GameController.place_bets: every seat must be able to cover its bet.
+        for seat in range(seats):
+            if players[seat].balance < self.bets[seat]:
+                raise ValueError("Insufficient balance to place this bet.")
+
+        # StartRound: clear the table and reshuffle at the penetration point.
+        deck.begin_round()
+        if 1.0 - deck.cards_remaining / deck.total_cards >= rules.reshuffle_penetration:
+            deck.reshuffle()
+
+        # PlaceBet: one hand per seat.
+        balance_before = 0
+        for seat in range(seats):
+            player = players[seat]
+            balance_before += player.balance
+            player.balance -= self.bets[seat]
+            num_hands[seat] = 1
+            bets_of[seat][0] = self.bets[seat]
+            statuses_of[seat][0] = PLAYING
+            hard_of[seat][0] = aces_of[seat][0] = cards_of[seat][0] = 0
+
+        # Casino dealing order: one card to each seat, then the dealer, twice.
+        opening = deck.deal_codes(2 * (seats + 1))
+        dealer_hard = dealer_aces = 0
+        upcard = hole = 0
+        for deal_pass in range(2):
+            first = deal_pass * (seats + 1)
+            for seat in range(seats):
+                code = opening[first + seat]
+                value = values[code]
+                if value == 11:
+                    aces_of[seat][0] += 1
+                    hard_of[seat][0] += 1
+                else:
+                    hard_of[seat][0] += value
+                if deal_pass == 0:
+                    first_rank_of[seat][0] = ranks[code]
+                    first_value_of[seat][0] = value
+                else:
+                    second_rank_of[seat][0] = ranks[code]
+                cards_of[seat][0] = deal_pass + 1
+            code = opening[first + seats]
+            value = values[code]
+            if deal_pass == 0:
+                upcard = value
+            else:
+                hole = value
+            if value == 11:
+                dealer_aces += 1
+                dealer_hard += 1
+            else:
+                dealer_hard += value
+
+        # PlayerAction: every seat plays its hands in order, including split hands.
+        table = self.table
+        deviations = self.deviations
+        composition = deck.composition
+        hole_tag = composition.system.tags[hole - 2]
+        column = upcard - 2
+        for seat in range(seats):
+            player = players[seat]
+            hard, aces, cards = hard_of[seat], aces_of[seat], cards_of[seat]
+            first_rank, second_rank, first_value = first_rank_of[seat], second_rank_of[seat], first_value_of[seat]
+            hand_bets, statuses = bets_of[seat], statuses_of[seat]
+            index = 0
+            while index < num_hands[seat]:
+                while statuses[index] == PLAYING:
+                    if deviations is not None:
+                        table = deviations.table_for(
+                            (composition.running_count - hole_tag) * 52 / (composition.remaining + 1)
+                        )
+                    is_soft = aces[index] and hard[index] <= 11
+                    total = hard[index] + 10 if is_soft else hard[index]
+                    can_afford = cards[index] == 2 and player.balance >= hand_bets[index]
+
+                    if (
+                        can_afford
+                        and first_rank[index] == second_rank[index]
+                        and table[PAIR_OFFSET + first_value[index] * UPCARDS + column] == 1
+                    ):
+                        self._split(seat, index, deal)
+                        continue
+
+                    if total >= 21:
+                        statuses[index] = STOOD
+                        continue
+                    action = table[(SOFT_OFFSET if is_soft else 0) + total * UPCARDS + column]
+                    if action == HIT or (action == DOUBLE_OR_HIT and not can_afford):
+                        doubling = False
+                    elif action == STAND or not can_afford:
+                        statuses[index] = STOOD
+                        continue
+                    else:
+                        doubling = True
+                        player.balance -= hand_bets[index]
+                        hand_bets[index] *= 2
+
+                    code = deal()
+                    value = values[code]
+                    if value == 11:
+                        aces[index] += 1
+                        hard[index] += 1
+                    else:
+                        hard[index] += value
+                    cards[index] += 1
+                    if hard[index] > 21:
+                        statuses[index] = BUSTED
+                    elif doubling:
+                        statuses[index] = STOOD
+                index += 1
+
+        # DealerPlays: hit below 17, then once more on a soft 17 if the rules say so.
+        dealer_value = dealer_hard + 10 if dealer_aces and dealer_hard <= 11 else dealer_hard
+        dealer_cards = 2
+        while dealer_value < 17:
+            value = values[deal()]
+            dealer_cards += 1
+            if value == 11:
+                dealer_aces += 1
+                dealer_hard += 1
+            else:
+                dealer_hard += value
+            dealer_value = dealer_hard + 10 if dealer_aces and dealer_hard <= 11 else dealer_hard
+        if dealer_value == 17 and dealer_aces and dealer_hard <= 11 and rules.dealer_hits_on_soft_17:
+            value = values[deal()]
+            dealer_cards += 1
+            if value == 11:
+                dealer_aces += 1
+                dealer_hard += 1
+            else:
+                dealer_hard += value
+            dealer_value = dealer_hard + 10 if dealer_aces and dealer_hard <= 11 else dealer_hard
+        dealer_busted = dealer_value > 21
+        self.dealer_status = BUSTED if dealer_busted else STOOD
+        dealer_blackjack = dealer_cards == 2 and dealer_value == 21
+
+        # DetermineOutcome: settle every hand that did not bust.
+        payout = rules.blackjack_payout
+        balance_after = 0
+        for seat in range(seats):
+            player = players[seat]
+            hard, aces, cards = hard_of[seat], aces_of[seat], cards_of[seat]
+            hand_bets, statuses = bets_of[seat], statuses_of[seat]
+            for index in range(num_hands[seat]):
+                if statuses[index] == BUSTED:
+                    continue
+                bet = hand_bets[index]
+                value = hard[index] + 10 if aces[index] and hard[index] <= 11 else hard[index]
+                blackjack = cards[index] == 2 and value == 21
+                if dealer_busted or (blackjack and not dealer_blackjack):
+                    player.balance += bet + int(bet * payout) if blackjack else bet * 2
+                    statuses[index] = WON
+                elif value > dealer_value:
+                    player.balance += bet * 2
+                    statuses[index] = WON
+                elif value < dealer_value:
+                    statuses[index] = LOST
+                else:
+                    player.balance += bet
+                    statuses[index] = PUSHED
+            balance_after += player.balance
+
+        return balance_after - balance_before
+
+    def status_names(self, seat: int) -> List[str]:
+        """Returns the final status strings of a seat's hands in the last round."""
+        return [STATUS_NAMES[status] for status in self.statuses[seat][:self.num_hands[seat]]]
+
+    def _split(self, seat: int, index: int, deal):
+        """Splits a pair the way `PlayerAction` does, reusing preallocated hand slots."""
+        player = self.game.players[seat]
+        new_index = self.num_hands[seat]
+        if new_index == len(self.statuses[seat]):
+            self._grow(seat)
+
+        hard, aces, cards = self._hard[seat], self._aces[seat], self._cards[seat]
+        first_rank, second_rank, first_value = self._first_rank[seat], self._second_rank[seat], self._first_value[seat]
+        hand_bets, statuses = self._hand_bets[seat], self.statuses[seat]
+
+        bet = hand_bets[index]
+        player.balance -= bet
+        value = first_value[index]
+        single_hard = 1 if value == 11 else value
+        single_aces = 1 if value == 11 else 0
+        for hand in (index, new_index):
+            hard[hand] = single_hard
+            aces[hand] = single_aces
+            cards[hand] = 1
+            first_rank[hand] = second_rank[index] if hand == new_index else first_rank[index]
+            first_value[hand] = value
+            hand_bets[hand] = bet
+            statuses[hand] = PLAYING
+        self.num_hands[seat] = new_index + 1
+
+        # The original hand is dealt its second card first, then the new hand.
+        for hand in (index, new_index):
+            code = deal()
+            card_value = CARD_VALUES[code]
+            if card_value == 11:
+                aces[hand] += 1
+                hard[hand] += 1
+            else:
+                hard[hand] += card_value
+            cards[hand] = 2
+            second_rank[hand] = CARD_RANKS[code]
+
+    def _grow(self, seat: int):
+        """Doubles the hand storage of a seat; only needed for very long resplit chains."""
+        for storage in (
+            self.statuses, self._hard, self._aces, self._cards,
+            self._first_rank, self._second_rank, self._first_value, self._hand_bets,
+        ):
+            storage[seat].extend([0] * len(storage[seat]))
@@ -0,0 +1,55 @@
+"""Generates many shuffled shoes at once for offline analysis and simulation."""
+
+import random
+from typing import Optional, Union
+import numpy as np
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Card import STANDARD_CARDS
+
+
+def generate_shoes(
+    n_shoes: int,
+    num_decks: int,
+    seed: Union[int, np.random.Generator, None] = None,
+) -> np.ndarray:
+    """Generates a batch of independently shuffled shoes as an integer matrix.
+
+    Every row is one shoe of `num_decks * 52` card codes (indices into
+    `STANDARD_CARDS`) in dealing order. All rows are permuted in a single
+    vectorized call instead of building and shuffling one `Deck` at a time.
+
+    Args:
+        n_shoes (int): The number of shoes to generate.
+        num_decks (int): The number of 52-card decks in each shoe.
+        seed (Union[int, np.random.Generator, None]): A seed or NumPy generator
+            for reproducible batches.
+
+    Returns:
+        np.ndarray: A `(n_shoes, num_decks * 52)` matrix of `uint8` card codes.
+
+    Raises:
+        ValueError: If `n_shoes` is negative or `num_decks` is not positive.
+    """
+    if n_shoes < 0:
+        raise ValueError("The number of shoes cannot be negative.")
+    if num_decks <= 0:
+        raise ValueError("A shoe needs at least one deck.")
+
+    rng = np.random.default_rng(seed)
+    single_shoe = np.tile(np.arange(len(STANDARD_CARDS), dtype=np.uint8), num_decks)
+    shoes = np.broadcast_to(single_shoe, (n_shoes, single_shoe.size)).copy()
+    return rng.permuted(shoes, axis=1, out=shoes)
+
+
+def shoe_from_row(row: np.ndarray, rng: Optional[random.Random] = None) -> ArrayShoe:
+    """Wraps one row of a shoe batch as a shoe the use cases can deal from.
+
+    Args:
+        row (np.ndarray): A row returned by `generate_shoes`.
+        rng (Optional[random.Random]): The random number generator for reshuffles
+            once the row has been dealt out.
+
+    Returns:
+        ArrayShoe: A shoe that deals the row's cards in order.
+    """
+    return ArrayShoe.from_order(np.ascontiguousarray(row, dtype=np.uint8).tobytes(), rng=rng)
@@ -0,0 +1,273 @@
+"""Plays Blackjack rounds headlessly through the GameController."""
+
+import dataclasses
+import itertools
+import math
+import random
+import time
+from typing import Iterator, List, Optional
+from src.domain.Game import Game
+from src.domain.GameState import Action
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.interface_adapters.game_controller import GameController
+from src.infrastructure.simulation.records import RoundRecord, hand_labels
+from src.infrastructure.simulation.statistics import DEFAULT_CONFIDENCE, RoundStatistics
+from src.infrastructure.simulation.strategies import PlayerStrategy
+
+# How often, in rounds, early stopping checks the precision of the estimate.
+DEFAULT_CHECK_EVERY = 1_000
+
+
+@dataclasses.dataclass
+class SimulationResult:
+    """Aggregated results of a simulation run.
+
+    All money amounts are integers, so results from separate runs can be merged
+    exactly.
+
+    Attributes:
+        rounds (int): The number of rounds played.
+        hands (int): The number of player hands played, counting split hands.
+        bet (int): The initial bet placed every round.
+        net (int): The player's total winnings (negative for losses).
+        net_squared (int): The sum of the squared per-round winnings.
+        elapsed_seconds (float): The wall-clock time spent playing.
+    """
+
+    rounds: int = 0
+    hands: int = 0
+    bet: int = 0
+    net: int = 0
+    net_squared: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def house_edge(self) -> float:
+        """The house's expected gain per unit of initial bet."""
+        if not self.rounds:
+            return 0.0
+        return -self.net / (self.rounds * self.bet)
+
+    @property
+    def std_dev(self) -> float:
+        """The standard deviation of one round's winnings, in units of the initial bet."""
+        if self.rounds < 2:
+            return 0.0
+        mean = self.net / self.rounds
+        variance = (self.net_squared - self.rounds * mean * mean) / (self.rounds - 1)
+        return math.sqrt(max(variance, 0.0)) / self.bet
+
+    @property
+    def standard_error(self) -> float:
+        """The standard error of the house edge estimate."""
+        if not self.rounds:
+            return 0.0
+        return self.std_dev / math.sqrt(self.rounds)
+
+    @property
+    def hands_per_second(self) -> float:
+        """The simulation throughput."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.hands / self.elapsed_seconds
+
+    def merge(self, other: 'SimulationResult') -> 'SimulationResult':
+        """Returns the combined results of two runs with the same bet.
+
+        Args:
+            other (SimulationResult): The results to combine with.
+
+        Returns:
+            SimulationResult: The merged results.
+        """
+        return SimulationResult(
+            rounds=self.rounds + other.rounds,
+            hands=self.hands + other.hands,
+            bet=self.bet or other.bet,
+            net=self.net + other.net,
+            net_squared=self.net_squared + other.net_squared,
+            elapsed_seconds=self.elapsed_seconds + other.elapsed_seconds,
+        )
+
+
+class Simulator:
+    """Drives full rounds through the `GameController` without any user interface.
+
+    Every round places a flat bet, starts the round, asks the strategy for actions
+    until all hands are played, lets the dealer play, settles the bets and resets
+    the table: the same use-case sequence as the CLI and Streamlit UIs.
+
+    The player's balance is restored before each round, so the simulation
+    measures the game itself rather than a bankroll that can run out.
+    `running_balance` keeps the bankroll the player would have had instead.
+
+    Attributes:
+        shoe_id (int): The index of the current shoe, increased on every reshuffle.
+        running_balance (int): The starting bankroll plus the winnings of every
+            round played so far.
+        last_round_hands (int): The number of hands played in the last round.
+        last_round_actions (List[Action]): The actions taken in the last round.
+        last_round_upcard (int): The value of the dealer's upcard in the last round.
+        last_round_start_total (int): The value of the player's first two cards in the last round.
+        last_round_blackjack (bool): True if the player was dealt a blackjack in the last round.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        strategy: PlayerStrategy,
+        bet: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initializes the simulator.
+
+        Args:
+            rules (GameRules): The rules of the simulated table.
+            strategy (PlayerStrategy): The strategy that chooses the player's actions.
+            bet (Optional[int]): The flat bet for every round. Defaults to `rules.min_bet`.
+            rng (Optional[random.Random]): The random number generator for the shoe.
+        """
+        self.rules = rules
+        self.strategy = strategy
+        self.bet = bet if bet is not None else rules.min_bet
+        # Enough for the deepest split-and-double sequence of any round.
+        self.bankroll = self.bet * 1_000
+        self.player = Player(balance=self.bankroll)
+        self.game = Game(players=[self.player], rules=rules, rng=rng)
+        self.controller = GameController(self.game)
+        self.shoe_id = 0
+        self.running_balance = self.bankroll
+        self.last_round_hands = 0
+        self.last_round_actions: List[Action] = []
+        self.last_round_upcard = 0
+        self.last_round_start_total = 0
+        self.last_round_blackjack = False
+
+    def play_round(self) -> int:
+        """Plays one full round.
+
+        Returns:
+            int: The player's winnings for the round.
+        """
+        net = self._play_until_settled()
+        self.controller.reset_round_for_new_game()
+        return net
+
+    def records(self, rounds: Optional[int] = None, start: int = 0) -> Iterator[RoundRecord]:
+        """Plays rounds lazily, yielding one record per round.
+
+        Nothing is kept between rounds, so the generator can feed sinks for runs
+        of any length in constant memory.
+
+        Args:
+            rounds (Optional[int]): The number of rounds to play. Plays indefinitely
+                if None.
+            start (int): The index of the first round.
+
+        Yields:
+            RoundRecord: The record of each round, in order.
+        """
+        indices = itertools.count(start) if rounds is None else range(start, start + rounds)
+        for index in indices:
+            net = self._play_until_settled()
+            record = RoundRecord(
+                round=index,
+                shoe_id=self.shoe_id,
+                player_hands=tuple(hand_labels(hand) for hand in self.player.hands),
+                dealer_hand=hand_labels(self.game.dealer.hands[0]),
+                actions=tuple(action.label for action in self.last_round_actions),
+                bet=self.bet,
+                payout=net,
+                balance=self.running_balance,
+            )
+            self.controller.reset_round_for_new_game()
+            yield record
+
+    def _play_until_settled(self) -> int:
+        """Plays a round up to and including settlement, without resetting the table."""
+        player = self.player
+        controller = self.controller
+        deck = self.game.deck
+        player.balance = self.bankroll
+        actions = self.last_round_actions = []
+
+        controller.place_bets({player: self.bet})
+        cards_remaining = deck.cards_remaining
+        controller.start_new_round()
+        if deck.cards_remaining > cards_remaining:
+            self.shoe_id += 1
+        first_hand = player.hands[0]
+        self.last_round_upcard = self.game.dealer.hands[0].cards[0].value
+        self.last_round_start_total = first_hand.value
+        self.last_round_blackjack = first_hand.is_blackjack
+        while not player.all_hands_played():
+            action = self.strategy.decide(self.game, player)
+            actions.append(action)
+            controller.perform_player_action(player, action)
+
+        controller.dealer_turn()
+        controller.end_round()
+        self.last_round_hands = len(player.hands)
+        net = player.balance - self.bankroll
+        self.running_balance += net
+        return net
+
+    def run(self, rounds: int) -> SimulationResult:
+        """Plays a number of rounds and aggregates the results.
+
+        Args:
+            rounds (int): The number of rounds to play.
+
+        Returns:
+            SimulationResult: The aggregated results.
+        """
+        result = SimulationResult(bet=self.bet)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            net = self.play_round()
+            result.rounds += 1
+            result.hands += self.last_round_hands
+            result.net += net
+            result.net_squared += net * net
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+    def run_statistics(
+        self,
+        max_rounds: int,
+        target_precision: Optional[float] = None,
+        confidence: float = DEFAULT_CONFIDENCE,
+        check_every: int = DEFAULT_CHECK_EVERY,
+    ) -> RoundStatistics:
+        """Plays rounds into running statistics, optionally stopping early.
+
+        Args:
+            max_rounds (int): The maximum number of rounds to play.
+            target_precision (Optional[float]): Stop once the confidence interval of
+                the house edge is at most this far from the estimate on either side,
+                in units of the initial bet. Plays `max_rounds` if None.
+            confidence (float): The confidence level of the interval.
+            check_every (int): The number of rounds between precision checks.
+
+        Returns:
+            RoundStatistics: The statistics of the rounds played.
+        """
+        statistics = RoundStatistics()
+        for played in range(1, max_rounds + 1):
+            net = self._play_until_settled()
+            statistics.add_round(
+                net / self.bet,
+                self.last_round_upcard,
+                self.last_round_start_total,
+                (hand.status for hand in self.player.hands),
+                self.last_round_blackjack,
+            )
+            self.controller.reset_round_for_new_game()
+            if (
+                target_precision is not None
+                and played % check_every == 0
+                and statistics.precision(confidence) <= target_precision
+            ):
+                break
+        return statistics
@@ -0,0 +1,178 @@
+"""Sinks that write round records out of a simulation in fixed-size chunks."""
+
+import abc
+import csv
+import dataclasses
+import json
+from typing import Callable, Dict, Iterable, Iterator, List, TextIO
+import numpy as np
+from src.infrastructure.simulation.records import NUMERIC_FIELDS, RECORD_FIELDS, RoundRecord
+from src.infrastructure.simulation.simulator import SimulationResult
+
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def tally(records: Iterable[RoundRecord], result: SimulationResult) -> Iterator[RoundRecord]:
+    """Passes records through unchanged while adding them to a running result.
+
+    Args:
+        records (Iterable[RoundRecord]): The records to pass through.
+        result (SimulationResult): The result to update; its `bet` should match the
+            records.
+
+    Yields:
+        RoundRecord: Each input record.
+    """
+    for record in records:
+        result.rounds += 1
+        result.hands += len(record.player_hands)
+        result.net += record.payout
+        result.net_squared += record.payout * record.payout
+        yield record
+
+
+def drain(records: Iterable[RoundRecord], *sinks: 'RecordSink') -> int:
+    """Writes every record to every sink, then flushes the sinks.
+
+    Args:
+        records (Iterable[RoundRecord]): The records to consume, typically a generator.
+        *sinks (RecordSink): The sinks to write to.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    for record in records:
+        for sink in sinks:
+            sink.write(record)
+        count += 1
+    for sink in sinks:
+        sink.flush()
+    return count
+
+
+class RecordSink(abc.ABC):
+    """Buffers round records and writes them out in fixed-size chunks.
+
+    Memory use is bounded by the chunk size no matter how many records pass
+    through. Subclasses implement `_write_chunk`; sinks are context managers
+    that flush the last, partial chunk on exit.
+
+    Attributes:
+        chunk_size (int): The number of records written at a time.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initializes the sink.
+
+        Args:
+            chunk_size (int): The number of records written at a time.
+
+        Raises:
+            ValueError: If the chunk size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("The chunk size must be positive.")
+        self.chunk_size = chunk_size
+        self._buffer: List[RoundRecord] = []
+
+    def write(self, record: RoundRecord):
+        """Adds a record, writing out the buffer once a chunk is full."""
+        self._buffer.append(record)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Writes out any buffered records."""
+        if self._buffer:
+            self._write_chunk(self._buffer)
+            self._buffer = []
+
+    def __enter__(self) -> 'RecordSink':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    @abc.abstractmethod
+    def _write_chunk(self, chunk: List[RoundRecord]):
+        """Writes one chunk of records."""
+
+
+class CsvSink(RecordSink):
+    """Writes records as CSV rows with a header.
+
+    Hands are written as space-separated card labels, with `|` between split
+    hands; actions are separated by spaces.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initializes the sink.
+
+        Args:
+            stream (TextIO): The text stream to write to.
+            chunk_size (int): The number of records written at a time.
+        """
+        super().__init__(chunk_size)
+        self.stream = stream
+        self._writer = csv.writer(stream)
+        self._writer.writerow(RECORD_FIELDS)
+
+    def _write_chunk(self, chunk: List[RoundRecord]):
+        self._writer.writerows(
+            (
+                record.round,
+                record.shoe_id,
+                "|".join(" ".join(hand) for hand in record.player_hands),
+                " ".join(record.dealer_hand),
+                " ".join(record.actions),
+                record.bet,
+                record.payout,
+                record.balance,
+            )
+            for record in chunk
+        )
+        self.stream.flush()
+
+
+class JsonLinesSink(RecordSink):
+    """Writes one JSON object per record and line."""
+
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initializes the sink.
+
+        Args:
+            stream (TextIO): The text stream to write to.
+            chunk_size (int): The number of records written at a time.
+        """
+        super().__init__(chunk_size)
+        self.stream = stream
+
+    def _write_chunk(self, chunk: List[RoundRecord]):
+        self.stream.writelines(json.dumps(dataclasses.asdict(record)) + "\n" for record in chunk)
+        self.stream.flush()
+
+
+class ColumnarSink(RecordSink):
+    """Hands records to a consumer as column batches.
+
+    Each batch maps every field of `RoundRecord` to one column: a NumPy `int64`
+    array for numeric fields and a list for hands and actions.
+    """
+
+    def __init__(self, consumer: Callable[[Dict[str, object]], None], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initializes the sink.
+
+        Args:
+            consumer (Callable[[Dict[str, object]], None]): Called with each batch.
+            chunk_size (int): The number of records per batch.
+        """
+        super().__init__(chunk_size)
+        self.consumer = consumer
+
+    def _write_chunk(self, chunk: List[RoundRecord]):
+        batch: Dict[str, object] = {}
+        for name in RECORD_FIELDS:
+            column = [getattr(record, name) for record in chunk]
+            batch[name] = np.array(column, dtype=np.int64) if name in NUMERIC_FIELDS else column
+        self.consumer(batch)
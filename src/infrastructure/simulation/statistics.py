@@ -0,0 +1,221 @@
+"""Mergeable running statistics for long simulations."""
+
+import dataclasses
+import math
+from statistics import NormalDist
+from typing import Dict, Iterable, Tuple, Union
+import numpy as np
+from src.domain.GameState import HandStatus
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+@dataclasses.dataclass
+class RunningStats:
+    """The count, mean and variance of a stream of values, in constant memory.
+
+    Values are added with Welford's update and partial results are combined with
+    Chan's parallel formula, so no individual value is ever stored. Merging the
+    same partial results in the same order always gives the same floats.
+
+    Attributes:
+        count (int): The number of values added.
+        mean (float): The mean of the values.
+        m2 (float): The sum of squared deviations from the mean.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float):
+        """Adds one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @classmethod
+    def of(cls, values: np.ndarray) -> 'RunningStats':
+        """Returns the statistics of a batch of values, computed with array operations."""
+        if not len(values):
+            return cls()
+        mean = float(values.mean())
+        return cls(count=len(values), mean=mean, m2=float(np.square(values - mean).sum()))
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Returns the statistics of both streams combined.
+
+        Args:
+            other (RunningStats): The statistics to combine with.
+
+        Returns:
+            RunningStats: The merged statistics.
+        """
+        count = self.count + other.count
+        if not count:
+            return RunningStats()
+        delta = other.mean - self.mean
+        return RunningStats(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+        )
+
+    @property
+    def variance(self) -> float:
+        """The sample variance of the values."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std_dev(self) -> float:
+        """The sample standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def standard_error(self) -> float:
+        """The standard error of the mean."""
+        if not self.count:
+            return math.inf
+        return self.std_dev / math.sqrt(self.count)
+
+    def half_width(self, confidence: float = DEFAULT_CONFIDENCE) -> float:
+        """Returns the half-width of the normal confidence interval of the mean."""
+        return NormalDist().inv_cdf(0.5 + confidence / 2) * self.standard_error
+
+    def confidence_interval(self, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+        """Returns the normal confidence interval of the mean.
+
+        Args:
+            confidence (float): The confidence level, e.g. 0.95.
+
+        Returns:
+            Tuple[float, float]: The lower and upper bounds.
+        """
+        half_width = self.half_width(confidence)
+        return self.mean - half_width, self.mean + half_width
+
+
+@dataclasses.dataclass
+class RoundStatistics:
+    """Running statistics of simulated rounds, in units of the initial bet.
+
+    Attributes:
+        rounds (RunningStats): The player's winnings per round.
+        by_upcard (Dict[int, RunningStats]): The winnings per round by dealer upcard value.
+        by_player_total (Dict[int, RunningStats]): The winnings per round by the
+            value of the player's first two cards.
+        wins (int): The number of hands won.
+        pushes (int): The number of hands pushed.
+        losses (int): The number of hands lost, including busted hands.
+        blackjacks (int): The number of rounds dealt a player blackjack.
+    """
+
+    rounds: RunningStats = dataclasses.field(default_factory=RunningStats)
+    by_upcard: Dict[int, RunningStats] = dataclasses.field(default_factory=dict)
+    by_player_total: Dict[int, RunningStats] = dataclasses.field(default_factory=dict)
+    wins: int = 0
+    pushes: int = 0
+    losses: int = 0
+    blackjacks: int = 0
+
+    def add_round(self, net: float, upcard: int, player_total: int, outcomes: Iterable[Union[HandStatus, str]], blackjack: bool):
+        """Adds one round.
+
+        Args:
+            net (float): The player's winnings, in units of the initial bet.
+            upcard (int): The value of the dealer's upcard.
+            player_total (int): The value of the player's first two cards.
+            outcomes (Iterable[Union[HandStatus, str]]): The final status of each player hand,
+                as a `HandStatus` or its label.
+            blackjack (bool): True if the player was dealt a blackjack.
+        """
+        self.rounds.add(net)
+        _stats_for(self.by_upcard, upcard).add(net)
+        _stats_for(self.by_player_total, player_total).add(net)
+        for outcome in outcomes:
+            outcome = HandStatus.of(outcome)
+            if outcome is HandStatus.WIN:
+                self.wins += 1
+            elif outcome is HandStatus.PUSH:
+                self.pushes += 1
+            else:
+                self.losses += 1
+        if blackjack:
+            self.blackjacks += 1
+
+    def merge(self, other: 'RoundStatistics') -> 'RoundStatistics':
+        """Returns the statistics of both runs combined.
+
+        Args:
+            other (RoundStatistics): The statistics to combine with.
+
+        Returns:
+            RoundStatistics: The merged statistics.
+        """
+        return RoundStatistics(
+            rounds=self.rounds.merge(other.rounds),
+            by_upcard=_merge_groups(self.by_upcard, other.by_upcard),
+            by_player_total=_merge_groups(self.by_player_total, other.by_player_total),
+            wins=self.wins + other.wins,
+            pushes=self.pushes + other.pushes,
+            losses=self.losses + other.losses,
+            blackjacks=self.blackjacks + other.blackjacks,
+        )
+
+    @property
+    def hands(self) -> int:
+        """The number of hands settled."""
+        return self.wins + self.pushes + self.losses
+
+    @property
+    def house_edge(self) -> float:
+        """The house's expected gain per unit of initial bet."""
+        return -self.rounds.mean
+
+    def house_edge_interval(self, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+        """Returns the confidence interval of the house edge."""
+        low, high = self.rounds.confidence_interval(confidence)
+        return -high, -low
+
+    def precision(self, confidence: float = DEFAULT_CONFIDENCE) -> float:
+        """Returns the half-width of the house edge confidence interval."""
+        return self.rounds.half_width(confidence)
+
+    @property
+    def win_rate(self) -> float:
+        """The fraction of hands won."""
+        return self.wins / self.hands if self.hands else 0.0
+
+    @property
+    def push_rate(self) -> float:
+        """The fraction of hands pushed."""
+        return self.pushes / self.hands if self.hands else 0.0
+
+    @property
+    def loss_rate(self) -> float:
+        """The fraction of hands lost."""
+        return self.losses / self.hands if self.hands else 0.0
+
+    @property
+    def blackjack_frequency(self) -> float:
+        """The fraction of rounds dealt a player blackjack."""
+        return self.blackjacks / self.rounds.count if self.rounds.count else 0.0
+
+
+def _stats_for(groups: Dict[int, RunningStats], key: int) -> RunningStats:
+    """Returns the statistics of a group, creating them on first use."""
+    stats = groups.get(key)
+    if stats is None:
+        stats = groups[key] = RunningStats()
+    return stats
+
+
+def _merge_groups(first: Dict[int, RunningStats], second: Dict[int, RunningStats]) -> Dict[int, RunningStats]:
+    """Merges two sets of grouped statistics key by key, in sorted key order."""
+    return {
+        key: first.get(key, RunningStats()).merge(second.get(key, RunningStats()))
+        for key in sorted(first.keys() | second.keys())
+    }
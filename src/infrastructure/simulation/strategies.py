@@ -0,0 +1,66 @@
+"""Playing strategies for headless simulations."""
+
+from typing import Protocol
+from src.application.basic_strategy import BasicStrategy
+from src.domain.Game import Game
+from src.domain.GameState import Action
+from src.domain.Player import Player
+
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+STAND = Action.STAND
+
+
+class PlayerStrategy(Protocol):
+    """Decides the next action for a player's current hand."""
+
+    def decide(self, game: Game, player: Player) -> Action:
+        """Returns the action for the player's current hand."""
+        ...
+
+
+class BasicStrategyPlayer:
+    """Chooses each action from a compiled basic-strategy chart.
+
+    Only actions `PlayerAction` would accept are returned: doubling and splitting
+    are offered to the chart only on two-card hands the player can afford.
+
+    Attributes:
+        strategy (BasicStrategy): The chart decisions are looked up in.
+    """
+
+    def __init__(self, strategy: BasicStrategy):
+        """Initializes the player.
+
+        Args:
+            strategy (BasicStrategy): The chart decisions are looked up in.
+        """
+        self.strategy = strategy
+
+    def decide(self, game: Game, player: Player) -> Action:
+        """Returns the action for the player's current hand.
+
+        Args:
+            game (Game): The current game instance.
+            player (Player): The player to act.
+
+        Returns:
+            Action: An action `PlayerAction` accepts for the hand.
+        """
+        hand = player.get_current_hand()
+        can_afford = len(hand.cards) == 2 and player.balance >= player.get_current_bet()
+        return self.strategy.decide(
+            hand.value,
+            hand.is_soft,
+            game.dealer.hands[0].cards[0].value,
+            pair_value=hand.cards[0].value if hand.is_pair else None,
+            can_double=can_afford,
+            can_split=can_afford,
+        )
+
+
+class StandPlayer:
+    """Stands on every hand; a trivial baseline strategy."""
+
+    def decide(self, game: Game, player: Player) -> Action:
+        """Returns `Action.STAND` for every hand."""
+        return STAND
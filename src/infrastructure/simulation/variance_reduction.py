@@ -0,0 +1,369 @@
+"""Variance-reduction estimators built on the vectorized simulator."""
+
+import dataclasses
+import math
+from statistics import NormalDist
+from typing import Callable, Optional, Tuple, Union
+import numpy as np
+from src.application.basic_strategy import BasicStrategy
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.bankroll import SessionResults
+from src.infrastructure.simulation.paired import PairedComparison, derived_seeds
+from src.infrastructure.simulation.statistics import DEFAULT_CONFIDENCE, RunningStats
+from src.infrastructure.simulation.vectorized import DEFAULT_LANES, VectorizedSimulator
+
+# The opening deal is player, dealer, player, dealer; the mirror deals the same
+# four cards as dealer, player, dealer, player.
+SWAPPED_DEAL = [1, 0, 3, 2]
+DEFAULT_OUTCOME_ROUNDS = 1 << 20
+# The tilted sessions aim to lose the bankroll this much faster than the session length.
+DEFAULT_DRIFT_FACTOR = 1.25
+# The search range of the ruin tilt, per unit of bet.
+MAX_TILT = 50.0
+
+
+@dataclasses.dataclass(frozen=True)
+class Estimate:
+    """An estimated mean and how much less it cost than plain Monte Carlo.
+
+    Attributes:
+        mean (float): The estimate.
+        standard_error (float): The standard error of the estimate.
+        samples (int): The number of rounds or sessions simulated.
+        efficiency_gain (float): The variance of plain Monte Carlo over the same
+            number of samples divided by the variance of this estimator.
+    """
+
+    mean: float
+    standard_error: float
+    samples: int
+    efficiency_gain: float
+
+    @property
+    def effective_sample_size(self) -> float:
+        """The number of plain Monte Carlo samples that would give the same precision."""
+        return self.samples * self.efficiency_gain
+
+    def confidence_interval(self, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+        """Returns the normal confidence interval of the estimate.
+
+        Args:
+            confidence (float): The confidence level, e.g. 0.95.
+
+        Returns:
+            Tuple[float, float]: The lower and upper bounds.
+        """
+        half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * self.standard_error
+        return self.mean - half_width, self.mean + half_width
+
+
+class _SwappedDealSimulator(VectorizedSimulator):
+    """Deals the opening cards of every round to the other side of the table."""
+
+    def _deal_block(self, count: int) -> np.ndarray:
+        return super()._deal_block(count)[SWAPPED_DEAL]
+
+
+class AntitheticSimulator:
+    """Plays every round twice, the second time with the player's and dealer's cards swapped.
+
+    The mirrored round starts from the same shoe position and deals the same
+    four opening cards, but gives the player the dealer's cards and the dealer
+    the player's. Since the order of unseen cards is uniformly random, the
+    mirrored round is just as likely as the original. It tends to go the
+    other way for the player, though, so the average of the two rounds has a
+    much lower variance than two independent rounds. The shoe advances by the
+    cards the original round used, so the original rounds play exactly like a
+    standalone `VectorizedSimulator` with the same integer seed.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        strategy: BasicStrategy,
+        bet: Optional[int] = None,
+        lanes: int = DEFAULT_LANES,
+        seed: Union[int, np.random.Generator, None] = None,
+    ):
+        """Initializes the simulator.
+
+        Args:
+            rules (GameRules): The rules of the simulated table.
+            strategy (BasicStrategy): The chart the player follows.
+            bet (Optional[int]): The flat bet. Defaults to `rules.min_bet`.
+            lanes (int): The number of shoes played side by side.
+            seed (Union[int, np.random.Generator, None]): A seed or NumPy generator
+                for reproducible shoes. The mirror's seed is derived from it with
+                `derived_seeds`.
+        """
+        (mirror_seed,) = derived_seeds(seed, 1)
+        self.original = VectorizedSimulator(rules, strategy, bet=bet, lanes=lanes, seed=seed)
+        self.mirrored = _SwappedDealSimulator(rules, strategy, bet=bet, lanes=lanes, seed=mirror_seed)
+        self.mirrored.shoes = self.original.shoes
+
+    def play_round(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Plays one round and its mirror on every lane.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The winnings of the original and of the
+            mirrored round in each lane.
+        """
+        original, mirrored = self.original, self.mirrored
+        original.reshuffle_spent_shoes()
+        start = original.positions.copy()
+        net = original.play_round()
+        mirrored.positions[:] = start
+        return net, mirrored.play_round()
+
+    def estimate(self, rounds: int) -> Estimate:
+        """Estimates the player's expected winnings per round, in units of the bet.
+
+        Args:
+            rounds (int): The minimum number of rounds to play, counting both rounds
+                of a pair. The total is rounded up to a whole number of batches.
+
+        Returns:
+            Estimate: The mean of the pair averages, with its gain over independent rounds.
+        """
+        bet = self.original.bet
+        rounds_stats = RunningStats()
+        pair_stats = RunningStats()
+        while rounds_stats.count < rounds:
+            original, mirrored = self.play_round()
+            rounds_stats = rounds_stats.merge(RunningStats.of(original / bet)).merge(RunningStats.of(mirrored / bet))
+            pair_stats = pair_stats.merge(RunningStats.of((original + mirrored) / (2 * bet)))
+        # Plain Monte Carlo over the same rounds has a variance of sigma^2 / rounds, and
+        # each pair costs two rounds.
+        gain = rounds_stats.variance / (2 * pair_stats.variance) if pair_stats.variance else math.inf
+        return Estimate(pair_stats.mean, pair_stats.standard_error, rounds_stats.count, gain)
+
+
+def control_variate_estimate(comparison: PairedComparison, variant: int, control_mean: float) -> Estimate:
+    """Estimates a variant's EV using the baseline of a paired run as a control variate.
+
+    The baseline's EV must be known, e.g. from published basic-strategy tables
+    or a long earlier run. Its sampling error in the paired run is then mostly
+    shared with the variant, and subtracting it with the optimal coefficient
+    leaves `1 - rho^2` of the variant's variance.
+
+    Args:
+        comparison (PairedComparison): A paired run of the baseline and the variant.
+        variant (int): The index of the variant to estimate, 1 or above.
+        control_mean (float): The known EV of the baseline, in units of its bet.
+
+    Returns:
+        Estimate: The variant's EV per round, in units of its bet.
+    """
+    control = comparison.results[0]
+    target = comparison.results[variant]
+    if not control.variance or not target.variance:
+        return Estimate(target.mean, target.standard_error, target.count, 1.0)
+    covariance = (control.variance + target.variance - comparison.differences[variant - 1].variance) / 2
+    correlation_squared = min(covariance * covariance / (control.variance * target.variance), 1.0)
+    mean = target.mean - covariance / control.variance * (control.mean - control_mean)
+    if correlation_squared == 1.0:
+        return Estimate(mean, 0.0, target.count, math.inf)
+    remaining = target.variance * (1.0 - correlation_squared)
+    return Estimate(mean, math.sqrt(remaining / target.count), target.count, 1.0 / (1.0 - correlation_squared))
+
+
+class ImportanceSampler:
+    """Estimates the probability of rare bankroll events with tilted round outcomes.
+
+    The distribution of round outcomes is measured once by playing real
+    rounds with a `VectorizedSimulator`. Sessions are then built from rounds
+    drawn from the distribution exponentially tilted towards losses,
+    `q(x) ~ p(x) exp(-tilt * x / bet)`, under which ruin and deep drawdowns are
+    common. Every session in which the event happens counts with its
+    likelihood ratio `p / q` instead of 1, so the estimate stays unbiased.
+    Once a session has reached the event, its remaining rounds are drawn from
+    `p` again and add nothing to the ratio.
+
+    Rounds are drawn independently, so sessions ignore the small correlation
+    between consecutive rounds of a shoe, and a short bankroll still doubles
+    and splits as if it could cover them. A session is ruined, and stops,
+    once its bankroll falls below `rules.min_bet`, as in `BankrollSimulator`.
+
+    Attributes:
+        outcomes (np.ndarray): The distinct winnings of a round.
+        probabilities (np.ndarray): The measured probability of each outcome.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        strategy: BasicStrategy,
+        bet: int,
+        starting_bankroll: int,
+        session_rounds: int,
+        outcome_rounds: int = DEFAULT_OUTCOME_ROUNDS,
+        lanes: int = DEFAULT_LANES,
+        seed: Union[int, np.random.Generator, None] = None,
+    ):
+        """Initializes the sampler and measures the distribution of round outcomes.
+
+        Args:
+            rules (GameRules): The rules of the simulated table.
+            strategy (BasicStrategy): The chart the player follows.
+            bet (int): The flat bet of every round.
+            starting_bankroll (int): The bankroll each session starts with.
+            session_rounds (int): The maximum number of rounds per session.
+            outcome_rounds (int): The number of real rounds played to measure the outcomes.
+            lanes (int): The number of sessions played side by side.
+            seed (Union[int, np.random.Generator, None]): A seed or NumPy generator
+                for reproducible sessions.
+
+        Raises:
+            ValueError: If the starting bankroll or session length is not positive.
+        """
+        if starting_bankroll <= 0:
+            raise ValueError("The starting bankroll must be positive.")
+        if session_rounds <= 0:
+            raise ValueError("A session must have at least one round.")
+        self.rules = rules
+        self.bet = bet
+        self.starting_bankroll = starting_bankroll
+        self.session_rounds = session_rounds
+        self.lanes = lanes
+        self.rng = np.random.default_rng(seed)
+
+        simulator = VectorizedSimulator(rules, strategy, bet=bet, lanes=min(lanes, outcome_rounds), seed=self.rng)
+        nets = np.concatenate([simulator.play_round() for _ in range(-(-outcome_rounds // simulator.lanes))])
+        self.outcomes, counts = np.unique(nets, return_counts=True)
+        self.probabilities = counts / counts.sum()
+
+    def tilted_probabilities(self, tilt: float) -> np.ndarray:
+        """Returns the outcome probabilities exponentially tilted towards losses."""
+        return np.exp(self._tilted_log_probabilities(tilt))
+
+    def _tilted_log_probabilities(self, tilt: float) -> np.ndarray:
+        """Returns the logarithms of the tilted probabilities.
+
+        The weights `p(x) exp(-tilt * x / bet)` overflow or underflow for large
+        tilts and outcomes, so they are normalized in log space, shifted by their
+        maximum (log-sum-exp).
+        """
+        log_weights = np.log(self.probabilities) - tilt * (self.outcomes / self.bet)
+        shift = log_weights.max()
+        return log_weights - (shift + np.log(np.exp(log_weights - shift).sum()))
+
+    def tilt_for(self, loss: int) -> float:
+        """Returns the tilt under which a typical session loses `loss` chips just before its last round."""
+        drift = DEFAULT_DRIFT_FACTOR * loss / self.session_rounds
+        low, high = -MAX_TILT, MAX_TILT
+        for _ in range(100):
+            tilt = (low + high) / 2
+            if -(self.tilted_probabilities(tilt) * self.outcomes).sum() < drift:
+                low = tilt
+            else:
+                high = tilt
+        return (low + high) / 2
+
+    def estimate_ruin(self, sessions: int, tilt: Optional[float] = None) -> Estimate:
+        """Estimates the probability that a session goes broke.
+
+        Args:
+            sessions (int): The minimum number of sessions to play. The total is
+                rounded up to a whole number of batches of `lanes` sessions.
+            tilt (Optional[float]): The tilt towards losses; 0 is plain Monte Carlo.
+                Defaults to the tilt that loses the bankroll within a session.
+
+        Returns:
+            Estimate: The probability, with its gain over plain Monte Carlo.
+
+        Raises:
+            ValueError: If the number of sessions is not positive.
+        """
+        if tilt is None:
+            tilt = self.tilt_for(self.starting_bankroll - self.rules.min_bet + 1)
+        return self._estimate(sessions, tilt, lambda results: results.ruined)
+
+    def estimate_drawdown(self, sessions: int, depth: int, tilt: Optional[float] = None) -> Estimate:
+        """Estimates the probability that a session falls `depth` chips below its running peak.
+
+        Args:
+            sessions (int): The minimum number of sessions to play. The total is
+                rounded up to a whole number of batches of `lanes` sessions.
+            depth (int): The drawdown, in chips.
+            tilt (Optional[float]): The tilt towards losses; 0 is plain Monte Carlo.
+                Defaults to the tilt that loses `depth` within a session.
+
+        Returns:
+            Estimate: The probability, with its gain over plain Monte Carlo.
+
+        Raises:
+            ValueError: If the number of sessions or the depth is not positive.
+        """
+        if depth <= 0:
+            raise ValueError("The drawdown depth must be positive.")
+        tilt = self.tilt_for(depth) if tilt is None else tilt
+        return self._estimate(sessions, tilt, lambda results: results.max_drawdowns >= depth, depth)
+
+    def _estimate(
+        self,
+        sessions: int,
+        tilt: float,
+        event: Callable[[SessionResults], np.ndarray],
+        depth: Optional[int] = None,
+    ) -> Estimate:
+        """Plays tilted sessions and averages the likelihood ratios of those with the event."""
+        if sessions <= 0:
+            raise ValueError("There must be at least one session.")
+        stats = RunningStats()
+        while stats.count < sessions:
+            results, log_likelihoods = self._run_batch(tilt, depth)
+            # Sessions without the event weigh exp(-inf) = 0, even where their ratio would overflow.
+            stats = stats.merge(RunningStats.of(np.exp(np.where(event(results), log_likelihoods, -np.inf))))
+        probability = min(max(stats.mean, 0.0), 1.0)
+        if stats.variance:
+            gain = probability * (1.0 - probability) / stats.variance
+        else:
+            # Either the event never happened or every session had the same weight.
+            gain = 1.0 if probability in (0.0, 1.0) else math.inf
+        return Estimate(stats.mean, stats.standard_error, stats.count, gain)
+
+    def _run_batch(self, tilt: float, depth: Optional[int]) -> Tuple[SessionResults, np.ndarray]:
+        """Plays one session in every lane and returns the sessions' log-likelihood ratios.
+
+        Rounds are drawn from the tilted distribution until the session is ruined or, if `depth`
+        is given, has fallen `depth` chips below its peak, and from `p` after that.
+        """
+        lanes = self.lanes
+        log_tilted = self._tilted_log_probabilities(tilt)
+        nominal_cumulative = np.cumsum(self.probabilities)
+        tilted_cumulative = np.cumsum(np.exp(log_tilted))
+        log_ratios = np.log(self.probabilities) - log_tilted
+        last = len(self.outcomes) - 1
+
+        bankrolls = np.full(lanes, self.starting_bankroll, dtype=np.int64)
+        peaks = bankrolls.copy()
+        max_drawdowns = np.zeros(lanes, dtype=np.int64)
+        rounds_played = np.zeros(lanes, dtype=np.int64)
+        streaks = np.zeros(lanes, dtype=np.int64)
+        longest_streaks = np.zeros(lanes, dtype=np.int64)
+        log_likelihoods = np.zeros(lanes)
+        ruined = bankrolls < self.rules.min_bet
+
+        for _ in range(self.session_rounds):
+            if ruined.all():
+                break
+            uniforms = self.rng.random(lanes)
+            drawn = np.minimum(np.searchsorted(tilted_cumulative, uniforms, side='right'), last)
+            active = ~ruined
+            tilting = active
+            if depth is not None:
+                tilting = active & (max_drawdowns < depth)
+                nominal = np.minimum(np.searchsorted(nominal_cumulative, uniforms, side='right'), last)
+                drawn = np.where(tilting, drawn, nominal)
+            net = np.where(active, self.outcomes[drawn], 0)
+            log_likelihoods += np.where(tilting, log_ratios[drawn], 0.0)
+            bankrolls += net
+            rounds_played += active
+            streaks = np.where(net < 0, streaks + 1, 0)
+            np.maximum(longest_streaks, streaks, out=longest_streaks)
+            np.maximum(peaks, bankrolls, out=peaks)
+            np.maximum(max_drawdowns, peaks - bankrolls, out=max_drawdowns)
+            ruined |= bankrolls < self.rules.min_bet
+
+        results = SessionResults(self.starting_bankroll, bankrolls, max_drawdowns, rounds_played, ruined, longest_streaks)
+        return results, log_likelihoods
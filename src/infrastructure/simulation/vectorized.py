@@ -0,0 +1,343 @@
+"""Plays many flat-bet Blackjack rounds at once as NumPy array operations."""
+
+import time
+from typing import Optional, Union
+import numpy as np
+from src.application.basic_strategy import (
+    BasicStrategy,
+    STAND,
+    DOUBLE_OR_HIT,
+    DOUBLE_OR_STAND,
+    UPCARDS,
+    SOFT_OFFSET,
+    PAIR_OFFSET,
+)
+from src.domain.Card import RANKS, STANDARD_CARDS
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.shoe_batch import generate_shoes
+from src.infrastructure.simulation.simulator import SimulationResult
+
+CARD_VALUES = np.array([card.value for card in STANDARD_CARDS], dtype=np.int16)
+# Cards are laid out suit-major, so the rank of a card code is its position within a suit.
+CARD_RANKS = (np.arange(len(STANDARD_CARDS)) % len(RANKS)).astype(np.int16)
+# The value of each card with Aces counted as 1, and whether it is an Ace.
+HARD_VALUES = np.where(CARD_VALUES == 11, 1, CARD_VALUES).astype(np.int16)
+ACES = (CARD_VALUES == 11).astype(np.int16)
+
+PLAYING = 0
+STOOD = 1
+BUSTED = 2
+
+DEFAULT_LANES = 65_536
+DEFAULT_MAX_HANDS = 8
+# The spare balance of lanes played without a bankroll: enough for any double or split.
+UNLIMITED = 2**62
+
+
+class VectorizedSimulator:
+    """Plays a basic-strategy player on many independent shoes in lockstep.
+
+    Each lane is one shoe. Every call to `play_round` plays one round on every
+    lane, with each step of the round applied to all lanes as an array
+    operation. Lanes follow the same rules as the reference use cases:
+
+    * `StartRound`: a lane whose shoe has reached `rules.reshuffle_penetration`
+      gets a freshly shuffled shoe from `generate_shoes` before dealing, in the
+      casino order player, dealer, player, dealer.
+    * `PlayerAction`: hands are played in order with masked iterations; only the
+      lanes that still have a hand in play take part. Split hands are appended
+      after the existing hands and receive their second card right after the
+      original hand.
+    * `DealerPlays`: the dealer hits below 17 and takes a single extra card on a
+      soft 17 when the rules say so.
+    * `DetermineOutcome`: blackjacks win `int(bet * blackjack_payout)`.
+
+    By default every lane bets `bet` with an unlimited bankroll. `play_round` can
+    instead take a bet and a balance per lane; doubling and splitting then
+    require the remaining balance to cover another bet, as in `PlayerAction`.
+    Each lane holds at most `max_hands` hands per round, and a pair is played
+    unsplit once that limit is reached. That is the only difference from
+    `LeanRoundKernel`, and it is practically never hit with the default of 8.
+
+    Attributes:
+        shoes (np.ndarray): The current `(lanes, cards)` matrix of card codes.
+        positions (np.ndarray): The index of the next card to deal in each lane.
+        num_hands (np.ndarray): The number of hands each lane played in the last round.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        strategy: BasicStrategy,
+        bet: Optional[int] = None,
+        lanes: int = DEFAULT_LANES,
+        max_hands: int = DEFAULT_MAX_HANDS,
+        seed: Union[int, np.random.Generator, None] = None,
+    ):
+        """Initializes the simulator with a freshly shuffled shoe in every lane.
+
+        Args:
+            rules (GameRules): The rules of the simulated table.
+            strategy (BasicStrategy): The chart the player follows.
+            bet (Optional[int]): The default flat bet. Defaults to `rules.min_bet`.
+            lanes (int): The number of shoes played side by side.
+            max_hands (int): The maximum number of hands per lane and round.
+            seed (Union[int, np.random.Generator, None]): A seed or NumPy generator
+                for reproducible shoes.
+        """
+        self.rules = rules
+        self.bet = bet if bet is not None else rules.min_bet
+        self.lanes = lanes
+        self.max_hands = max_hands
+        self.rng = np.random.default_rng(seed)
+        self.table = np.frombuffer(bytes(strategy.table), dtype=np.uint8)
+
+        self.shoes = generate_shoes(lanes, rules.num_decks, self.rng)
+        self.shoe_size = self.shoes.shape[1]
+        self.positions = np.zeros(lanes, dtype=np.int64)
+        self._lanes = np.arange(lanes)
+        self._row_starts = self._lanes * self.shoe_size
+
+        # Hand state is kept as one row per hand position, so each position is contiguous.
+        shape = (max_hands, lanes)
+        self._hard = np.zeros(shape, dtype=np.int16)
+        self._aces = np.zeros(shape, dtype=np.int16)
+        self._cards = np.zeros(shape, dtype=np.int16)
+        self._first_rank = np.zeros(shape, dtype=np.int16)
+        self._second_rank = np.zeros(shape, dtype=np.int16)
+        self._first_value = np.zeros(shape, dtype=np.int16)
+        self._stake = np.zeros(shape, dtype=np.int64)
+        self._status = np.zeros(shape, dtype=np.int8)
+        self._available = np.zeros(lanes, dtype=np.int64)
+        self.num_hands = np.ones(lanes, dtype=np.int64)
+
+    def run(self, rounds: int) -> SimulationResult:
+        """Plays at least the requested number of rounds, in lockstep batches.
+
+        Args:
+            rounds (int): The minimum number of rounds to play. The total is rounded
+                up to a whole number of batches of `lanes` rounds.
+
+        Returns:
+            SimulationResult: The aggregated results.
+        """
+        result = SimulationResult(bet=self.bet)
+        start = time.perf_counter()
+        while result.rounds < rounds:
+            net = self.play_round()
+            result.rounds += self.lanes
+            result.hands += int(self.num_hands.sum())
+            result.net += int(net.sum())
+            result.net_squared += int(np.dot(net, net))
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+    def play_round(self, bets: Optional[np.ndarray] = None, balances: Optional[np.ndarray] = None) -> np.ndarray:
+        """Plays one round on every lane.
+
+        Args:
+            bets (Optional[np.ndarray]): The initial bet of each lane. Defaults to the
+                flat bet everywhere. A lane with a bet of 0 sits the round out but
+                still deals its cards.
+            balances (Optional[np.ndarray]): The balance of each lane before betting.
+                Defaults to an unlimited bankroll.
+
+        Returns:
+            np.ndarray: The player's winnings in each lane.
+        """
+        self.reshuffle_spent_shoes()
+
+        # StartRound: player, dealer, player, dealer.
+        first, upcard, second, hole = self._deal_block(4)
+        self.num_hands[:] = 1
+        self._status[0] = PLAYING
+        self._stake[0] = self.bet if bets is None else bets
+        if balances is None:
+            self._available[:] = UNLIMITED
+        else:
+            np.subtract(balances, self._stake[0], out=self._available)
+        self._hard[0] = HARD_VALUES[first] + HARD_VALUES[second]
+        self._aces[0] = ACES[first] + ACES[second]
+        self._cards[0] = 2
+        self._first_rank[0] = CARD_RANKS[first]
+        self._second_rank[0] = CARD_RANKS[second]
+        self._first_value[0] = CARD_VALUES[first]
+        dealer_hard = HARD_VALUES[upcard] + HARD_VALUES[hole]
+        dealer_aces = ACES[upcard] + ACES[hole]
+        upcard = CARD_VALUES[upcard]
+
+        for slot in range(self.max_hands):
+            if not self._play_slot(slot, upcard):
+                break
+
+        dealer_value, dealer_blackjack = self._play_dealer(dealer_hard, dealer_aces)
+        return self._settle(dealer_value, dealer_blackjack)
+
+    def reshuffle_spent_shoes(self):
+        """Replaces the shoe of every lane that has reached the reshuffle penetration.
+
+        `play_round` does this before dealing; simulators that share the shoes
+        call it to reshuffle them before their own rounds.
+        """
+        remaining = self.shoe_size - self.positions
+        self._reshuffle(self._lanes[1.0 - remaining / self.shoe_size >= self.rules.reshuffle_penetration])
+
+    def _deal_block(self, count: int) -> np.ndarray:
+        """Deals the next `count` cards of every lane as a `(count, lanes)` matrix."""
+        if (self.positions + count > self.shoe_size).any():
+            return np.stack([self._deal(self._lanes) for _ in range(count)])
+        offsets = self._row_starts + self.positions
+        self.positions += count
+        return self.shoes.reshape(-1).take(offsets + np.arange(count)[:, None])
+
+    def _deal(self, rows: np.ndarray) -> np.ndarray:
+        """Deals the next card of each given lane, reshuffling exhausted shoes."""
+        positions = self.positions[rows]
+        exhausted = positions >= self.shoe_size
+        if exhausted.any():
+            self._reshuffle(rows[exhausted])
+            positions = self.positions[rows]
+        self.positions[rows] = positions + 1
+        return self.shoes.reshape(-1).take(self._row_starts[rows] + positions)
+
+    def _reshuffle(self, rows: np.ndarray):
+        """Replaces the shoes of the given lanes with freshly shuffled ones."""
+        if rows.size:
+            self.shoes[rows] = generate_shoes(rows.size, self.rules.num_decks, self.rng)
+            self.positions[rows] = 0
+
+    def _play_slot(self, slot: int, upcard: np.ndarray) -> bool:
+        """Plays one hand position to completion in every lane that has it.
+
+        Returns:
+            bool: False if no lane has a hand in this position.
+        """
+        hard, aces, cards = self._hard[slot], self._aces[slot], self._cards[slot]
+        status, stake = self._status[slot], self._stake[slot]
+        available = self._available
+        first_rank, second_rank, first_value = self._first_rank[slot], self._second_rank[slot], self._first_value[slot]
+        table = self.table
+
+        rows = self._lanes if slot == 0 else np.flatnonzero(self.num_hands > slot)
+        if not rows.size:
+            return False
+        while rows.size:
+            column = upcard[rows] - 2
+            lane_hard = hard[rows]
+            soft = (aces[rows] > 0) & (lane_hard <= 11)
+            total = lane_hard + 10 * soft
+            lane_stake = stake[rows]
+            can_afford = (cards[rows] == 2) & (available[rows] >= lane_stake)
+
+            splitting = (
+                can_afford
+                & (first_rank[rows] == second_rank[rows])
+                & (self.num_hands[rows] < self.max_hands)
+                & (table[PAIR_OFFSET + first_value[rows] * UPCARDS + column] == 1)
+            )
+            action = table[SOFT_OFFSET * soft + np.minimum(total, 21) * UPCARDS + column]
+            standing = ~splitting & (
+                (total >= 21) | (action == STAND) | ((action == DOUBLE_OR_STAND) & ~can_afford)
+            )
+            drawing = ~splitting & ~standing
+            doubling = drawing & can_afford & (action >= DOUBLE_OR_HIT)
+
+            status[rows[standing]] = STOOD
+
+            drawn = rows[drawing]
+            if drawn.size:
+                doubled = rows[doubling]
+                available[doubled] -= stake[doubled]
+                stake[doubled] *= 2
+                # A doubled hand is finished after one card; busting is checked below.
+                status[doubled] = STOOD
+                codes = self._deal(drawn)
+                hard[drawn] += HARD_VALUES[codes]
+                aces[drawn] += ACES[codes]
+                cards[drawn] += 1
+                status[drawn[hard[drawn] > 21]] = BUSTED
+
+            split = rows[splitting]
+            if split.size:
+                self._split(split, slot)
+
+            rows = rows[status[rows] == PLAYING]
+        return True
+
+    def _split(self, rows: np.ndarray, slot: int):
+        """Splits the pair in one hand position of each given lane into two hands."""
+        new_slot = self.num_hands[rows]
+        value = self._first_value[slot, rows]
+        single_hard = np.where(value == 11, 1, value)
+        single_aces = (value == 11).astype(np.int16)
+        stake = self._stake[slot, rows]
+        self._available[rows] -= stake
+        self._first_rank[new_slot, rows] = self._second_rank[slot, rows]
+        for target in (slot, new_slot):
+            self._hard[target, rows] = single_hard
+            self._aces[target, rows] = single_aces
+            self._cards[target, rows] = 1
+            self._first_value[target, rows] = value
+            self._stake[target, rows] = stake
+            self._status[target, rows] = PLAYING
+        self.num_hands[rows] += 1
+
+        # The original hand is dealt its second card first, then the new hand.
+        for target in (slot, new_slot):
+            codes = self._deal(rows)
+            self._hard[target, rows] += HARD_VALUES[codes]
+            self._aces[target, rows] += ACES[codes]
+            self._cards[target, rows] = 2
+            self._second_rank[target, rows] = CARD_RANKS[codes]
+
+    def _play_dealer(self, hard: np.ndarray, aces: np.ndarray):
+        """Plays the dealer's hand in every lane.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The dealer's final value and whether it
+            is a blackjack, per lane.
+        """
+        value = _value(hard, aces)
+        blackjack = value == 21
+        rows = self._lanes[value < 17]
+        while rows.size:
+            codes = self._deal(rows)
+            hard[rows] += HARD_VALUES[codes]
+            aces[rows] += ACES[codes]
+            value[rows] = _value(hard[rows], aces[rows])
+            rows = rows[value[rows] < 17]
+        if self.rules.dealer_hits_on_soft_17:
+            rows = self._lanes[(value == 17) & (aces > 0) & (hard == 7)]
+            if rows.size:
+                codes = self._deal(rows)
+                hard[rows] += HARD_VALUES[codes]
+                aces[rows] += ACES[codes]
+                value[rows] = _value(hard[rows], aces[rows])
+        return value, blackjack
+
+    def _settle(self, dealer_value: np.ndarray, dealer_blackjack: np.ndarray) -> np.ndarray:
+        """Settles every hand and returns the winnings of each lane."""
+        dealer_busted = dealer_value > 21
+        net = np.zeros(self.lanes, dtype=np.int64)
+        for slot in range(self.max_hands):
+            rows = self._lanes if slot == 0 else np.flatnonzero(self.num_hands > slot)
+            if not rows.size:
+                break
+            stake = self._stake[slot, rows]
+            busted = self._status[slot, rows] == BUSTED
+            value = _value(self._hard[slot, rows], self._aces[slot, rows])
+            dealer = dealer_value[rows]
+            blackjack = (self._cards[slot, rows] == 2) & (value == 21)
+
+            blackjack_wins = ~busted & blackjack & (dealer_busted[rows] | ~dealer_blackjack[rows])
+            wins = ~busted & ~blackjack_wins & (dealer_busted[rows] | (value > dealer))
+            losses = busted | (~blackjack_wins & ~wins & (value < dealer))
+            # Blackjacks are never doubled, so the stake is the initial bet; the cast truncates like int().
+            blackjack_win = (stake * self.rules.blackjack_payout).astype(np.int64)
+            net[rows] += blackjack_wins * blackjack_win + wins * stake - losses * stake
+        return net
+
+
+def _value(hard: np.ndarray, aces: np.ndarray) -> np.ndarray:
+    """Returns hand values, counting one Ace as 11 when that does not bust the hand."""
+    return hard + 10 * ((aces > 0) & (hard <= 11))
@@ -0,0 +1,102 @@
+"""Caches compiled basic-strategy charts on disk."""
+
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+from src.application.basic_strategy import BasicStrategy, TABLE_SIZE
+from src.application.compile_basic_strategy import COMPILER_VERSION, CompileBasicStrategy
+from src.domain.GameRules import GameRules
+
+MAGIC = b"BJBS"
+FORMAT_VERSION = 1
+HEADER_SIZE = 8
+
+# Only these rules change the optimal play; betting limits and penetration do not.
+STRATEGY_RULE_FIELDS = ("blackjack_payout", "dealer_hits_on_soft_17", "num_decks")
+
+
+class StrategyStore:
+    """Loads basic-strategy charts from memory-mapped files, compiling them on a miss.
+
+    Each chart is stored in its own file named after a hash of the rules that
+    affect strategy. A file is a short header followed by the raw table bytes.
+    It is memory-mapped read-only, so loading costs a file open and no parsing.
+    Charts already loaded by this store are reused.
+
+    Attributes:
+        directory (Path): The directory the chart files are kept in.
+    """
+
+    def __init__(self, directory: Union[str, Path, None] = None, compiler: Optional[CompileBasicStrategy] = None):
+        """Initializes the store.
+
+        Args:
+            directory (Union[str, Path, None]): The cache directory. Defaults to
+                `~/.cache/blackjack_vibec/strategies`.
+            compiler (Optional[CompileBasicStrategy]): The use case that compiles
+                missing charts. Defaults to a new instance.
+        """
+        self.directory = Path(directory) if directory is not None else Path.home() / ".cache" / "blackjack_vibec" / "strategies"
+        self.compiler = compiler or CompileBasicStrategy()
+        self._loaded: Dict[str, BasicStrategy] = {}
+
+    def rules_key(self, rules: GameRules) -> str:
+        """Returns the hash that identifies the chart for the given rules and compiler version."""
+        relevant = {name: getattr(rules, name) for name in STRATEGY_RULE_FIELDS}
+        material = json.dumps({"version": FORMAT_VERSION, "compiler": COMPILER_VERSION, **relevant}, sort_keys=True)
+        return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+    def path_for(self, rules: GameRules) -> Path:
+        """Returns the file the chart for the given rules is stored in."""
+        return self.directory / f"{self.rules_key(rules)}.bjbs"
+
+    def load_or_compile(self, rules: GameRules) -> BasicStrategy:
+        """Returns the chart for the given rules, compiling and saving it if needed.
+
+        Args:
+            rules (GameRules): The rules of the game.
+
+        Returns:
+            BasicStrategy: A chart backed by a memory-mapped file.
+        """
+        key = self.rules_key(rules)
+        strategy = self._loaded.get(key)
+        if strategy is None:
+            path = self.path_for(rules)
+            if not self._is_valid(path):
+                self.save(self.compiler.execute(rules), path)
+            strategy = self._map(path)
+            self._loaded[key] = strategy
+        return strategy
+
+    def save(self, strategy: BasicStrategy, path: Path):
+        """Writes a chart to disk atomically.
+
+        Args:
+            strategy (BasicStrategy): The chart to save.
+            path (Path): The destination file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = MAGIC + bytes([FORMAT_VERSION, 0, 0, 0])
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(header + bytes(strategy.table))
+        os.replace(temporary, path)
+
+    def _is_valid(self, path: Path) -> bool:
+        """Returns True if the file exists and has the expected header and size."""
+        try:
+            with open(path, "rb") as file:
+                header = file.read(HEADER_SIZE)
+                size = os.fstat(file.fileno()).st_size
+        except FileNotFoundError:
+            return False
+        return header[:5] == MAGIC + bytes([FORMAT_VERSION]) and size == HEADER_SIZE + TABLE_SIZE
+
+    def _map(self, path: Path) -> BasicStrategy:
+        """Memory-maps a chart file."""
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return BasicStrategy(memoryview(mapped)[HEADER_SIZE:])
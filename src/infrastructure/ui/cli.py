@@ -3,6 +3,7 @@ from src.interface_adapters.game_presenter import GamePresenter
 from src.domain.Game import Game
 from src.domain.Player import Player
 from src.domain.GameRules import GameRules
+from src.domain.GameState import Action
 
 
 def main():
@@ -32,7 +33,7 @@ def main():
         controller.start_new_round()
 
         # Player's Turn
-        while player.get_overall_status() == "playing":
+        while player.get_overall_status().label == "playing":
             view_model = presenter.present(game)
             
             # Display all player hands
@@ -41,6 +42,10 @@ def main():
 
             print(f"Dealer's hand: {view_model.dealer_cards}")
 
+            # Show the expected value of each legal action for the current hand
+            action_evs = controller.get_action_evs(player)
+            print("Expected value per unit bet: " + ", ".join(f"{name} {ev:+.3f}" for name, ev in action_evs.items()))
+
             current_hand = player.get_current_hand()
 
             # Determine available actions based on player's current hand and game state
@@ -62,11 +67,11 @@ def main():
             action = input(action_prompt).lower()
 
             if action in ["h", "hit"]:
-                controller.perform_player_action(player, "hit")
+                controller.perform_player_action(player, Action.HIT)
             elif action in ["s", "stand"]:
-                controller.perform_player_action(player, "stand")
+                controller.perform_player_action(player, Action.STAND)
             elif action in ["d", "doubledown"] and "d" in available_actions:
-                controller.perform_player_action(player, "doubleDown")
+                controller.perform_player_action(player, Action.DOUBLE_DOWN)
                 # Re-present view model to show the new card after double down
                 view_model = presenter.present(game)
                 for hand_vm in view_model.players:
@@ -74,7 +79,7 @@ def main():
                         print(f"Your hand {hand_vm.hand_index + 1}: {hand_vm.cards} (Value: {hand_vm.value})")
                 print(f"You doubled down. Your bet for this hand is now ${player.get_current_bet()}")
             elif action in ["sp", "split"] and "sp" in available_actions:
-                controller.perform_player_action(player, "split")
+                controller.perform_player_action(player, Action.SPLIT)
                 # Re-present view model to show the new hands after split
                 view_model = presenter.present(game)
                 for hand_vm in view_model.players:
@@ -84,7 +89,6 @@ def main():
                 print("Invalid action or action not available.")
 
         # Dealer's Turn
-        game.game_state = "dealerTurn"
         controller.dealer_turn()
 
         # Get view model before determining outcome (which clears hands)
@@ -102,7 +106,7 @@ def main():
             print(f"Your final hand {hand_vm.hand_index + 1}: {hand_vm.cards} (Value: {hand_vm.value})")
 
         # Determine Outcome (using the status from the view_model, which was captured before reset)
-        player_overall_status = player.get_overall_status()
+        player_overall_status = player.get_overall_status().label
         if player_overall_status == "win":
             print("You win!")
         elif player_overall_status == "lose":
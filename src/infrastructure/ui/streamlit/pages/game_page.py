@@ -1,4 +1,5 @@
 import streamlit as st
+from src.domain.GameState import Action
 from src.infrastructure.ui.streamlit.ui_components import display_hand
 
 st.set_page_config(page_title="Blackjack Table", layout="wide")
@@ -65,8 +66,7 @@ if view_model.game_state == "betting":
 elif view_model.game_state == "playerTurn":
     # If all hands are played, it's the dealer's turn. This is the main state transition.
     if player.all_hands_played():
-        # 1. Set state to dealerTurn and let dealer play.
-        game.game_state = 'dealerTurn'
+        # 1. End the player's turn and let the dealer play.
         controller.dealer_turn()
 
         # 2. Immediately determine the outcome of the hands.
@@ -106,22 +106,33 @@ elif view_model.game_state == "playerTurn":
                     and player.balance >= hand_vm.bet
                 )
 
+                # Show the expected value of each legal action
+                action_evs = controller.get_action_evs(player)
+                best_action = max(action_evs, key=action_evs.get)
+                st.caption(
+                    "Expected value per unit bet: "
+                    + " | ".join(
+                        f"**{name}: {ev:+.3f}**" if name == best_action else f"{name}: {ev:+.3f}"
+                        for name, ev in action_evs.items()
+                    )
+                )
+
                 action_cols = st.columns(4)
                 with action_cols[0]:
                     if st.button("Hit", key=f"hit_{i}", use_container_width=True):
-                        controller.perform_player_action(player, "hit")
+                        controller.perform_player_action(player, Action.HIT)
                         st.rerun()
                 with action_cols[1]:
                     if st.button("Stand", key=f"stand_{i}", use_container_width=True):
-                        controller.perform_player_action(player, "stand")
+                        controller.perform_player_action(player, Action.STAND)
                         st.rerun()
                 with action_cols[2]:
                     if st.button("Double Down", key=f"double_{i}", use_container_width=True, disabled=not can_double):
-                        controller.perform_player_action(player, "doubleDown")
+                        controller.perform_player_action(player, Action.DOUBLE_DOWN)
                         st.rerun()
                 with action_cols[3]:
                     if st.button("Split", key=f"split_{i}", use_container_width=True, disabled=not can_split):
-                        controller.perform_player_action(player, "split")
+                        controller.perform_player_action(player, Action.SPLIT)
                         st.rerun()
             elif hand_vm.status != "playing":
                 st.info(f"Hand status: **{hand_vm.status.upper()}**")
@@ -130,14 +141,13 @@ elif view_model.game_state == "playerTurn":
 elif view_model.game_state == "roundOver":
     st.header("🏁 Round Over 🏁")
 
-    # Determine overall outcome message
-    outcome = player.get_overall_status()
-    if outcome == "win":
-        st.success(f"You win! Your new balance is ${player.balance}")
-    elif outcome == "push":
-        st.warning(f"It's a push. Your balance is ${player.balance}")
+    # Show the overall outcome message
+    if view_model.outcome == "win":
+        st.success(view_model.outcome_message)
+    elif view_model.outcome == "push":
+        st.warning(view_model.outcome_message)
     else:  # lose or busted
-        st.error(f"You lose. Your new balance is ${player.balance}")
+        st.error(view_model.outcome_message)
 
     # Display final hands
     dealer_col, player_col = st.columns(2)
@@ -157,33 +167,3 @@ elif view_model.game_state == "roundOver":
         controller.reset_round_for_new_game()
         st.rerun()
 
-
-elif view_model.game_state == "roundOver":
-    st.header("🏁 Round Over 🏁")
-
-    # Determine overall outcome message
-    outcome = player.get_overall_status()
-    if outcome == "win":
-        st.success(f"You win! Your new balance is ${player.balance}")
-    elif outcome == "push":
-        st.warning(f"It's a push. Your balance is ${player.balance}")
-    else:  # lose or busted
-        st.error(f"You lose. Your new balance is ${player.balance}")
-
-    # Display final hands
-    dealer_col, player_col = st.columns(2)
-    with dealer_col:
-        st.subheader(f"Dealer's Hand (Value: {view_model.dealer_value})")
-        display_hand(view_model.dealer_cards)
-    with player_col:
-        st.subheader("Your Hand(s)")
-        for hand_vm in view_model.players:
-            st.text(
-                f"Hand {hand_vm.hand_index + 1} (Value: {hand_vm.value}) - Status: {hand_vm.status.upper()}"
-            )
-            display_hand(hand_vm.cards)
-            st.markdown("---")
-
-    if st.button("Next Round"):
-        controller.end_round()
-        st.rerun()
@@ -1,14 +1,20 @@
 """Handles user input and orchestrates application use cases."""
 
-from src.application.start_round import StartRound
+from src.application.start_round import ShoeFactory, StartRound
 from src.application.place_bet import PlaceBet
 from src.application.player_action import PlayerAction
 from src.application.dealer_plays import DealerPlays
 from src.application.determine_outcome import DetermineOutcome
 from src.application.reset_round import ResetRound
+from src.application.evaluate_actions import EvaluateActions
 from src.domain.Game import Game
+from src.domain.GameState import Action, GameState
 from src.domain.Player import Player
-from typing import Dict
+from typing import Dict, Optional
+
+# Enum member lookups are slow on Python 3.11, so hot code uses module-level aliases.
+BETTING = GameState.BETTING
+DEALER_TURN = GameState.DEALER_TURN
 
 
 class GameController:
@@ -18,19 +24,23 @@ class GameController:
     The UI layer calls methods on this controller to perform game actions.
     """
 
-    def __init__(self, game: Game):
+    def __init__(self, game: Game, shoe_factory: Optional[ShoeFactory] = None):
         """Initializes the GameController with all necessary use cases.
 
         Args:
             game (Game): The main game instance.
+            shoe_factory (Optional[ShoeFactory]): Supplies shoes shuffled ahead of time
+                for the reshuffle at the start of a round. If None, the shoe is
+                reshuffled in place.
         """
         self.game = game
-        self.start_round = StartRound()
+        self.start_round = StartRound(shoe_factory)
         self.place_bet = PlaceBet()
         self.player_action = PlayerAction()
         self.dealer_plays = DealerPlays()
         self.determine_outcome = DetermineOutcome()
         self.reset_round = ResetRound()
+        self.evaluate_actions = EvaluateActions()
 
     def start_new_round(self):
         """Starts a new round of the game."""
@@ -45,7 +55,7 @@ class GameController:
         Raises:
             ValueError: If the bet is invalid or the game is not in the 'betting' state.
         """
-        if self.game.game_state != 'betting':
+        if self.game.game_state is not BETTING:
             raise ValueError("Can only place bets in 'betting' state.")
 
         for player, amount in bets.items():
@@ -55,17 +65,37 @@ class GameController:
                 raise ValueError("Insufficient balance to place this bet.")
             self.place_bet.execute(self.game, {player: amount})
 
-    def perform_player_action(self, player: Player, action: str):
+    def perform_player_action(self, player: Player, action: Action):
         """Performs a specific action for a player (e.g., hit, stand).
 
         Args:
             player (Player): The player performing the action.
-            action (str): The action to be performed.
+            action (Action): The action to be performed.
         """
         self.player_action.execute(self.game, player, action)
 
+    def get_action_evs(self, player: Player) -> Dict[str, float]:
+        """Returns the expected value of each legal action for the player's current hand.
+
+        The use case keeps its caches for the lifetime of the controller, so repeated
+        calls during a round and across rounds reuse earlier results.
+
+        Args:
+            player (Player): The player whose current hand is evaluated.
+
+        Returns:
+            Dict[str, float]: The expected value of each legal action, in units of the
+            current hand's bet, keyed by action name.
+        """
+        return self.evaluate_actions.execute(self.game, player)
+
     def dealer_turn(self):
-        """Executes the dealer's turn."""
+        """Ends the player's turn and executes the dealer's turn.
+
+        Raises:
+            ValueError: If the game is not in the 'playerTurn' state.
+        """
+        self.game.transition_to(DEALER_TURN)
         self.dealer_plays.execute(self.game)
 
     def end_round(self):
@@ -1,6 +1,7 @@
 """Transforms domain models into view models for the UI."""
 
 from src.domain.Game import Game
+from src.domain.GameState import GameState, HandStatus
 from src.interface_adapters.game_view_model import GameViewModel, PlayerViewModel
 
 
@@ -30,9 +31,9 @@ class GamePresenter:
             player_view_models.append(PlayerViewModel(
                 hand_index=i,
                 cards=[{'rank': card.rank, 'suit': card.suit} for card in player_hand.cards],
-                value=player_hand.get_value(),
+                value=player_hand.value,
                 bet=player.bets[i],
-                status=player_hand.status
+                status=player_hand.status.label
             ))
 
         dealer_cards = []
@@ -41,18 +42,30 @@ class GamePresenter:
         dealer_current_hand = game.dealer.hands[0]
 
         # Hide dealer's second card if it is the player's turn
-        if game.game_state == 'playerTurn' and len(dealer_current_hand.cards) == 2:
+        if game.game_state is GameState.PLAYER_TURN and len(dealer_current_hand.cards) == 2:
             dealer_cards.append({'rank': dealer_current_hand.cards[0].rank, 'suit': dealer_current_hand.cards[0].suit})
             dealer_cards.append({'rank': '?', 'suit': '?'})
             dealer_value = dealer_current_hand.cards[0].value
         else:
             dealer_cards = [{'rank': card.rank, 'suit': card.suit} for card in dealer_current_hand.cards]
-            dealer_value = dealer_current_hand.get_value()
+            dealer_value = dealer_current_hand.value
 
+        outcome = player.get_overall_status()
         return GameViewModel(
             player_balance=player.balance,
             players=player_view_models,
             dealer_cards=dealer_cards,
             dealer_value=dealer_value,
-            game_state=game.game_state
+            game_state=game.game_state.label,
+            outcome=outcome.label,
+            outcome_message=self._outcome_message(outcome, player.balance)
         )
+
+    def _outcome_message(self, outcome: HandStatus, balance: int) -> str:
+        """Returns the message announcing the player's overall outcome."""
+        if outcome is HandStatus.WIN:
+            return f"You win! Your new balance is ${balance}"
+        elif outcome is HandStatus.PUSH:
+            return f"It's a push. Your balance is ${balance}"
+        else:  # lose or busted
+            return f"You lose. Your new balance is ${balance}"
@@ -33,6 +33,8 @@ class GameViewModel:
         dealer_cards (List[Dict[str, str]]): A list of the dealer's cards.
         dealer_value (int): The current value of the dealer's hand.
         game_state (str): The overall state of the game (e.g., 'playerTurn').
+        outcome (str): The player's overall status (e.g., 'win', 'push', 'busted').
+        outcome_message (str): The message announcing the outcome once the round is over.
     """
 
     player_balance: int
@@ -40,3 +42,5 @@ class GameViewModel:
     dealer_cards: List[Dict[str, str]]
     dealer_value: int
     game_state: str
+    outcome: str = ''
+    outcome_message: str = ''
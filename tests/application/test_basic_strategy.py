@@ -0,0 +1,27 @@
+import pytest
+from src.domain.GameState import Action
+from src.application.basic_strategy import BasicStrategy, TABLE_SIZE
+
+
+def test_table_size(chart):
+    assert len(chart.table) == TABLE_SIZE
+    with pytest.raises(ValueError):
+        BasicStrategy(b"\x00")
+
+
+def test_well_known_plays(chart):
+    assert chart.decide(20, False, 10) is Action.STAND
+    assert chart.decide(16, False, 7) is Action.HIT
+    assert chart.decide(13, False, 4) is Action.STAND
+    assert chart.decide(11, False, 6) is Action.DOUBLE_DOWN
+    assert chart.decide(11, False, 6, can_double=False) is Action.HIT
+    assert chart.decide(18, True, 10) is Action.HIT
+    assert chart.decide(21, False, 10) is Action.STAND
+
+
+def test_pairs(chart):
+    assert chart.decide(12, True, 6, pair_value=11) is Action.SPLIT
+    assert chart.decide(16, False, 6, pair_value=8) is Action.SPLIT
+    assert chart.decide(20, False, 6, pair_value=10) is Action.STAND
+    assert chart.decide(10, False, 6, pair_value=5) is Action.DOUBLE_DOWN
+    assert chart.decide(16, False, 6, pair_value=8, can_split=False) is Action.STAND
@@ -8,6 +8,7 @@ from src.domain.Card import Card
 def test_dealer_plays_hit_until_17():
     rules = GameRules()
     game = Game(players=[], rules=rules)
+    game.game_state = 'playerTurn'
     game.game_state = 'dealerTurn'
     
     game.dealer.hands[0].add_card(Card("Hearts", "10", 10))
@@ -20,11 +21,12 @@ def test_dealer_plays_hit_until_17():
     dealer_plays.execute(game)
 
     assert game.dealer.hands[0].get_value() == 21
-    assert game.dealer.hands[0].status == 'stand'
+    assert game.dealer.hands[0].status.label == 'stand'
 
 def test_dealer_plays_stand_on_17():
     rules = GameRules(dealer_hits_on_soft_17=False)
     game = Game(players=[], rules=rules)
+    game.game_state = 'playerTurn'
     game.game_state = 'dealerTurn'
     
     game.dealer.hands[0].add_card(Card("Hearts", "10", 10))
@@ -35,11 +37,12 @@ def test_dealer_plays_stand_on_17():
 
     assert game.dealer.hands[0].get_value() == 17
     assert len(game.dealer.hands[0].cards) == 2
-    assert game.dealer.hands[0].status == 'stand'
+    assert game.dealer.hands[0].status.label == 'stand'
 
 def test_dealer_plays_hit_on_soft_17():
     rules = GameRules(dealer_hits_on_soft_17=True)
     game = Game(players=[], rules=rules)
+    game.game_state = 'playerTurn'
     game.game_state = 'dealerTurn'
     
     game.dealer.hands[0].add_card(Card("Hearts", "Ace", 11))
@@ -53,11 +56,12 @@ def test_dealer_plays_hit_on_soft_17():
 
     assert game.dealer.hands[0].get_value() == 12
     assert len(game.dealer.hands[0].cards) == 3
-    assert game.dealer.hands[0].status == 'stand'
+    assert game.dealer.hands[0].status.label == 'stand'
 
 def test_dealer_stands_at_18():
     rules = GameRules()
     game = Game(players=[], rules=rules)
+    game.game_state = 'playerTurn'
     game.game_state = 'dealerTurn'
     
     game.dealer.hands[0].add_card(Card("Hearts", "10", 10))
@@ -67,11 +71,12 @@ def test_dealer_stands_at_18():
     dealer_plays.execute(game)
 
     assert game.dealer.hands[0].get_value() == 18
-    assert game.dealer.hands[0].status == 'stand'
+    assert game.dealer.hands[0].status.label == 'stand'
 
 def test_dealer_busts():
     rules = GameRules()
     game = Game(players=[], rules=rules)
+    game.game_state = 'playerTurn'
     game.game_state = 'dealerTurn'
     
     game.dealer.hands[0].add_card(Card("Hearts", "10", 10))
@@ -84,7 +89,7 @@ def test_dealer_busts():
     dealer_plays.execute(game)
 
     assert game.dealer.hands[0].get_value() == 26
-    assert game.dealer.hands[0].status == 'busted'
+    assert game.dealer.hands[0].status.label == 'busted'
     
 def test_dealer_plays_wrong_state():
     rules = GameRules()
@@ -94,3 +99,19 @@ def test_dealer_plays_wrong_state():
     dealer_plays = DealerPlays()
     with pytest.raises(ValueError, match="Not the dealer's turn."):
         dealer_plays.execute(game)
+
+def test_dealer_stands_on_hard_17_with_ace():
+    rules = GameRules(dealer_hits_on_soft_17=True)
+    game = Game(players=[], rules=rules)
+    game.game_state = 'playerTurn'
+    game.game_state = 'dealerTurn'
+
+    game.dealer.hands[0].add_card(Card("Hearts", "Ace", 11))
+    game.dealer.hands[0].add_card(Card("Diamonds", "6", 6))
+    game.dealer.hands[0].add_card(Card("Clubs", "King", 10)) # Hard 17
+
+    DealerPlays().execute(game)
+
+    assert game.dealer.hands[0].get_value() == 17
+    assert len(game.dealer.hands[0].cards) == 3
+    assert game.dealer.hands[0].status.label == 'stand'
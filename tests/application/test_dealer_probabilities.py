@@ -0,0 +1,106 @@
+import itertools
+from collections import Counter
+import pytest
+from src.domain.Card import Card
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.application.dealer_plays import DealerPlays
+from src.application.dealer_probabilities import DealerProbabilities, BUST, BLACKJACK
+
+CARD_BY_VALUE = {
+    value: Card("Spades", rank, value)
+    for rank, value in [("2", 2), ("3", 3), ("4", 4), ("5", 5), ("6", 6), ("7", 7),
+                        ("8", 8), ("9", 9), ("10", 10), ("Ace", 11)]
+}
+
+
+def enumerate_dealer_plays(upcard, shoe_values, hits_soft_17):
+    """Plays DealerPlays on every ordering of a small shoe and tallies the results."""
+    outcomes = Counter()
+    orderings = list(itertools.permutations(shoe_values))
+    for ordering in orderings:
+        game = Game(players=[], rules=GameRules(dealer_hits_on_soft_17=hits_soft_17, num_decks=1))
+        game.game_state = 'playerTurn'
+        game.game_state = 'dealerTurn'
+        game.dealer.hands[0].add_card(CARD_BY_VALUE[upcard])
+        game.deck.cards[:] = [CARD_BY_VALUE[value] for value in reversed(ordering)]
+        DealerPlays().execute(game)
+        hand = game.dealer.hands[0]
+        if hand.value > 21:
+            outcomes[BUST] += 1
+        elif hand.is_blackjack:
+            outcomes[BLACKJACK] += 1
+        else:
+            outcomes[hand.value] += 1
+    return {slot: count / len(orderings) for slot, count in outcomes.items()}
+
+
+def draw_recursively(hard, has_ace, num_cards, drew_on_soft_17, counts, hits_soft_17):
+    """Follows DealerPlays one card at a time, removing each drawn card from the shoe."""
+    value = hard + 10 if has_ace and hard <= 11 else hard
+    soft_17 = value == 17 and has_ace and hard <= 11
+    if drew_on_soft_17 or value > 17 or (value == 17 and not (soft_17 and hits_soft_17)):
+        slot = BUST if value > 21 else BLACKJACK if value == 21 and num_cards == 2 else value
+        return {slot: 1.0}
+    outcomes = Counter()
+    total = sum(counts)
+    for index, count in enumerate(counts):
+        if count:
+            card = index + 2
+            remaining = counts[:index] + (count - 1,) + counts[index + 1:]
+            sub = draw_recursively(hard + (1 if card == 11 else card), has_ace or card == 11,
+                                   min(num_cards + 1, 3), value == 17, remaining, hits_soft_17)
+            for slot, probability in sub.items():
+                outcomes[slot] += count / total * probability
+    return outcomes
+
+
+def composition_of(values):
+    counts = [0] * 10
+    for value in values:
+        counts[value - 2] += 1
+    return counts
+
+
+@pytest.mark.parametrize("upcard, shoe_values, hits_soft_17", [
+    (6, (10, 10, 5, 11, 2, 9), False),
+    (11, (6, 5, 10, 4, 2, 11), True),
+    (11, (6, 5, 10, 4, 2, 11), False),
+    (10, (11, 7, 3, 2, 8, 4), True),
+])
+def test_finite_distribution_matches_dealer_plays(upcard, shoe_values, hits_soft_17):
+    expected = enumerate_dealer_plays(upcard, shoe_values, hits_soft_17)
+    distribution = DealerProbabilities().distribution(upcard, hits_soft_17, composition_of(shoe_values))
+    for slot, probability in enumerate(distribution):
+        assert probability == pytest.approx(expected.get(slot, 0.0))
+
+
+@pytest.mark.parametrize("upcard", range(2, 12))
+@pytest.mark.parametrize("hits_soft_17", [False, True])
+def test_large_shoe_distribution_matches_drawing_card_by_card(upcard, hits_soft_17):
+    counts = (3, 4, 2, 5, 4, 3, 4, 4, 13, 3)
+    expected = draw_recursively(1 if upcard == 11 else upcard, upcard == 11, 1, False, counts, hits_soft_17)
+    distribution = DealerProbabilities().distribution(upcard, hits_soft_17, counts)
+    for slot, probability in enumerate(distribution):
+        assert probability == pytest.approx(expected.get(slot, 0.0), abs=1e-12)
+
+
+def test_infinite_deck_distribution():
+    engine = DealerProbabilities()
+    distribution = engine.distribution(6, hits_soft_17=False)
+    assert sum(distribution) == pytest.approx(1.0)
+    assert distribution[BUST] == pytest.approx(0.4232, abs=1e-4)
+    assert engine.distribution(11, hits_soft_17=False)[BLACKJACK] == pytest.approx(4 / 13)
+    assert sum(engine.distribution(11, hits_soft_17=True)[12:17]) > 0
+
+
+def test_distributions_are_cached():
+    engine = DealerProbabilities(cache_size=2)
+    composition = [24] * 10
+    composition[8] = 96
+    first = engine.distribution(7, True, composition)
+    assert engine.distribution(7, True, tuple(composition)) is first
+    assert engine.cache_info().hits == 1
+    engine.distribution(8, True, composition)
+    engine.distribution(9, True, composition)
+    assert engine.cache_info().currsize == 2
@@ -12,6 +12,8 @@ def game():
     player.place_bet(10)
     rules = GameRules(blackjack_payout=1.5)
     game = Game(players=[player], rules=rules)
+    game.game_state = 'playerTurn'
+    game.game_state = 'dealerTurn'
     game.game_state = 'roundOver'
     return game
 
@@ -81,6 +83,7 @@ def test_dealer_busts(game):
     assert game.players[0].balance == 110
 
 def test_wrong_state(game):
+    game.game_state = 'betting'
     game.game_state = 'playerTurn'
     with pytest.raises(ValueError, match="Can only determine outcome in 'roundOver' state."):
         DetermineOutcome().execute(game)
@@ -91,7 +94,7 @@ def test_resets_for_next_round(game):
     
     assert game.players[0].hands[0].cards == []
     assert game.players[0].bets == [0]
-    assert game.players[0].hands[0].status == 'betting'
+    assert game.players[0].hands[0].status.label == 'betting'
     assert game.dealer.hands[0].cards == []
-    assert game.dealer.hands[0].status == 'betting'
-    assert game.game_state == 'betting'
+    assert game.dealer.hands[0].status.label == 'betting'
+    assert game.game_state.label == 'betting'
@@ -0,0 +1,103 @@
+import random
+import pytest
+from src.domain.Game import Game
+from src.domain.Player import Player
+from src.domain.GameRules import GameRules
+from src.domain.Card import Card
+from src.application.dealer_probabilities import BUST
+from src.application.evaluate_actions import EvaluateActions
+
+
+def deal_table(player_cards, dealer_cards, balance=1000, bet=10, rules=None):
+    """Builds a player-turn game where the given cards have been dealt from the shoe."""
+    player = Player(balance=balance)
+    player.place_bet(bet)
+    game = Game(players=[player], rules=rules or GameRules(), rng=random.Random(0))
+    for card in player_cards:
+        player.hands[0].add_card(card)
+        game.deck.composition.remove(card.value)
+    for card in dealer_cards:
+        game.dealer.hands[0].add_card(card)
+        game.deck.composition.remove(card.value)
+    game.game_state = 'playerTurn'
+    return game, player
+
+
+def test_legal_actions_for_pair():
+    game, player = deal_table(
+        [Card("Hearts", "8", 8), Card("Diamonds", "8", 8)],
+        [Card("Clubs", "10", 10), Card("Spades", "7", 7)],
+    )
+    evs = EvaluateActions().execute(game, player)
+    assert set(evs) == {'hit', 'stand', 'doubleDown', 'split'}
+
+
+def test_no_double_or_split_without_balance():
+    game, player = deal_table(
+        [Card("Hearts", "8", 8), Card("Diamonds", "8", 8)],
+        [Card("Clubs", "10", 10), Card("Spades", "7", 7)],
+        balance=15,
+    )
+    assert set(EvaluateActions().execute(game, player)) == {'hit', 'stand'}
+
+
+def test_stand_matches_dealer_distribution():
+    game, player = deal_table(
+        [Card("Hearts", "10", 10), Card("Diamonds", "King", 10)],
+        [Card("Clubs", "6", 6), Card("Spades", "9", 9)],
+    )
+    advisor = EvaluateActions()
+    unseen = list(game.deck.composition.counts)
+    unseen[9 - 2] += 1  # The hole card is unknown to the player
+    dealer = advisor.dealer_probabilities.distribution(6, True, unseen)
+    expected = dealer[BUST] + sum(dealer[:20]) - sum(dealer[21:22]) - dealer[23]
+    evs = advisor.execute(game, player)
+    assert evs['stand'] == pytest.approx(expected)
+    assert evs['stand'] > evs['hit']
+
+
+def test_prefers_doubling_eleven_against_six():
+    game, player = deal_table(
+        [Card("Hearts", "6", 6), Card("Diamonds", "5", 5)],
+        [Card("Clubs", "6", 6), Card("Spades", "King", 10)],
+    )
+    evs = EvaluateActions().execute(game, player)
+    assert evs['doubleDown'] > evs['hit'] > evs['stand']
+
+
+def test_blackjack_stand_value():
+    game, player = deal_table(
+        [Card("Hearts", "Ace", 11), Card("Diamonds", "King", 10)],
+        [Card("Clubs", "6", 6), Card("Spades", "King", 10)],
+    )
+    assert EvaluateActions().execute(game, player)['stand'] == pytest.approx(1.5)
+
+
+def test_wrong_state():
+    game, player = deal_table([], [Card("Clubs", "6", 6)])
+    game.game_state = 'betting'
+    with pytest.raises(ValueError, match="Not the player's turn."):
+        EvaluateActions().execute(game, player)
+
+
+def test_rounds_share_dealer_draw_tables():
+    first_round = deal_table(
+        [Card("Hearts", "7", 7), Card("Diamonds", "7", 7)],
+        [Card("Clubs", "2", 2), Card("Spades", "4", 4)],
+    )
+    second_round = deal_table(
+        [Card("Hearts", "10", 10), Card("Diamonds", "6", 6)],
+        [Card("Clubs", "2", 2), Card("Spades", "9", 9)],
+    )
+    advisor = EvaluateActions()
+    advisor.execute(*first_round)
+    before = advisor.dealer_probabilities.draw_table_info()
+    advisor.execute(*second_round)
+    after = advisor.dealer_probabilities.draw_table_info()
+    # The unseen cards differ, so the second round misses the per-composition caches...
+    assert advisor.cache_info().misses == 2
+    assert advisor.dealer_probabilities.cache_info().misses == 2
+    # ...but reuses the dealer's draws against a 2 from the first round.
+    assert (after.hits - before.hits, after.misses - before.misses) == (1, 0)
+    assert advisor.execute(*second_round) == advisor.execute(*second_round)
+    assert advisor.cache_info().hits == 2
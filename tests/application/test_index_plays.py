@@ -0,0 +1,39 @@
+from src.application.basic_strategy import BasicStrategy, HIT, STAND, DOUBLE_OR_HIT, TABLE_SIZE
+from src.application.index_plays import DeviationCharts, IndexPlay, ILLUSTRIOUS_18
+
+
+def all_hit_chart():
+    return BasicStrategy(bytes([HIT]) * TABLE_SIZE)
+
+
+def test_index_play_thresholds():
+    above = IndexPlay('hard', 16, 10, 0, STAND)
+    below = IndexPlay('hard', 13, 2, -1, HIT, at_or_above=False)
+    assert above.applies(0) and not above.applies(-1)
+    assert below.applies(-2) and not below.applies(-1)
+
+
+def test_charts_switch_at_the_index():
+    charts = DeviationCharts(all_hit_chart())
+    assert charts.chart_for(-0.5).hard_action(16, 10) == HIT
+    assert charts.chart_for(0.0).hard_action(16, 10) == STAND
+    assert charts.chart_for(3.9).hard_action(10, 10) == HIT
+    assert charts.chart_for(4.2).hard_action(10, 10) == DOUBLE_OR_HIT
+    assert not charts.chart_for(3.9).should_split(10, 6)
+    assert charts.chart_for(4.0).should_split(10, 6)
+
+
+def test_extreme_counts_use_the_outermost_chart():
+    charts = DeviationCharts(all_hit_chart())
+    assert charts.table_for(40) == charts.table_for(10)
+    assert charts.table_for(-40) == charts.table_for(-10)
+
+
+def test_charts_without_plays_match_the_base_chart():
+    base = all_hit_chart()
+    charts = DeviationCharts(base, plays=())
+    assert all(charts.table_for(count) == bytes(base.table) for count in range(-10, 11))
+
+
+def test_illustrious_18_cells_are_distinct():
+    assert len({play.offset for play in ILLUSTRIOUS_18}) == len(ILLUSTRIOUS_18)
@@ -13,7 +13,7 @@ def test_place_bet_success():
     place_bet.execute(game=game, bets={player: 50})
 
     assert player.bets[0] == 50
-    assert player.hands[0].status == 'playing'
+    assert player.hands[0].status.label == 'playing'
 
 def test_place_bet_insufficient_balance():
     player = Player(balance=10)
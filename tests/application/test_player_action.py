@@ -2,6 +2,7 @@ import pytest
 from src.domain.Game import Game
 from src.domain.Player import Player
 from src.domain.GameRules import GameRules
+from src.domain.GameState import Action, HandStatus
 from src.application.player_action import PlayerAction
 from src.domain.Card import Card
 from src.domain.Deck import Deck
@@ -26,7 +27,7 @@ def test_player_action_hit(setup_game_and_player):
     game.deck.cards.clear()
     game.deck.cards.append(Card("Clubs", "2", 2))
 
-    action.execute(game=game, player=player, action='hit')
+    action.execute(game=game, player=player, action=Action.HIT)
 
     assert len(player.get_current_hand().cards) == 3
     assert player.get_current_hand().status != 'busted'
@@ -40,18 +41,25 @@ def test_player_action_hit_bust(setup_game_and_player):
     player.get_current_hand().add_card(Card("Hearts", "10", 10))
     player.get_current_hand().add_card(Card("Diamonds", "Queen", 10))
     
-    action.execute(game=game, player=player, action='hit')
+    action.execute(game=game, player=player, action=Action.HIT)
 
     assert len(player.get_current_hand().cards) == 3
     assert player.get_current_hand().get_value() == 25
-    assert player.get_current_hand().status == 'busted'
+    assert player.get_current_hand().status.label == 'busted'
 
 def test_player_action_stand(setup_game_and_player):
     game, player, action = setup_game_and_player
     
-    action.execute(game=game, player=player, action='stand')
+    action.execute(game=game, player=player, action=Action.STAND)
 
-    assert player.get_current_hand().status == 'stand'
+    assert player.get_current_hand().status.label == 'stand'
+
+def test_player_action_accepts_action_members(setup_game_and_player):
+    game, player, action = setup_game_and_player
+
+    action.execute(game=game, player=player, action=Action.STAND)
+
+    assert player.get_current_hand().status is HandStatus.STAND
 
 def test_player_action_invalid_action(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -59,12 +67,18 @@ def test_player_action_invalid_action(setup_game_and_player):
     with pytest.raises(ValueError, match="Invalid action: foo"):
         action.execute(game=game, player=player, action='foo')
 
+def test_player_action_expects_action_members(setup_game_and_player):
+    game, player, action = setup_game_and_player
+
+    with pytest.raises(ValueError, match="Invalid action: hit"):
+        action.execute(game=game, player=player, action='hit')
+
 def test_player_action_wrong_state(setup_game_and_player):
     game, player, action = setup_game_and_player
     game.game_state = 'betting'
     
     with pytest.raises(ValueError, match="Not the player's turn."):
-        action.execute(game=game, player=player, action='hit')
+        action.execute(game=game, player=player, action=Action.HIT)
 
 def test_player_action_double_down_success(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -75,13 +89,13 @@ def test_player_action_double_down_success(setup_game_and_player):
     game.deck.cards.clear()
     game.deck.cards.append(Card("Clubs", "10", 10)) # Card to be dealt
 
-    action.execute(game=game, player=player, action='doubleDown')
+    action.execute(game=game, player=player, action=Action.DOUBLE_DOWN)
 
     assert player.balance == 80 # 100 - 10 (original bet) - 10 (doubled bet)
     assert player.get_current_bet() == 20
     assert len(player.get_current_hand().cards) == 3
     assert player.get_current_hand().get_value() == 20
-    assert player.get_current_hand().status == 'stand'
+    assert player.get_current_hand().status.label == 'stand'
 
 def test_player_action_double_down_bust(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -92,13 +106,13 @@ def test_player_action_double_down_bust(setup_game_and_player):
     game.deck.cards.clear()
     game.deck.cards.append(Card("Clubs", "5", 5)) # Card to be dealt
 
-    action.execute(game=game, player=player, action='doubleDown')
+    action.execute(game=game, player=player, action=Action.DOUBLE_DOWN)
 
     assert player.balance == 80
     assert player.get_current_bet() == 20
     assert len(player.get_current_hand().cards) == 3
     assert player.get_current_hand().get_value() == 22
-    assert player.get_current_hand().status == 'busted'
+    assert player.get_current_hand().status.label == 'busted'
 
 def test_player_action_double_down_insufficient_balance(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -108,7 +122,7 @@ def test_player_action_double_down_insufficient_balance(setup_game_and_player):
     player.get_current_hand().add_card(Card("Diamonds", "5", 5))
 
     with pytest.raises(ValueError, match="Insufficient balance to double down."):
-        action.execute(game=game, player=player, action='doubleDown')
+        action.execute(game=game, player=player, action=Action.DOUBLE_DOWN)
 
 def test_player_action_double_down_not_two_cards(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -117,13 +131,13 @@ def test_player_action_double_down_not_two_cards(setup_game_and_player):
     player.get_current_hand().add_card(Card("Hearts", "5", 5)) # Only one card
 
     with pytest.raises(ValueError, match="Can only double down on a two-card hand."):
-        action.execute(game=game, player=player, action='doubleDown')
+        action.execute(game=game, player=player, action=Action.DOUBLE_DOWN)
 
     player.get_current_hand().add_card(Card("Diamonds", "5", 5))
     player.get_current_hand().add_card(Card("Clubs", "5", 5)) # Three cards
 
     with pytest.raises(ValueError, match="Can only double down on a two-card hand."):
-        action.execute(game=game, player=player, action='doubleDown')
+        action.execute(game=game, player=player, action=Action.DOUBLE_DOWN)
 
 def test_player_action_double_down_wrong_state(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -134,7 +148,7 @@ def test_player_action_double_down_wrong_state(setup_game_and_player):
     player.get_current_hand().add_card(Card("Diamonds", "5", 5))
 
     with pytest.raises(ValueError, match="Not the player's turn."):
-        action.execute(game=game, player=player, action='doubleDown')
+        action.execute(game=game, player=player, action=Action.DOUBLE_DOWN)
 
 def test_player_action_split_success(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -146,7 +160,7 @@ def test_player_action_split_success(setup_game_and_player):
     game.deck.cards.append(Card("Clubs", "7", 7)) # Card for second hand
     game.deck.cards.append(Card("Spades", "6", 6)) # Card for first hand
 
-    action.execute(game=game, player=player, action='split')
+    action.execute(game=game, player=player, action=Action.SPLIT)
 
     assert player.balance == 80 # 100 - 10 (original bet) - 10 (split bet)
     assert len(player.hands) == 2
@@ -155,8 +169,8 @@ def test_player_action_split_success(setup_game_and_player):
     assert len(player.hands[1].cards) == 2
     assert player.hands[0].get_value() == 14 # 8 + 6
     assert player.hands[1].get_value() == 15 # 8 + 7
-    assert player.hands[0].status == 'playing'
-    assert player.hands[1].status == 'playing'
+    assert player.hands[0].status.label == 'playing'
+    assert player.hands[1].status.label == 'playing'
 
 def test_player_action_split_insufficient_balance(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -166,7 +180,7 @@ def test_player_action_split_insufficient_balance(setup_game_and_player):
     player.get_current_hand().add_card(Card("Diamonds", "8", 8))
 
     with pytest.raises(ValueError, match="Insufficient balance to split."):
-        action.execute(game=game, player=player, action='split')
+        action.execute(game=game, player=player, action=Action.SPLIT)
 
 def test_player_action_split_not_two_cards(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -175,7 +189,7 @@ def test_player_action_split_not_two_cards(setup_game_and_player):
     player.get_current_hand().add_card(Card("Hearts", "8", 8))
 
     with pytest.raises(ValueError, match="Can only split a two-card hand."):
-        action.execute(game=game, player=player, action='split')
+        action.execute(game=game, player=player, action=Action.SPLIT)
 
 def test_player_action_split_cards_not_same_rank(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -185,7 +199,7 @@ def test_player_action_split_cards_not_same_rank(setup_game_and_player):
     player.get_current_hand().add_card(Card("Diamonds", "9", 9))
 
     with pytest.raises(ValueError, match="Cards must be of the same rank to split."):
-        action.execute(game=game, player=player, action='split')
+        action.execute(game=game, player=player, action=Action.SPLIT)
 
 def test_player_action_split_wrong_state(setup_game_and_player):
     game, player, action = setup_game_and_player
@@ -196,4 +210,4 @@ def test_player_action_split_wrong_state(setup_game_and_player):
     player.get_current_hand().add_card(Card("Diamonds", "8", 8))
 
     with pytest.raises(ValueError, match="Not the player's turn."):
-        action.execute(game=game, player=player, action='split')
+        action.execute(game=game, player=player, action=Action.SPLIT)
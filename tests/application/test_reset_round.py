@@ -0,0 +1,83 @@
+import gc
+import random
+import tracemalloc
+import pytest
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Hand import Hand
+from src.domain.GameState import Action
+from src.domain.Player import Player
+from src.application.reset_round import ResetRound
+from src.interface_adapters.game_controller import GameController
+
+
+def play_rounds(controller, rounds):
+    """Plays rounds that split every pair, then resets the table."""
+    game = controller.game
+    player = game.players[0]
+    for _ in range(rounds):
+        controller.place_bets({player: 10})
+        controller.start_new_round()
+        while not player.all_hands_played():
+            hand = player.get_current_hand()
+            if hand.is_pair and player.balance >= 10:
+                action = Action.SPLIT
+            elif hand.value < 12:
+                action = Action.HIT
+            else:
+                action = Action.STAND
+            controller.perform_player_action(player, action)
+        controller.dealer_turn()
+        controller.end_round()
+        controller.reset_round_for_new_game()
+
+
+@pytest.fixture
+def controller():
+    game = Game([Player(balance=10**9)], GameRules(num_decks=1), deck=ArrayShoe(1, rng=random.Random(3)))
+    controller = GameController(game)
+    # Warm up until the pool holds as many hands as any later round needs.
+    play_rounds(controller, 2000)
+    return controller
+
+
+def test_reset_round_reuses_hands_and_bets():
+    game = Game([Player(balance=100)], GameRules())
+    player = game.players[0]
+    first_hand, hands, bets = player.hands[0], player.hands, player.bets
+    split_hand = player.new_hand()
+    player.add_hand(split_hand, 10)
+    game.game_state = 'playerTurn'
+    game.game_state = 'dealerTurn'
+    game.game_state = 'roundOver'
+
+    ResetRound().execute(game)
+
+    assert player.hands is hands and player.bets is bets
+    assert player.hands == [first_hand]
+    assert player.bets == [0]
+    assert player.new_hand() is split_hand
+    assert split_hand.cards == [] and split_hand.status.label == 'playing'
+
+
+def test_steady_state_rounds_allocate_no_hands(controller):
+    tracemalloc.start()
+    try:
+        play_rounds(controller, 10)
+        # Forget everything allocated so far: only blocks allocated from here on are traced.
+        tracemalloc.clear_traces()
+        play_rounds(controller, 500)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    hand_blocks = snapshot.filter_traces([tracemalloc.Filter(True, Hand.__init__.__code__.co_filename)])
+    assert hand_blocks.statistics('lineno') == []
+
+
+def test_steady_state_rounds_keep_the_same_hand_objects(controller):
+    before = [obj for obj in gc.get_objects() if isinstance(obj, Hand)]
+    play_rounds(controller, 500)
+    after = [obj for obj in gc.get_objects() if isinstance(obj, Hand)]
+    # `before` keeps the old hands alive, so a new hand cannot reuse one of their ids.
+    assert {id(hand) for hand in after} <= {id(hand) for hand in before}
@@ -1,3 +1,6 @@
+import pytest
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Card import STANDARD_CARDS
 from src.domain.Game import Game
 from src.domain.Player import Player
 from src.domain.GameRules import GameRules
@@ -14,4 +17,26 @@ def test_start_round_execute():
     assert len(game.players[0].hands[0].cards) == 2
     assert len(game.dealer.hands[0].cards) == 2
     assert len(game.deck.cards) == (rules.num_decks * 52) - 4
-    assert game.game_state == 'playerTurn'
+    assert game.game_state.label == 'playerTurn'
+
+
+def test_start_round_deals_in_casino_order():
+    players = [Player(balance=100) for _ in range(3)]
+    game = Game(players=players, rules=GameRules(num_decks=1), deck=ArrayShoe.from_order(range(52)))
+    StartRound().execute(game)
+
+    assert [player.hands[0].cards for player in players] == [
+        [STANDARD_CARDS[0], STANDARD_CARDS[4]],
+        [STANDARD_CARDS[1], STANDARD_CARDS[5]],
+        [STANDARD_CARDS[2], STANDARD_CARDS[6]],
+    ]
+    assert game.dealer.hands[0].cards == [STANDARD_CARDS[3], STANDARD_CARDS[7]]
+
+
+def test_start_round_requires_betting_state():
+    game = Game(players=[Player(balance=100)], rules=GameRules())
+    game.game_state = 'playerTurn'
+    game.game_state = 'dealerTurn'
+    with pytest.raises(ValueError, match="Cannot move from 'dealerTurn' to 'playerTurn'"):
+        StartRound().execute(game)
+    assert game.deck.cards_remaining == game.deck.total_cards
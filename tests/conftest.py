@@ -0,0 +1,9 @@
+import pytest
+from src.domain.GameRules import GameRules
+from src.application.compile_basic_strategy import CompileBasicStrategy
+
+
+@pytest.fixture(scope="session")
+def chart():
+    """The basic-strategy chart for the default rules, compiled once per test session."""
+    return CompileBasicStrategy().execute(GameRules())
@@ -0,0 +1,157 @@
+import pytest
+import random
+from collections import Counter
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Deck import Deck
+from src.domain.Card import STANDARD_CARDS
+from src.domain.CountingSystem import OMEGA_II
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.application.start_round import StartRound
+
+
+def test_array_shoe_creation():
+    shoe = ArrayShoe(num_decks=2)
+    assert shoe.cards_remaining == 104
+    assert len(shoe.cards) == 104
+    assert shoe.discard_pile == []
+    assert Counter(shoe.cards) == Counter(STANDARD_CARDS * 2)
+
+
+def test_array_shoe_deal():
+    shoe = ArrayShoe()
+    next_card = shoe.cards[-1]
+    card = shoe.deal()
+    assert card is next_card
+    assert shoe.cards_remaining == 51
+    assert shoe.discard_pile == [card]
+
+
+def test_array_shoe_reshuffles_when_empty():
+    shoe = ArrayShoe()
+    for _ in range(52):
+        shoe.deal()
+    assert shoe.cards_remaining == 0
+    shoe.deal()
+    assert shoe.cards_remaining == 51
+
+
+def test_array_shoe_in_game():
+    rules = GameRules()
+    game = Game(players=[Player(balance=100)], rules=rules, deck=ArrayShoe(rules.num_decks))
+    StartRound().execute(game)
+    assert len(game.players[0].hands[0].cards) == 2
+    assert len(game.dealer.hands[0].cards) == 2
+    assert game.deck.cards_remaining == rules.num_decks * 52 - 4
+
+
+def test_seeded_array_shoes_are_reproducible():
+    shoe1 = ArrayShoe(num_decks=2, rng=random.Random(7))
+    shoe2 = ArrayShoe(num_decks=2, rng=random.Random(7))
+    assert shoe1.order == shoe2.order
+
+
+def test_array_shoe_from_order():
+    shoe = ArrayShoe.from_order(range(52))
+    assert shoe.num_decks == 1
+    assert shoe.deal() is STANDARD_CARDS[0]
+    assert shoe.deal() is STANDARD_CARDS[1]
+
+
+def test_array_shoe_from_order_rejects_partial_decks():
+    with pytest.raises(ValueError, match="whole number of 52-card decks"):
+        ArrayShoe.from_order(range(10))
+
+
+@pytest.mark.parametrize("bad_code", [52, 255, -1, 300])
+def test_array_shoe_from_order_rejects_unknown_codes(bad_code):
+    order = list(range(52))
+    order[7] = bad_code
+    with pytest.raises(ValueError, match=r"Card codes must be in range\(52\)"):
+        ArrayShoe.from_order(order)
+
+
+def test_array_shoe_tracks_composition():
+    shoe = ArrayShoe(num_decks=1, counting_system=OMEGA_II)
+    dealt = [shoe.deal() for _ in range(10)]
+    shoe.deal_code()
+    assert shoe.composition.remaining == 41
+    assert shoe.running_count == sum(OMEGA_II.tags[card.value - 2] for card in shoe.discard_pile)
+    assert shoe.discard_pile[:10] == dealt
+
+
+def test_array_shoe_reshuffle_keeps_cards_in_play():
+    shoe = ArrayShoe(rng=random.Random(4))
+    order = shoe.order
+    for _ in range(30):
+        shoe.deal()
+    shoe.begin_round()
+    on_table = [shoe.deal() for _ in range(5)]
+    shoe.reshuffle()
+    assert shoe.order is order
+    assert shoe.discard_pile == on_table
+    assert shoe.cards_remaining == 47
+    assert Counter(shoe.cards) + Counter(on_table) == Counter(STANDARD_CARDS)
+    assert shoe.composition.remaining == 47
+
+
+def test_exhausted_array_shoe_reshuffles_around_the_table():
+    shoe = ArrayShoe(rng=random.Random(6))
+    for _ in range(49):
+        shoe.deal()
+    shoe.begin_round()
+    on_table = [shoe.deal() for _ in range(4)]
+    assert Counter(shoe.cards) + Counter(on_table) == Counter(STANDARD_CARDS)
+    assert shoe.discard_pile == on_table
+
+
+@pytest.mark.parametrize("shoe_type", [ArrayShoe, Deck])
+def test_start_round_reshuffles_without_the_previous_round(shoe_type):
+    rules = GameRules(num_decks=1)
+    game = Game([Player(balance=100)], rules, deck=shoe_type(1, rng=random.Random(2)))
+    for _ in range(45):
+        game.deck.deal()
+    StartRound().execute(game)
+    assert game.deck.cards_remaining == 48
+    assert len(game.deck.discard_pile) == 4
+
+
+def test_array_shoe_load_shuffled_rejects_partial_shoes():
+    shoe = ArrayShoe(num_decks=2)
+    with pytest.raises(ValueError, match="every card of the shoe"):
+        shoe.load_shuffled(range(52))
+
+
+def test_array_shoe_load_shuffled_keeps_cards_in_play():
+    shoe = ArrayShoe(rng=random.Random(5))
+    for _ in range(40):
+        shoe.deal()
+    shoe.begin_round()
+    on_table = [shoe.deal_code() for _ in range(3)]
+    order = list(reversed(range(52)))
+    shoe.load_shuffled(order)
+    assert list(shoe.order[:3]) == on_table
+    assert list(shoe.order[3:]) == [code for code in order if code not in on_table]
+    assert shoe.cards_in_play == 3
+    assert shoe.composition.remaining == 49
+
+
+def test_array_shoe_deal_many_matches_single_deals():
+    single = ArrayShoe(num_decks=2, rng=random.Random(11))
+    bulk = ArrayShoe(num_decks=2, rng=random.Random(11))
+    assert bulk.deal_many(7) == [single.deal() for _ in range(7)]
+    assert list(bulk.deal_codes(3)) == [single.deal_code() for _ in range(3)]
+    assert bulk.position == single.position
+    assert bulk.composition.counts == single.composition.counts
+    assert bulk.running_count == single.running_count
+
+
+def test_array_shoe_deal_codes_reshuffles_when_short():
+    shoe = ArrayShoe(rng=random.Random(5))
+    for _ in range(47):
+        shoe.deal()
+    shoe.begin_round()
+    assert len(shoe.deal_codes(8)) == 8
+    assert shoe.cards_in_play == 8
+    assert shoe.cards_remaining == 44
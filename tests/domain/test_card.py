@@ -1,4 +1,6 @@
-from src.domain.Card import Card
+import dataclasses
+import pytest
+from src.domain.Card import Card, STANDARD_CARDS, CARD_CODES
 
 
 def test_card_creation():
@@ -6,3 +8,21 @@ def test_card_creation():
     assert card.suit == "Hearts"
     assert card.rank == "Ace"
     assert card.value == 11
+
+
+def test_card_is_immutable():
+    card = Card("Hearts", "Ace", 11)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        card.rank = "King"
+
+
+def test_card_is_hashable():
+    assert hash(Card("Spades", "10", 10)) == hash(Card("Spades", "10", 10))
+    assert {Card("Spades", "10", 10): 1}[Card("Spades", "10", 10)] == 1
+
+
+def test_standard_cards_table():
+    assert len(STANDARD_CARDS) == 52
+    assert len(set(STANDARD_CARDS)) == 52
+    for code, card in enumerate(STANDARD_CARDS):
+        assert CARD_CODES[card] == code
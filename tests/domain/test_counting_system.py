@@ -0,0 +1,11 @@
+from src.domain.CountingSystem import HI_LO, KO, OMEGA_II
+
+
+def test_balanced_systems_start_at_zero():
+    assert HI_LO.initial_running_count(6) == 0
+    assert OMEGA_II.initial_running_count(6) == 0
+
+
+def test_ko_initial_running_count():
+    assert KO.initial_running_count(1) == 0
+    assert KO.initial_running_count(6) == -20
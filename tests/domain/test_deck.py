@@ -1,4 +1,7 @@
+import random
 from src.domain.Deck import Deck
+from src.domain.Card import CARD_CODES, STANDARD_CARDS
+from src.domain.CountingSystem import HI_LO
 
 
 def test_deck_creation():
@@ -24,3 +27,115 @@ def test_shuffle():
     deck2.shuffle()
     # It's possible, but highly unlikely, that the shuffled deck is the same as the original
     assert [str(c) for c in deck1.cards] != [str(c) for c in deck2.cards]
+
+
+def test_deck_reuses_interned_cards():
+    deck = Deck(num_decks=2)
+    interned = {id(card) for card in STANDARD_CARDS}
+    assert all(id(card) in interned for card in deck.cards)
+
+
+def test_seeded_decks_are_reproducible():
+    deck1 = Deck(num_decks=2, rng=random.Random(7))
+    deck2 = Deck(num_decks=2, rng=random.Random(7))
+    assert deck1.cards == deck2.cards
+    deck1.build_and_shuffle()
+    deck2.build_and_shuffle()
+    assert deck1.cards == deck2.cards
+
+
+def test_deal_updates_composition_and_count():
+    deck = Deck()
+    dealt = [deck.deal() for _ in range(20)]
+    assert deck.composition.remaining == 32
+    for value in range(2, 12):
+        expected = (16 if value == 10 else 4) - sum(card.value == value for card in dealt)
+        assert deck.composition.counts[value - 2] == expected
+    assert deck.running_count == sum(HI_LO.tags[card.value - 2] for card in dealt)
+    deck.build_and_shuffle()
+    assert deck.running_count == 0
+    assert deck.composition.remaining == 52
+
+
+def test_reshuffle_recycles_the_discard_pile_in_place():
+    deck = Deck(num_decks=2, rng=random.Random(3))
+    cards = deck.cards
+    for _ in range(80):
+        deck.deal()
+    deck.reshuffle()
+    assert deck.cards is cards
+    assert sorted(map(CARD_CODES.get, deck.cards)) == sorted(list(range(52)) * 2)
+    assert deck.discard_pile == []
+    assert deck.composition.remaining == 104
+    assert deck.running_count == 0
+
+
+def test_reshuffle_keeps_cards_in_play_out_of_the_shoe():
+    deck = Deck(rng=random.Random(5))
+    for _ in range(30):
+        deck.deal()
+    deck.begin_round()
+    on_table = [deck.deal() for _ in range(4)]
+    assert deck.cards_in_play == 4
+    deck.reshuffle()
+    assert len(deck.cards) == 48
+    assert deck.discard_pile == on_table
+    assert deck.composition.remaining == 48
+    assert deck.running_count == sum(HI_LO.tags[card.value - 2] for card in on_table)
+
+
+def test_exhausted_deck_reshuffles_around_the_table():
+    deck = Deck(rng=random.Random(8))
+    for _ in range(49):
+        deck.deal()
+    deck.begin_round()
+    on_table = [deck.deal() for _ in range(3)]
+    assert deck.cards_remaining == 0
+    on_table.append(deck.deal())
+    remaining = sorted(map(CARD_CODES.get, deck.cards))
+    expected = sorted(set(range(52)) - {CARD_CODES[card] for card in on_table})
+    assert remaining == expected
+    assert deck.discard_pile == on_table
+
+
+def test_exhausted_deck_without_a_round_recycles_everything():
+    deck = Deck(rng=random.Random(8))
+    for _ in range(53):
+        deck.deal()
+    assert deck.cards_remaining == 51
+    assert len(deck.discard_pile) == 1
+
+
+def test_load_shuffled_deals_the_prepared_order_around_the_table():
+    deck = Deck(rng=random.Random(3))
+    for _ in range(40):
+        deck.deal()
+    deck.begin_round()
+    on_table = [deck.deal() for _ in range(3)]
+    order = list(range(52))
+    deck.load_shuffled(order)
+    expected = [code for code in order if code not in {CARD_CODES[card] for card in on_table}]
+    assert deck.discard_pile == on_table
+    assert [deck.deal_code() for _ in range(49)] == expected
+    assert deck.composition.remaining == 0
+
+
+def test_deal_many_matches_single_deals():
+    single = Deck(num_decks=2, rng=random.Random(11))
+    bulk = Deck(num_decks=2, rng=random.Random(11))
+    expected = [single.deal() for _ in range(7)]
+    assert bulk.deal_many(7) == expected
+    assert bulk.discard_pile == single.discard_pile
+    assert bulk.running_count == single.running_count
+    assert bulk.deal_codes(3) == [single.deal_code() for _ in range(3)]
+
+
+def test_deal_many_reshuffles_around_the_table_when_short():
+    deck = Deck(rng=random.Random(5))
+    for _ in range(47):
+        deck.deal()
+    deck.begin_round()
+    dealt = deck.deal_many(8)
+    assert len(dealt) == 8
+    assert deck.discard_pile == dealt
+    assert deck.cards_remaining == 44
@@ -1,3 +1,4 @@
+import random
 from src.domain.Game import Game
 from src.domain.Player import Player
 from src.domain.GameRules import GameRules
@@ -11,4 +12,9 @@ def test_game_creation():
     assert game.dealer is not None
     assert game.deck is not None
     assert game.rules == rules
-    assert game.game_state == "betting"
\ No newline at end of file
+    assert game.game_state.label == "betting"
+
+def test_game_with_seeded_rng():
+    game1 = Game([Player(balance=100)], GameRules(), rng=random.Random(1))
+    game2 = Game([Player(balance=100)], GameRules(), rng=random.Random(1))
+    assert game1.deck.cards == game2.deck.cards
@@ -0,0 +1,50 @@
+import pickle
+import pytest
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.GameState import Action, GameState, HandStatus
+from src.domain.Player import Player
+
+
+def test_members_only_equal_themselves():
+    assert GameState.PLAYER_TURN.label == 'playerTurn'
+    assert GameState.PLAYER_TURN != 'playerTurn'
+    assert HandStatus.PLAYING != GameState.BETTING
+    assert HandStatus.PUSH != 5 and HandStatus.PUSH.value == 5
+    assert 'playing' not in {HandStatus.PLAYING}
+    assert HandStatus.of('playing') in {HandStatus.PLAYING}
+
+
+def test_of_accepts_members_values_and_labels():
+    assert GameState.of(GameState.BETTING) is GameState.BETTING
+    assert GameState.of(2) is GameState.DEALER_TURN
+    assert HandStatus.of('lose') is HandStatus.LOSE
+    with pytest.raises(ValueError, match="not a valid Action"):
+        Action.of('surrender')
+
+
+def test_members_pickle_as_themselves():
+    assert pickle.loads(pickle.dumps(HandStatus.STAND)) is HandStatus.STAND
+
+
+def test_transition_to_follows_the_round():
+    game = Game([Player(balance=100)], GameRules())
+    for state in (GameState.PLAYER_TURN, GameState.DEALER_TURN, GameState.ROUND_OVER, GameState.BETTING):
+        game.transition_to(state)
+        assert game.game_state is state
+
+
+def test_transition_to_rejects_illegal_moves():
+    game = Game([Player(balance=100)], GameRules())
+    with pytest.raises(ValueError, match="Cannot move from 'betting' to 'roundOver'"):
+        game.transition_to(GameState.ROUND_OVER)
+    assert game.game_state is GameState.BETTING
+
+
+def test_assigning_a_label_is_checked():
+    game = Game([Player(balance=100)], GameRules())
+    game.game_state = 'playerTurn'
+    assert game.game_state is GameState.PLAYER_TURN
+    with pytest.raises(ValueError, match="Cannot move from 'playerTurn' to 'roundOver'"):
+        game.game_state = 'roundOver'
+    assert game.game_state is GameState.PLAYER_TURN
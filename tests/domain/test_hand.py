@@ -1,5 +1,7 @@
+import pytest
 from src.domain.Hand import Hand
 from src.domain.Card import Card
+from src.domain.GameState import HandStatus
 
 
 def test_add_card():
@@ -27,4 +29,72 @@ def test_get_value_bust():
     hand.add_card(Card("Hearts", "10", 10))
     hand.add_card(Card("Diamonds", "10", 10))
     hand.add_card(Card("Clubs", "2", 2))
-    assert hand.get_value() == 22
\ No newline at end of file
+    assert hand.get_value() == 22
+
+def test_is_soft():
+    hand = Hand()
+    hand.add_card(Card("Hearts", "Ace", 11))
+    hand.add_card(Card("Diamonds", "6", 6))
+    assert hand.value == 17
+    assert hand.is_soft
+    hand.add_card(Card("Clubs", "10", 10))
+    assert hand.value == 17
+    assert not hand.is_soft
+
+
+def test_is_blackjack():
+    hand = Hand()
+    hand.add_card(Card("Hearts", "Ace", 11))
+    hand.add_card(Card("Diamonds", "King", 10))
+    assert hand.is_blackjack
+
+    hand = Hand()
+    hand.add_card(Card("Hearts", "7", 7))
+    hand.add_card(Card("Diamonds", "7", 7))
+    hand.add_card(Card("Clubs", "7", 7))
+    assert hand.value == 21
+    assert not hand.is_blackjack
+
+
+def test_is_pair():
+    hand = Hand()
+    hand.add_card(Card("Hearts", "8", 8))
+    hand.add_card(Card("Diamonds", "8", 8))
+    assert hand.is_pair
+
+    hand = Hand()
+    hand.add_card(Card("Hearts", "King", 10))
+    hand.add_card(Card("Diamonds", "Queen", 10))
+    assert not hand.is_pair
+
+
+def test_pop_card_updates_value():
+    hand = Hand()
+    hand.add_card(Card("Hearts", "Ace", 11))
+    hand.add_card(Card("Diamonds", "Ace", 11))
+    card = hand.pop_card()
+    assert card == Card("Diamonds", "Ace", 11)
+    assert hand.value == 11
+    assert hand.is_soft
+    assert len(hand.cards) == 1
+
+
+def test_reset_empties_the_hand_in_place():
+    hand = Hand()
+    cards = hand.cards
+    hand.add_card(Card("Spades", "Ace", 11))
+    hand.add_card(Card("Hearts", "9", 9))
+    hand.status = HandStatus.STAND
+    hand.reset()
+    assert hand.cards is cards and cards == []
+    assert hand.value == 0
+    assert not hand.is_soft
+    assert hand.status is HandStatus.PLAYING
+
+
+def test_status_coerces_label_strings():
+    hand = Hand()
+    hand.status = 'busted'
+    assert hand.status is HandStatus.BUSTED
+    with pytest.raises(ValueError):
+        hand.status = 'bust'
@@ -7,14 +7,14 @@ def test_player_creation():
     assert player.balance == 100
     assert player.bets == [0]
     assert isinstance(player.hands[0], Hand)
-    assert player.hands[0].status == 'playing'
+    assert player.hands[0].status.label == 'playing'
 
 def test_player_place_bet():
     player = Player(balance=100)
     player.place_bet(50)
     assert player.balance == 50
     assert player.bets == [50]
-    assert player.hands[0].status == 'playing'
+    assert player.hands[0].status.label == 'playing'
 
 def test_player_place_bet_insufficient_balance():
     player = Player(balance=10)
@@ -34,5 +34,5 @@ def test_player_clear_hands():
     player.clear_hands()
     assert player.hands[0].cards == []
     assert player.bets == [0]
-    assert player.hands[0].status == 'betting'
+    assert player.hands[0].status.label == 'betting'
     assert player.current_hand_index == 0
@@ -0,0 +1,14 @@
+from src.domain.RandomStreams import RandomStreams
+
+
+def test_same_keys_give_same_stream():
+    streams = RandomStreams(42)
+    assert streams.spawn(3).random() == streams.spawn(3).random()
+    assert RandomStreams(42).seed_for(1, 2) == RandomStreams(42).seed_for(1, 2)
+
+
+def test_different_keys_give_different_streams():
+    streams = RandomStreams(42)
+    assert streams.seed_for(0) != streams.seed_for(1)
+    assert streams.seed_for(1, 2) != streams.seed_for(2, 1)
+    assert RandomStreams(42).seed_for(0) != RandomStreams(43).seed_for(0)
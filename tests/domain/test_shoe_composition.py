@@ -0,0 +1,49 @@
+from src.domain.CountingSystem import KO
+from src.domain.ShoeComposition import ShoeComposition
+
+
+def test_full_shoe_composition():
+    composition = ShoeComposition(num_decks=2)
+    assert composition.counts == [8, 8, 8, 8, 8, 8, 8, 8, 32, 8]
+    assert composition.remaining == 104
+    assert composition.running_count == 0
+
+
+def test_remove_updates_counts():
+    composition = ShoeComposition(num_decks=1)
+    composition.remove(5)
+    composition.remove(10)
+    composition.remove(11)
+    assert composition.counts[3] == 3
+    assert composition.counts[8] == 15
+    assert composition.counts[9] == 3
+    assert composition.remaining == 49
+    assert composition.running_count == -1
+
+
+def test_true_count():
+    composition = ShoeComposition(num_decks=2)
+    for _ in range(26):
+        composition.remove(4)
+    assert composition.decks_remaining == 1.5
+    assert composition.true_count == 26 / 1.5
+
+
+def test_reset_uses_counting_system():
+    composition = ShoeComposition(num_decks=6, system=KO)
+    composition.remove(2)
+    composition.reset(6)
+    assert composition.running_count == -20
+    assert composition.remaining == 312
+
+
+def test_remove_many_matches_repeated_remove():
+    one_by_one = ShoeComposition(num_decks=2, system=KO)
+    bulk = ShoeComposition(num_decks=2, system=KO)
+    values = [2, 11, 10, 10, 7, 5]
+    for value in values:
+        one_by_one.remove(value)
+    bulk.remove_many(values)
+    assert bulk.counts == one_by_one.counts
+    assert bulk.remaining == one_by_one.remaining
+    assert bulk.running_count == one_by_one.running_count
@@ -0,0 +1,8 @@
+import pytest
+from src.infrastructure.simulation.parallel import BasicStrategyFactory
+
+
+@pytest.fixture
+def strategy_factory(tmp_path):
+    """A basic-strategy factory that caches its charts under the test's temporary directory."""
+    return BasicStrategyFactory(tmp_path / "strategies")
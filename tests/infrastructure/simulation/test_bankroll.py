@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.infrastructure.simulation.bankroll import BankrollSimulator, FlatBetting, ProportionalBetting
+from src.infrastructure.simulation.round_kernel import LeanRoundKernel
+from src.infrastructure.simulation.shoe_batch import shoe_from_row
+
+
+def test_sessions_match_lean_kernel(chart):
+    rules = GameRules()
+    simulator = BankrollSimulator(rules, chart, FlatBetting(20), starting_bankroll=60, session_rounds=25, lanes=48, seed=2)
+    shoes = simulator.simulator.shoes.copy()
+    results = simulator.run(48)
+
+    for lane, row in enumerate(shoes):
+        player = Player(balance=60)
+        game = Game([player], rules, deck=shoe_from_row(row))
+        rounds = streak = longest_streak = 0
+        while rounds < 25 and player.balance >= rules.min_bet:
+            net = LeanRoundKernel(game, chart, [min(20, player.balance)]).play_round()
+            streak = streak + 1 if net < 0 else 0
+            longest_streak = max(longest_streak, streak)
+            rounds += 1
+        assert results.final_bankrolls[lane] == player.balance
+        assert results.rounds_played[lane] == rounds
+        assert results.ruined[lane] == (player.balance < rules.min_bet)
+        assert results.longest_losing_streaks[lane] == longest_streak
+
+
+def test_small_bankrolls_are_often_ruined(chart):
+    results = BankrollSimulator(
+        GameRules(), chart, FlatBetting(10), starting_bankroll=30, session_rounds=200, lanes=500, seed=1
+    ).run(1200)
+    assert results.sessions == 1200
+    assert 0.3 < results.risk_of_ruin < 1.0
+    assert (results.final_bankrolls[results.ruined] < GameRules().min_bet).all()
+    assert (results.rounds_played[~results.ruined] == 200).all()
+    assert (results.max_drawdowns >= 0).all()
+    assert results.median_final_bankroll >= 0
+    quantiles = results.drawdown_quantiles((0.5, 0.9))
+    assert quantiles[0] <= quantiles[1]
+
+
+def test_runs_are_reproducible(chart):
+    def run():
+        return BankrollSimulator(
+            GameRules(), chart, ProportionalBetting(0.05, unit=5), starting_bankroll=1_000, session_rounds=50,
+            lanes=200, seed=9,
+        ).run(200)
+
+    first, second = run(), run()
+    assert np.array_equal(first.final_bankrolls, second.final_bankrolls)
+    assert np.array_equal(first.max_drawdowns, second.max_drawdowns)
+
+
+def test_proportional_bets_are_rounded_to_units():
+    bets = ProportionalBetting(0.1, unit=5).bets(np.array([1_000, 237, 40]))
+    assert bets.tolist() == [100, 20, 0]
+
+
+def test_rejects_invalid_sessions(chart):
+    with pytest.raises(ValueError, match="starting bankroll must be positive"):
+        BankrollSimulator(GameRules(), chart, FlatBetting(10), starting_bankroll=0, session_rounds=10)
+    with pytest.raises(ValueError, match="at least one round"):
+        BankrollSimulator(GameRules(), chart, FlatBetting(10), starting_bankroll=100, session_rounds=0)
+    with pytest.raises(ValueError, match="at least one session"):
+        BankrollSimulator(GameRules(), chart, FlatBetting(10), starting_bankroll=100, session_rounds=5, lanes=4).run(0)
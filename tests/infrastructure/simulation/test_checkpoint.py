@@ -0,0 +1,74 @@
+import io
+import pytest
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.checkpoint import CheckpointedRun
+from src.infrastructure.simulation.parallel import run_parallel
+
+
+def totals(result):
+    return result.rounds, result.hands, result.net, result.net_squared
+
+
+def test_finished_run_matches_run_parallel(tmp_path, strategy_factory):
+    rules = GameRules()
+    expected = run_parallel(rules, 2500, master_seed=42, strategy_factory=strategy_factory, block_rounds=1000)
+    run = CheckpointedRun(rules, 2500, 42, str(tmp_path / "run.ckpt"), block_rounds=1000, checkpoint_every=700, strategy_factory=strategy_factory)
+    assert totals(run.run()) == totals(expected)
+    assert run.finished
+
+
+@pytest.mark.parametrize("stop_after", [1, 700, 1000, 1999])
+def test_resumed_run_matches_uninterrupted_run(tmp_path, stop_after, strategy_factory):
+    rules = GameRules(num_decks=2, blackjack_payout=1.2)
+    expected = run_parallel(rules, 2500, master_seed=7, strategy_factory=strategy_factory, bet=20, block_rounds=1000)
+    path = str(tmp_path / "run.ckpt")
+
+    first = CheckpointedRun(rules, 2500, 7, path, bet=20, block_rounds=1000, checkpoint_every=300, strategy_factory=strategy_factory)
+    partial = first.run(max_rounds=stop_after)
+    assert partial.rounds == stop_after
+    assert not first.finished
+
+    resumed = CheckpointedRun.resume(path, checkpoint_every=300, strategy_factory=strategy_factory)
+    assert resumed.rules == rules
+    assert resumed.rounds_played == stop_after
+    assert totals(resumed.run()) == totals(expected)
+
+
+def test_checkpoint_restores_shoe_and_generator(tmp_path, strategy_factory):
+    run = CheckpointedRun(GameRules(), 5000, 3, str(tmp_path / "run.ckpt"), block_rounds=5000, strategy_factory=strategy_factory)
+    run.run(max_rounds=123)
+    buffer = io.BytesIO()
+    run.write(buffer)
+    buffer.seek(0)
+    restored = CheckpointedRun.read(buffer, run.path, strategy_factory=strategy_factory)
+
+    original_deck = run.simulator.game.deck
+    restored_deck = restored.simulator.game.deck
+    assert restored_deck.cards == original_deck.cards
+    assert restored_deck.discard_pile == original_deck.discard_pile
+    assert restored_deck.composition.counts == original_deck.composition.counts
+    assert restored_deck.running_count == original_deck.running_count
+    assert restored.simulator.shoe_id == run.simulator.shoe_id
+    assert [restored.simulator.play_round() for _ in range(300)] == [run.simulator.play_round() for _ in range(300)]
+
+
+def test_checkpoints_are_compact(tmp_path, strategy_factory):
+    run = CheckpointedRun(GameRules(num_decks=8), 10_000, 1, str(tmp_path / "run.ckpt"), strategy_factory=strategy_factory)
+    run.run(max_rounds=50)
+    assert (tmp_path / "run.ckpt").stat().st_size < 4096
+    assert not (tmp_path / "run.ckpt.tmp").exists()
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a checkpoint")
+    with pytest.raises(ValueError, match="supported version"):
+        CheckpointedRun.resume(str(path))
+    path.write_bytes(b"BJCP\x01\x00\x00")
+    with pytest.raises(ValueError, match="truncated"):
+        CheckpointedRun.resume(str(path))
+
+
+def test_rejects_invalid_interval(tmp_path):
+    with pytest.raises(ValueError, match="checkpoint interval must be positive"):
+        CheckpointedRun(GameRules(), 10, 1, str(tmp_path / "run.ckpt"), checkpoint_every=0)
@@ -0,0 +1,44 @@
+import random
+import pytest
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.counting import BetSpread, CountingSimulator
+
+
+def test_bet_spread_ramps_with_the_true_count():
+    spread = BetSpread(10, ((2, 2), (4, 8)))
+    assert [spread.bet(count) for count in (-3.0, 1.9, 2.0, 3.5, 4.0, 9.0)] == [10, 10, 20, 20, 80, 80]
+    assert spread.max_bet == 80
+    assert BetSpread(25, ()).max_bet == 25
+
+
+def test_spread_must_fit_the_table(chart):
+    with pytest.raises(ValueError, match="within the table limits"):
+        CountingSimulator(GameRules(), chart, BetSpread(10, ((3, 20),)))
+    with pytest.raises(ValueError, match="within the table limits"):
+        CountingSimulator(GameRules(), chart, BetSpread(5))
+
+
+def test_run_aggregates_by_true_count(chart):
+    rules = GameRules(num_decks=2, reshuffle_penetration=0.6)
+    simulator = CountingSimulator(rules, chart, BetSpread(10), rng=random.Random(3))
+    result = simulator.run(3000)
+    assert result.rounds == 3000
+    assert sum(stats.count for stats in result.by_true_count.values()) == 3000
+    assert 10 * 3000 <= result.wagered <= 80 * 3000
+    assert result.average_bet > 1.0
+    assert min(result.by_true_count) < 0 < max(result.by_true_count)
+    assert result.hands_per_minute > 0
+    # The shoe is cut at the penetration before every round, so it never runs dry mid-round.
+    assert simulator.deck.cards_remaining > 0
+
+
+def test_runs_are_reproducible(chart):
+    first = CountingSimulator(GameRules(), chart, BetSpread(10), rng=random.Random(8)).run(1000)
+    second = CountingSimulator(GameRules(), chart, BetSpread(10), rng=random.Random(8)).run(1000)
+    assert (first.net, first.wagered, first.hands) == (second.net, second.wagered, second.hands)
+
+
+def test_flat_betting_without_plays_matches_basic_strategy_win_rate(chart):
+    result = CountingSimulator(GameRules(), chart, BetSpread(10, ()), plays=(), rng=random.Random(8)).run(1000)
+    assert result.average_bet == 1.0
+    assert result.advantage == pytest.approx(result.net / (10 * 1000))
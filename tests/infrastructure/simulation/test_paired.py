@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from src.domain.GameRules import GameRules
+from src.application.basic_strategy import BasicStrategy, STAND, PAIR_OFFSET
+from src.domain.RandomStreams import RandomStreams
+from src.infrastructure.simulation.paired import PairedSimulator, Variant, derived_seeds
+from src.infrastructure.simulation.statistics import RunningStats
+from src.infrastructure.simulation.vectorized import VectorizedSimulator
+
+
+def test_running_stats_of_matches_adding_values():
+    values = np.array([3.0, -1.0, 0.0, 2.5, -4.0])
+    added = RunningStats()
+    for value in values:
+        added.add(value)
+    batch = RunningStats.of(values)
+    assert batch.count == added.count
+    assert batch.mean == pytest.approx(added.mean)
+    assert batch.m2 == pytest.approx(added.m2)
+    assert RunningStats.of(np.array([])) == RunningStats()
+
+
+def test_baseline_matches_standalone_simulator(chart):
+    rules = GameRules()
+    paired = PairedSimulator([Variant('3:2', rules, chart), Variant('6:5', GameRules(blackjack_payout=1.2), chart)], lanes=64, seed=5)
+    standalone = VectorizedSimulator(rules, chart, lanes=64, seed=5)
+    for _ in range(150):
+        assert (paired.play_round()[0] == standalone.play_round()).all()
+
+
+def test_variant_seeds_derive_from_the_master_seed(chart):
+    assert derived_seeds(5, 2) == (RandomStreams(5).seed_for(1), RandomStreams(5).seed_for(2))
+    assert derived_seeds(5, 1) != derived_seeds(6, 1)
+    variants = [Variant('a', GameRules(), chart), Variant('b', GameRules(), chart)]
+    draws = [PairedSimulator(variants, lanes=4, seed=seed).simulators[1].rng.random() for seed in (5, 5, 6)]
+    assert draws[0] == draws[1] != draws[2]
+
+
+def test_identical_variants_have_no_difference(chart):
+    rules = GameRules()
+    comparison = PairedSimulator([Variant('a', rules, chart), Variant('b', rules, chart)], lanes=500, seed=2).run(2000)
+    assert comparison.differences[0].mean == 0.0
+    assert comparison.differences[0].variance == 0.0
+    assert comparison.variance_reduction(1) == float('inf')
+
+
+def test_payout_change_is_measured_with_far_less_variance(chart):
+    variants = [Variant('3:2', GameRules(), chart), Variant('6:5', GameRules(blackjack_payout=1.2), chart)]
+    comparison = PairedSimulator(variants, lanes=2000, seed=9).run(20_000)
+    difference = comparison.differences[0]
+    # Only blackjacks differ: 0.3 units less about 4.5% of the time.
+    assert -0.02 < difference.mean < -0.01
+    assert comparison.variance_reduction(1) > 100
+    low, high = comparison.difference_interval(1)
+    assert high < 0
+
+
+def test_detects_a_worse_strategy(chart):
+    table = bytearray(chart.table)
+    for cell in range(PAIR_OFFSET):
+        table[cell] = STAND
+    variants = [Variant('basic', GameRules(), chart), Variant('never bust', GameRules(), BasicStrategy(bytes(table)))]
+    comparison = PairedSimulator(variants, lanes=2000, seed=4).run(10_000)
+    low, high = comparison.difference_interval(1)
+    assert high < 0
+    assert comparison.results[0].count == comparison.results[1].count == 10_000
+
+
+def test_validates_variants(chart):
+    with pytest.raises(ValueError, match="At least two variants"):
+        PairedSimulator([Variant('a', GameRules(), chart)])
+    with pytest.raises(ValueError, match="same number of decks"):
+        PairedSimulator([Variant('a', GameRules(), chart), Variant('b', GameRules(num_decks=2), chart)], lanes=8)
@@ -0,0 +1,35 @@
+import pickle
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.parallel import BasicStrategyFactory, block_sizes, run_parallel
+
+
+def totals(result):
+    return result.rounds, result.hands, result.net, result.net_squared
+
+
+def test_block_sizes():
+    assert block_sizes(25, 10) == (10, 10, 5)
+    assert block_sizes(20, 10) == (10, 10)
+    assert block_sizes(0, 10) == ()
+
+
+def test_results_do_not_depend_on_worker_count(strategy_factory):
+    rules = GameRules()
+    serial = run_parallel(rules, rounds=1200, master_seed=11, workers=1, strategy_factory=strategy_factory, block_rounds=250)
+    parallel = run_parallel(rules, rounds=1200, master_seed=11, workers=3, strategy_factory=strategy_factory, block_rounds=250)
+    assert totals(serial) == totals(parallel)
+    assert serial.rounds == 1200
+
+
+def test_different_seeds_differ(strategy_factory):
+    rules = GameRules()
+    first = run_parallel(rules, rounds=500, master_seed=1, strategy_factory=strategy_factory, block_rounds=250)
+    second = run_parallel(rules, rounds=500, master_seed=2, strategy_factory=strategy_factory, block_rounds=250)
+    assert totals(first) != totals(second)
+
+
+def test_strategy_factory_caches_charts_in_its_directory(tmp_path):
+    factory = pickle.loads(pickle.dumps(BasicStrategyFactory(tmp_path)))
+    factory(GameRules())
+    assert factory.directory == tmp_path
+    assert len(list(tmp_path.glob("*.bjbs"))) == 1
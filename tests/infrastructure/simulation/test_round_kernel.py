@@ -0,0 +1,116 @@
+import random
+import pytest
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Deck import Deck
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.application.basic_strategy import STAND
+from src.application.index_plays import DeviationCharts, IndexPlay
+from src.interface_adapters.game_controller import GameController
+from src.infrastructure.simulation.round_kernel import LeanRoundKernel
+from src.infrastructure.simulation.strategies import BasicStrategyPlayer
+
+
+# The second seat is reset to this balance every round, so it can never double down or split.
+SHORT_STACK = 35
+
+
+def play_reference_rounds(rules, chart, shoe, bets, balances, rounds):
+    """Plays rounds through the GameController and records balances and hand statuses."""
+    players = [Player(balance=balance) for balance in balances]
+    game = Game(players=players, rules=rules, deck=shoe)
+    controller = GameController(game)
+    strategy = BasicStrategyPlayer(chart)
+    history = []
+    for _ in range(rounds):
+        players[1].balance = SHORT_STACK
+        controller.place_bets(dict(zip(players, bets)))
+        controller.start_new_round()
+        for player in players:
+            while not player.all_hands_played():
+                controller.perform_player_action(player, strategy.decide(game, player))
+        controller.dealer_turn()
+        controller.end_round()
+        history.append((
+            [player.balance for player in players],
+            [[hand.status.label for hand in player.hands] for player in players],
+        ))
+        controller.reset_round_for_new_game()
+    return history
+
+
+def play_kernel_rounds(rules, chart, shoe, bets, balances, rounds):
+    """Plays the same rounds with the lean kernel."""
+    players = [Player(balance=balance) for balance in balances]
+    kernel = LeanRoundKernel(Game(players=players, rules=rules, deck=shoe), chart, bets)
+    history = []
+    for _ in range(rounds):
+        players[1].balance = SHORT_STACK
+        kernel.play_round()
+        history.append((
+            [player.balance for player in players],
+            [kernel.status_names(seat) for seat in range(len(players))],
+        ))
+    return history
+
+
+@pytest.mark.parametrize("rules, shoe_type", [
+    (GameRules(), ArrayShoe),
+    (GameRules(dealer_hits_on_soft_17=False, num_decks=1, blackjack_payout=1.2), Deck),
+])
+def test_kernel_matches_reference_use_cases(chart, rules, shoe_type):
+    bets, balances, rounds = [10, 25, 15], [5_000, SHORT_STACK, 5_000], 1500
+    reference = play_reference_rounds(rules, chart, shoe_type(rules.num_decks, rng=random.Random(5)), bets, balances, rounds)
+    kernel = play_kernel_rounds(rules, chart, shoe_type(rules.num_decks, rng=random.Random(5)), bets, balances, rounds)
+    assert kernel == reference
+
+
+def test_kernel_rejects_unaffordable_bets_like_reference(chart):
+    rules, bets = GameRules(), [10, 25]
+    reference_players = [Player(balance=1_000), Player(balance=20)]
+    controller = GameController(Game(players=reference_players, rules=rules, rng=random.Random(5)))
+    with pytest.raises(ValueError, match="Insufficient balance to place this bet."):
+        controller.place_bets(dict(zip(reference_players, bets)))
+    players = [Player(balance=1_000), Player(balance=20)]
+    kernel = LeanRoundKernel(Game(players=players, rules=rules, rng=random.Random(5)), chart, bets)
+    with pytest.raises(ValueError, match="Insufficient balance to place this bet."):
+        kernel.play_round()
+    assert [player.balance for player in players] == [1_000, 20]
+    players[1].balance = 25
+    kernel.play_round()
+
+
+def test_kernel_returns_net_winnings(chart):
+    players = [Player(balance=1_000)]
+    kernel = LeanRoundKernel(Game(players, GameRules(), rng=random.Random(2)), chart, [10])
+    total = sum(kernel.play_round() for _ in range(200))
+    assert players[0].balance == 1_000 + total
+
+
+def test_kernel_grows_hand_storage(chart):
+    players = [Player(balance=1_000)]
+    kernel = LeanRoundKernel(Game(players, GameRules(), rng=random.Random(2)), chart, [10], hand_capacity=1)
+    for _ in range(300):
+        kernel.play_round()
+    assert max(len(statuses) for statuses in kernel.statuses) >= 2
+
+
+def test_kernel_validates_bets(chart):
+    game = Game([Player(balance=1_000)], GameRules())
+    with pytest.raises(ValueError, match="Bet is not within the table limits."):
+        LeanRoundKernel(game, chart, [5])
+    with pytest.raises(ValueError, match="exactly one bet per player"):
+        LeanRoundKernel(game, chart, [10, 10])
+
+
+def test_kernel_without_applicable_deviations_matches_chart(chart):
+    rules = GameRules()
+    never = (IndexPlay('hard', 16, 10, 100, STAND),)
+    histories = []
+    for deviations in (None, DeviationCharts(chart, never)):
+        players = [Player(balance=10**6)]
+        game = Game(players, rules, deck=ArrayShoe(rules.num_decks, rng=random.Random(4)))
+        kernel = LeanRoundKernel(game, chart, [10], deviations=deviations)
+        histories.append([kernel.play_round() for _ in range(500)])
+    assert histories[0] == histories[1]
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from src.domain.Card import STANDARD_CARDS
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.application.start_round import StartRound
+from src.infrastructure.simulation.shoe_batch import generate_shoes, shoe_from_row
+
+
+def test_generate_shoes_shape_and_contents():
+    shoes = generate_shoes(5, num_decks=6, seed=1)
+    assert shoes.shape == (5, 312)
+    assert shoes.dtype == np.uint8
+    for row in shoes:
+        assert np.array_equal(np.bincount(row, minlength=52), np.full(52, 6))
+
+
+def test_generate_shoes_is_reproducible():
+    assert np.array_equal(generate_shoes(3, 2, seed=9), generate_shoes(3, 2, seed=9))
+    shoes = generate_shoes(2, 2, seed=9)
+    assert not np.array_equal(shoes[0], shoes[1])
+
+
+def test_generate_shoes_invalid_arguments():
+    with pytest.raises(ValueError, match="A shoe needs at least one deck."):
+        generate_shoes(1, 0)
+
+
+def test_shoe_from_row_deals_in_order():
+    row = generate_shoes(1, 1, seed=3)[0]
+    shoe = shoe_from_row(row)
+    assert shoe.num_decks == 1
+    assert [shoe.deal() for _ in range(3)] == [STANDARD_CARDS[code] for code in row[:3]]
+
+
+def test_shoe_from_row_feeds_start_round():
+    rules = GameRules(num_decks=2)
+    row = generate_shoes(1, rules.num_decks, seed=4)[0]
+    game = Game([Player(balance=100)], rules, deck=shoe_from_row(row))
+    StartRound().execute(game)
+    assert game.players[0].hands[0].cards == [STANDARD_CARDS[row[0]], STANDARD_CARDS[row[2]]]
+    assert game.dealer.hands[0].cards == [STANDARD_CARDS[row[1]], STANDARD_CARDS[row[3]]]
@@ -0,0 +1,40 @@
+import random
+import pytest
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.simulator import Simulator, SimulationResult
+from src.infrastructure.simulation.strategies import BasicStrategyPlayer, StandPlayer
+
+
+@pytest.fixture(scope="module")
+def basic_strategy(chart):
+    return BasicStrategyPlayer(chart)
+
+
+def test_run_plays_requested_rounds(basic_strategy):
+    simulator = Simulator(GameRules(), basic_strategy, rng=random.Random(1))
+    result = simulator.run(500)
+    assert result.rounds == 500
+    assert result.hands >= 500
+    assert result.bet == GameRules().min_bet
+    assert result.elapsed_seconds > 0
+    assert simulator.game.game_state.label == 'betting'
+
+
+def test_run_is_reproducible(basic_strategy):
+    first = Simulator(GameRules(), basic_strategy, rng=random.Random(7)).run(300)
+    second = Simulator(GameRules(), basic_strategy, rng=random.Random(7)).run(300)
+    assert (first.net, first.net_squared, first.hands) == (second.net, second.net_squared, second.hands)
+
+
+def test_standing_on_everything_loses():
+    result = Simulator(GameRules(), StandPlayer(), rng=random.Random(3)).run(3000)
+    assert result.house_edge > 0.05
+
+
+def test_result_statistics():
+    result = SimulationResult(rounds=4, hands=4, bet=10, net=-20, net_squared=400, elapsed_seconds=2.0)
+    assert result.house_edge == 0.5
+    assert result.std_dev == pytest.approx(1.0)
+    assert result.hands_per_second == 2.0
+    merged = result.merge(SimulationResult(rounds=1, hands=2, bet=10, net=10, net_squared=100, elapsed_seconds=1.0))
+    assert (merged.rounds, merged.hands, merged.net, merged.net_squared) == (5, 6, -10, 500)
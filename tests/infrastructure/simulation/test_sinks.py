@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+import random
+import pytest
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.parallel import run_parallel, stream_records
+from src.infrastructure.simulation.records import RoundRecord
+from src.infrastructure.simulation.simulator import Simulator, SimulationResult
+from src.infrastructure.simulation.sinks import ColumnarSink, CsvSink, JsonLinesSink, RecordSink, drain, tally
+from src.infrastructure.simulation.strategies import StandPlayer
+
+
+def make_record(index, payout=10):
+    return RoundRecord(
+        round=index, shoe_id=0, player_hands=(("AS", "KD"), ("8H", "2C", "9S")), dealer_hand=("7D", "QH"),
+        actions=("split", "hit", "stand"), bet=10, payout=payout, balance=1_000 + payout,
+    )
+
+
+class CountingSink(RecordSink):
+    def __init__(self, chunk_size):
+        super().__init__(chunk_size)
+        self.chunks = []
+
+    def _write_chunk(self, chunk):
+        self.chunks.append(len(chunk))
+
+
+def test_sink_flushes_in_fixed_size_chunks():
+    sink = CountingSink(chunk_size=4)
+    assert drain((make_record(index) for index in range(10)), sink) == 10
+    assert sink.chunks == [4, 4, 2]
+
+
+def test_sink_rejects_empty_chunks():
+    with pytest.raises(ValueError, match="chunk size must be positive"):
+        CountingSink(chunk_size=0)
+
+
+def test_sink_requires_write_chunk():
+    with pytest.raises(TypeError, match="_write_chunk"):
+        RecordSink()
+
+
+def test_csv_sink_writes_header_and_rows():
+    stream = io.StringIO()
+    with CsvSink(stream, chunk_size=2) as sink:
+        sink.write(make_record(0))
+        sink.write(make_record(1, payout=-10))
+        sink.write(make_record(2))
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert len(rows) == 3
+    assert rows[0]["player_hands"] == "AS KD|8H 2C 9S"
+    assert rows[1]["payout"] == "-10"
+    assert rows[2]["actions"] == "split hit stand"
+
+
+def test_json_lines_sink_writes_one_object_per_line():
+    stream = io.StringIO()
+    drain([make_record(0), make_record(1)], JsonLinesSink(stream))
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["round"] for line in lines] == [0, 1]
+    assert json.loads(lines[0])["player_hands"] == [["AS", "KD"], ["8H", "2C", "9S"]]
+
+
+def test_columnar_sink_builds_column_batches():
+    batches = []
+    drain((make_record(index, payout=index) for index in range(5)), ColumnarSink(batches.append, chunk_size=3))
+    assert [len(batch["round"]) for batch in batches] == [3, 2]
+    assert batches[1]["payout"].tolist() == [3, 4]
+    assert batches[0]["dealer_hand"][0] == ("7D", "QH")
+
+
+def test_simulator_records_match_run():
+    result = SimulationResult(bet=10)
+    records = list(tally(Simulator(GameRules(), StandPlayer(), rng=random.Random(4)).records(300), result))
+    expected = Simulator(GameRules(), StandPlayer(), rng=random.Random(4)).run(300)
+    assert (result.rounds, result.hands, result.net, result.net_squared) == (
+        expected.rounds, expected.hands, expected.net, expected.net_squared
+    )
+    assert [record.round for record in records] == list(range(300))
+    assert all(record.actions == ("stand",) * len(record.player_hands) for record in records)
+    assert records[-1].shoe_id >= 1
+    assert records[-1].balance == 10_000 + expected.net
+    assert any(record.balance != 10_000 + record.payout for record in records)
+
+
+def test_records_are_generated_lazily():
+    records = Simulator(GameRules(), StandPlayer(), rng=random.Random(4)).records()
+    first = next(records)
+    assert first.round == 0
+    assert len(first.dealer_hand) >= 2
+    assert next(records).round == 1
+
+
+def test_stream_records_matches_run_parallel(strategy_factory):
+    rules = GameRules()
+    result = SimulationResult(bet=rules.min_bet)
+    records = list(tally(stream_records(rules, rounds=500, master_seed=3, strategy_factory=strategy_factory, block_rounds=200), result))
+    expected = run_parallel(rules, rounds=500, master_seed=3, strategy_factory=strategy_factory, block_rounds=200)
+    assert (result.rounds, result.net, result.net_squared) == (expected.rounds, expected.net, expected.net_squared)
+    assert [record.round for record in records] == list(range(500))
+    shoe_ids = [record.shoe_id for record in records]
+    assert shoe_ids == sorted(shoe_ids)
+    assert records[-1].balance == rules.min_bet * 1_000 + expected.net
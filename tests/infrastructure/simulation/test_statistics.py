@@ -0,0 +1,87 @@
+import random
+import pytest
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.parallel import run_until_precision
+from src.infrastructure.simulation.simulator import Simulator
+from src.infrastructure.simulation.statistics import RoundStatistics, RunningStats
+from src.infrastructure.simulation.strategies import StandPlayer
+
+
+def stats_of(values):
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    return stats
+
+
+def test_running_stats_match_direct_formulas():
+    values = [1.0, -1.0, 1.5, 0.0, -1.0, 2.0, -2.0]
+    stats = stats_of(values)
+    mean = sum(values) / len(values)
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(mean)
+    assert stats.variance == pytest.approx(sum((value - mean) ** 2 for value in values) / (len(values) - 1))
+
+
+def test_merged_stats_match_a_single_stream():
+    values = [random.Random(3).uniform(-2, 2) for _ in range(100)]
+    merged = stats_of(values[:37]).merge(stats_of(values[37:]))
+    single = stats_of(values)
+    assert merged.count == single.count
+    assert merged.mean == pytest.approx(single.mean)
+    assert merged.m2 == pytest.approx(single.m2)
+    assert RunningStats().merge(RunningStats()) == RunningStats()
+
+
+def test_confidence_interval_narrows_with_more_data():
+    small = stats_of([1.0, -1.0] * 50)
+    large = stats_of([1.0, -1.0] * 5000)
+    low, high = large.confidence_interval(0.95)
+    assert low < 0 < high
+    assert large.half_width() == pytest.approx(1.96 * large.standard_error, rel=1e-3)
+    assert large.half_width() < small.half_width()
+
+
+def test_round_statistics_rates_and_groups():
+    statistics = RoundStatistics()
+    statistics.add_round(1.5, upcard=10, player_total=21, outcomes=['win'], blackjack=True)
+    statistics.add_round(-2.0, upcard=6, player_total=16, outcomes=['lose', 'busted'], blackjack=False)
+    statistics.add_round(0.0, upcard=10, player_total=18, outcomes=['push'], blackjack=False)
+    assert statistics.hands == 4
+    assert (statistics.win_rate, statistics.push_rate, statistics.loss_rate) == (0.25, 0.25, 0.5)
+    assert statistics.blackjack_frequency == pytest.approx(1 / 3)
+    assert statistics.by_upcard[10].count == 2
+    assert statistics.by_player_total[16].mean == -2.0
+    assert statistics.house_edge == pytest.approx(1 / 6)
+
+    merged = statistics.merge(statistics)
+    assert merged.rounds.count == 6
+    assert merged.blackjacks == 2
+    assert list(merged.by_upcard) == [6, 10]
+
+
+def test_simulator_statistics_match_run():
+    statistics = Simulator(GameRules(), StandPlayer(), rng=random.Random(5)).run_statistics(400)
+    result = Simulator(GameRules(), StandPlayer(), rng=random.Random(5)).run(400)
+    assert statistics.rounds.count == 400
+    assert statistics.hands == result.hands
+    assert statistics.house_edge == pytest.approx(result.house_edge)
+    assert sum(stats.count for stats in statistics.by_upcard.values()) == 400
+
+
+def test_simulator_stops_at_target_precision():
+    statistics = Simulator(GameRules(), StandPlayer(), rng=random.Random(5)).run_statistics(
+        100_000, target_precision=0.1, check_every=100
+    )
+    assert statistics.rounds.count < 100_000
+    assert statistics.rounds.count % 100 == 0
+    assert statistics.precision() <= 0.1
+
+
+def test_run_until_precision_does_not_depend_on_worker_count(strategy_factory):
+    rules = GameRules()
+    serial = run_until_precision(rules, 0.12, master_seed=4, max_rounds=5000, strategy_factory=strategy_factory, block_rounds=200)
+    parallel = run_until_precision(rules, 0.12, master_seed=4, max_rounds=5000, workers=3, strategy_factory=strategy_factory, block_rounds=200)
+    assert serial == parallel
+    assert serial.rounds.count < 5000
+    assert serial.precision() <= 0.12
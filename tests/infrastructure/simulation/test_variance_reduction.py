@@ -0,0 +1,112 @@
+import math
+import numpy as np
+import pytest
+from src.domain.GameRules import GameRules
+from src.infrastructure.simulation.paired import PairedSimulator, Variant
+from src.infrastructure.simulation.variance_reduction import (
+    AntitheticSimulator,
+    Estimate,
+    MAX_TILT,
+    ImportanceSampler,
+    control_variate_estimate,
+)
+from src.infrastructure.simulation.vectorized import VectorizedSimulator
+
+
+@pytest.fixture(scope="module")
+def sampler(chart):
+    return ImportanceSampler(
+        GameRules(), chart, bet=10, starting_bankroll=150, session_rounds=60, outcome_rounds=200_000, lanes=10_000, seed=3
+    )
+
+
+def test_estimate_reports_effective_sample_size():
+    estimate = Estimate(mean=0.5, standard_error=0.1, samples=1000, efficiency_gain=4.0)
+    assert estimate.effective_sample_size == 4000
+    low, high = estimate.confidence_interval(0.95)
+    assert low == pytest.approx(0.5 - 0.196, abs=1e-3)
+    assert high == pytest.approx(0.5 + 0.196, abs=1e-3)
+
+
+def test_antithetic_original_rounds_match_standalone_simulator(chart):
+    antithetic = AntitheticSimulator(GameRules(), chart, lanes=64, seed=6)
+    standalone = VectorizedSimulator(GameRules(), chart, lanes=64, seed=6)
+    for _ in range(150):
+        original, _ = antithetic.play_round()
+        assert (original == standalone.play_round()).all()
+
+
+def test_antithetic_mirror_seed_derives_from_the_master_seed(chart):
+    draws = [AntitheticSimulator(GameRules(), chart, lanes=4, seed=seed).mirrored.rng.random() for seed in (6, 6, 7)]
+    assert draws[0] == draws[1] != draws[2]
+
+
+def test_antithetic_pairs_reduce_variance(chart):
+    estimate = AntitheticSimulator(GameRules(), chart, lanes=2000, seed=1).estimate(40_000)
+    assert estimate.samples == 40_000
+    assert estimate.efficiency_gain > 1.4
+    assert abs(estimate.mean) < 4 * estimate.standard_error + 0.01
+
+
+def test_control_variate_of_identical_variants_is_exact(chart):
+    variants = [Variant('a', GameRules(), chart), Variant('b', GameRules(), chart)]
+    comparison = PairedSimulator(variants, lanes=500, seed=2).run(1000)
+    estimate = control_variate_estimate(comparison, 1, control_mean=-0.005)
+    assert estimate.mean == pytest.approx(-0.005)
+    assert estimate.efficiency_gain == math.inf
+
+
+def test_control_variate_tightens_payout_variant(chart):
+    variants = [Variant('3:2', GameRules(), chart), Variant('6:5', GameRules(blackjack_payout=1.2), chart)]
+    comparison = PairedSimulator(variants, lanes=2000, seed=9).run(20_000)
+    estimate = control_variate_estimate(comparison, 1, control_mean=comparison.results[0].mean)
+    assert estimate.mean == pytest.approx(comparison.results[1].mean)
+    assert estimate.efficiency_gain > 50
+    assert estimate.standard_error < comparison.results[1].standard_error / 5
+
+
+def test_untilted_sampling_is_plain_monte_carlo(sampler):
+    estimate = sampler.estimate_ruin(20_000, tilt=0.0)
+    assert 0.0 < estimate.mean < 0.5
+    assert estimate.efficiency_gain == pytest.approx(1.0, rel=1e-3)
+
+
+def test_tilted_ruin_agrees_with_plain_monte_carlo(sampler):
+    plain = sampler.estimate_ruin(40_000, tilt=0.0)
+    tilted = sampler.estimate_ruin(20_000)
+    assert abs(tilted.mean - plain.mean) < 4 * math.hypot(plain.standard_error, tilted.standard_error)
+    assert tilted.efficiency_gain > 3
+
+
+def test_tilted_drawdown_agrees_with_plain_monte_carlo(sampler):
+    plain = sampler.estimate_drawdown(40_000, 100, tilt=0.0)
+    tilted = sampler.estimate_drawdown(20_000, 100)
+    assert abs(tilted.mean - plain.mean) < 4 * math.hypot(plain.standard_error, tilted.standard_error)
+    assert tilted.efficiency_gain > 1
+
+
+def test_importance_sampler_weights_stay_finite_at_the_maximum_tilt(chart):
+    sampler = ImportanceSampler(GameRules(), chart, bet=10, starting_bankroll=100, session_rounds=20,
+                                outcome_rounds=2_000, lanes=200, seed=5)
+    # Outcomes of up to about 80 bets put exp(MAX_TILT * x / bet) far beyond the float range.
+    sampler.outcomes = sampler.outcomes * 10
+    with np.errstate(over='raise', invalid='raise', divide='raise'):
+        for tilt in (MAX_TILT, -MAX_TILT):
+            tilted = sampler.tilted_probabilities(tilt)
+            assert np.isfinite(tilted).all()
+            assert tilted.sum() == pytest.approx(1.0)
+        assert tilted[-1] == pytest.approx(1.0)
+        estimate = sampler.estimate_ruin(400, tilt=MAX_TILT)
+    assert 0.0 <= estimate.mean <= 1.0
+    assert math.isfinite(estimate.standard_error)
+
+
+def test_importance_sampler_validates_arguments(chart, sampler):
+    with pytest.raises(ValueError, match="starting bankroll must be positive"):
+        ImportanceSampler(GameRules(), chart, 10, 0, 10)
+    with pytest.raises(ValueError, match="at least one round"):
+        ImportanceSampler(GameRules(), chart, 10, 100, 0)
+    with pytest.raises(ValueError, match="at least one session"):
+        sampler.estimate_ruin(0)
+    with pytest.raises(ValueError, match="depth must be positive"):
+        sampler.estimate_drawdown(10, 0)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.infrastructure.simulation.round_kernel import LeanRoundKernel
+from src.infrastructure.simulation.shoe_batch import shoe_from_row
+from src.infrastructure.simulation.vectorized import VectorizedSimulator
+
+
+@pytest.mark.parametrize("rules", [
+    GameRules(),
+    GameRules(dealer_hits_on_soft_17=False, num_decks=1, blackjack_payout=1.2, reshuffle_penetration=0.5),
+])
+def test_lanes_match_lean_kernel(chart, rules):
+    simulator = VectorizedSimulator(rules, chart, lanes=64, seed=3)
+    shoes = simulator.shoes.copy()
+    # Stay within the first shoe of every lane, where both sides deal the same cards.
+    rounds = 4 if rules.num_decks == 1 else 30
+    lane_nets = [simulator.play_round() for _ in range(rounds)]
+
+    for lane, row in enumerate(shoes):
+        player = Player(balance=10**9)
+        kernel = LeanRoundKernel(Game([player], rules, deck=shoe_from_row(row)), chart, [rules.min_bet])
+        assert [kernel.play_round() for _ in range(rounds)] == [int(nets[lane]) for nets in lane_nets]
+
+
+def test_reshuffles_lanes_at_penetration(chart):
+    rules = GameRules(num_decks=1, reshuffle_penetration=0.5)
+    simulator = VectorizedSimulator(rules, chart, lanes=16, seed=1)
+    first_shoes = simulator.shoes.copy()
+    for _ in range(10):
+        simulator.play_round()
+    assert (simulator.positions < 52).all()
+    assert (simulator.shoes != first_shoes).any(axis=1).all()
+
+
+def test_run_aggregates_whole_batches(chart):
+    result = VectorizedSimulator(GameRules(), chart, lanes=1000, seed=7).run(2500)
+    assert result.rounds == 3000
+    assert result.hands >= result.rounds
+    assert result.bet == GameRules().min_bet
+    assert abs(result.house_edge) < 0.1
+
+
+def test_runs_are_reproducible(chart):
+    first = VectorizedSimulator(GameRules(), chart, lanes=500, seed=11).run(2000)
+    second = VectorizedSimulator(GameRules(), chart, lanes=500, seed=11).run(2000)
+    assert (first.net, first.net_squared, first.hands) == (second.net, second.net_squared, second.hands)
+
+
+def test_lanes_with_balances_match_lean_kernel(chart):
+    rules = GameRules()
+    simulator = VectorizedSimulator(rules, chart, lanes=64, seed=8)
+    shoes = simulator.shoes.copy()
+    rounds = 30
+    # Short stacks can afford some doubles and splits but not others.
+    balances = np.arange(64) % 4 * 10 + 20
+    bets = np.where(np.arange(64) % 2, 10, 20)
+    lane_nets = [simulator.play_round(bets, balances) for _ in range(rounds)]
+
+    for lane, row in enumerate(shoes):
+        player = Player(balance=0)
+        kernel = LeanRoundKernel(Game([player], rules, deck=shoe_from_row(row)), chart, [int(bets[lane])])
+        nets = []
+        for _ in range(rounds):
+            player.balance = int(balances[lane])
+            nets.append(kernel.play_round())
+        assert nets == [int(round_nets[lane]) for round_nets in lane_nets]
@@ -0,0 +1,51 @@
+import pytest
+import random
+from collections import Counter
+from src.domain.ArrayShoe import ArrayShoe
+from src.domain.Card import STANDARD_CARDS
+from src.domain.Game import Game
+from src.domain.GameRules import GameRules
+from src.domain.Player import Player
+from src.application.reset_round import ResetRound
+from src.application.start_round import StartRound
+from src.infrastructure.shoe_factory import BackgroundShoeFactory
+
+
+def test_prepares_full_shuffled_shoes():
+    with BackgroundShoeFactory(num_decks=2, rng=random.Random(1)) as factory:
+        first, second = factory.take(), factory.take()
+    full_shoe = Counter(range(len(STANDARD_CARDS))) + Counter(range(len(STANDARD_CARDS)))
+    assert Counter(first) == full_shoe
+    assert Counter(second) == full_shoe
+    assert first != second
+
+
+def test_seeded_factories_prepare_the_same_shoes():
+    with BackgroundShoeFactory(rng=random.Random(9)) as one, BackgroundShoeFactory(rng=random.Random(9)) as other:
+        assert [one.take() for _ in range(3)] == [other.take() for _ in range(3)]
+
+
+def test_start_round_swaps_in_the_prepared_shoe():
+    rules = GameRules(num_decks=1)
+    game = Game([Player(balance=100)], rules, deck=ArrayShoe(1, rng=random.Random(2)))
+    with BackgroundShoeFactory(rng=random.Random(4)) as reference:
+        prepared = reference.take()
+    with BackgroundShoeFactory(rng=random.Random(4)) as factory:
+        start_round = StartRound(shoe_factory=factory)
+        start_round.execute(game)
+        ResetRound().execute(game)
+        for _ in range(41):
+            game.deck.deal()
+        start_round.execute(game)
+    assert game.deck.order == prepared
+    assert game.deck.cards_remaining == 48
+    assert game.deck.cards_in_play == 4
+
+
+def test_closed_factory_refuses_to_deal():
+    factory = BackgroundShoeFactory()
+    factory.take()
+    factory.close()
+    factory.close()
+    with pytest.raises(ValueError, match="has been closed"):
+        factory.take()
@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock
+from src.domain.GameRules import GameRules
+from src.domain.GameState import Action
+from src.application.compile_basic_strategy import CompileBasicStrategy
+from src.infrastructure import strategy_store
+from src.infrastructure.strategy_store import StrategyStore
+
+
+def test_compiles_once_and_loads_from_disk(tmp_path):
+    rules = GameRules()
+    compiler = MagicMock(wraps=CompileBasicStrategy())
+    store = StrategyStore(tmp_path, compiler=compiler)
+    strategy = store.load_or_compile(rules)
+    assert store.path_for(rules).exists()
+    assert compiler.execute.call_count == 1
+
+    reloaded = StrategyStore(tmp_path, compiler=compiler).load_or_compile(rules)
+    assert compiler.execute.call_count == 1
+    assert bytes(reloaded.table) == bytes(strategy.table)
+    assert reloaded.decide(11, False, 6) is Action.DOUBLE_DOWN
+
+
+def test_rules_key_ignores_betting_limits(tmp_path):
+    store = StrategyStore(tmp_path)
+    assert store.rules_key(GameRules(min_bet=5)) == store.rules_key(GameRules(min_bet=25))
+    assert store.rules_key(GameRules(num_decks=1)) != store.rules_key(GameRules(num_decks=8))
+
+
+def test_new_compiler_version_recompiles(tmp_path, monkeypatch):
+    rules = GameRules()
+    compiler = MagicMock(wraps=CompileBasicStrategy())
+    store = StrategyStore(tmp_path, compiler=compiler)
+    old_path = store.path_for(rules)
+    store.load_or_compile(rules)
+
+    monkeypatch.setattr(strategy_store, "COMPILER_VERSION", strategy_store.COMPILER_VERSION + 1)
+    assert store.path_for(rules) != old_path
+    StrategyStore(tmp_path, compiler=compiler).load_or_compile(rules)
+    assert compiler.execute.call_count == 2
+
+
+def test_recompiles_corrupt_file(tmp_path):
+    rules = GameRules()
+    store = StrategyStore(tmp_path)
+    store.path_for(rules).write_bytes(b"garbage")
+    assert store.load_or_compile(rules).decide(20, False, 10) is Action.STAND
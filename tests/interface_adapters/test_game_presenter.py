@@ -20,6 +20,8 @@ def test_present_game_state():
 
     game = Game(players=[player], rules=GameRules())
     game.dealer = dealer
+    game.game_state = 'playerTurn'
+    game.game_state = 'dealerTurn'
     game.game_state = 'roundOver'
 
     presenter = GamePresenter()
@@ -37,6 +39,8 @@ def test_present_game_state():
     assert len(view_model.dealer_cards) == 2
     assert view_model.dealer_value == 17
     assert view_model.game_state == 'roundOver'
+    assert type(view_model.game_state) is str
+    assert type(view_model.players[0].status) is str
 
 def test_present_hides_dealer_card():
     player = Player(balance=100)
@@ -54,3 +58,27 @@ def test_present_hides_dealer_card():
     assert len(view_model.dealer_cards) == 2
     assert view_model.dealer_cards[1]['rank'] == '?'
     assert view_model.dealer_value == 7
+
+@pytest.mark.parametrize("statuses, outcome, message", [
+    (['win'], 'win', "You win! Your new balance is $120"),
+    (['lose', 'win'], 'win', "You win! Your new balance is $120"),
+    (['push'], 'push', "It's a push. Your balance is $120"),
+    (['lose'], 'stand', "You lose. Your new balance is $120"),
+    (['busted'], 'busted', "You lose. Your new balance is $120"),
+])
+def test_present_round_outcome(statuses, outcome, message):
+    player = Player(balance=120)
+    for _ in statuses[1:]:
+        player.add_hand(player.new_hand(), 10)
+    for hand, status in zip(player.hands, statuses):
+        hand.status = status
+
+    game = Game(players=[player], rules=GameRules())
+    game.game_state = 'playerTurn'
+    game.game_state = 'dealerTurn'
+    game.game_state = 'roundOver'
+    view_model = GamePresenter().present(game)
+
+    assert view_model.outcome == outcome
+    assert type(view_model.outcome) is str
+    assert view_model.outcome_message == message